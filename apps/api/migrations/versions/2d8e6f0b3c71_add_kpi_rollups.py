@@ -0,0 +1,53 @@
+"""add kpi rollups
+
+Revision ID: 2d8e6f0b3c71
+Revises: 9f3c2a7e5b14
+Create Date: 2026-10-17 14:05:31.902447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8e6f0b3c71'
+down_revision: Union[str, Sequence[str], None] = '9f3c2a7e5b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('kpi_rollups',
+    sa.Column('metric', sa.String(length=50), nullable=False),
+    sa.Column('key', sa.String(length=120), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('metric', 'key')
+    )
+    # Populate from existing rows; afterwards the services keep it current.
+    op.execute(
+        """
+        INSERT INTO kpi_rollups (metric, key, value)
+        SELECT 'jobs_by_status', status, count(*) FROM jobs GROUP BY status
+        UNION ALL
+        SELECT 'jobs_by_technician_status',
+               coalesce(technician_id::text, 'unassigned') || '|' || status, count(*)
+        FROM jobs GROUP BY technician_id, status
+        UNION ALL
+        SELECT 'jobs_by_day_status',
+               coalesce(to_char(scheduled_start_at AT TIME ZONE 'UTC', 'YYYY-MM-DD'), 'unscheduled') || '|' || status,
+               count(*)
+        FROM jobs GROUP BY 2
+        UNION ALL
+        SELECT 'technicians_by_active',
+               CASE WHEN is_active IS FALSE THEN 'inactive' ELSE 'active' END, count(*)
+        FROM technicians GROUP BY 2
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('kpi_rollups')
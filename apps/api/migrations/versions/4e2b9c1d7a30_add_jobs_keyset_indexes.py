@@ -0,0 +1,36 @@
+"""add jobs keyset indexes
+
+Revision ID: 4e2b9c1d7a30
+Revises: 7c5f09476ad0
+Create Date: 2026-10-17 09:12:44.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e2b9c1d7a30'
+down_revision: Union[str, Sequence[str], None] = '7c5f09476ad0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_scheduled_start_at_id', 'jobs', ['scheduled_start_at', 'id'], unique=False)
+    op.create_index('ix_jobs_updated_at_id', 'jobs', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_jobs_status_scheduled_start_at_id', 'jobs', ['status', 'scheduled_start_at', 'id'], unique=False)
+    op.create_index('ix_jobs_technician_id_scheduled_start_at_id', 'jobs', ['technician_id', 'scheduled_start_at', 'id'], unique=False)
+    op.create_index('ix_jobs_customer_id_scheduled_start_at_id', 'jobs', ['customer_id', 'scheduled_start_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_customer_id_scheduled_start_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_technician_id_scheduled_start_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_status_scheduled_start_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_updated_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_scheduled_start_at_id', table_name='jobs')
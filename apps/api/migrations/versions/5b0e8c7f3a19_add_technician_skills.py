@@ -0,0 +1,48 @@
+"""add technician skills
+
+Revision ID: 5b0e8c7f3a19
+Revises: e19b6d3a5c08
+Create Date: 2026-10-17 21:03:48.771205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e8c7f3a19'
+down_revision: Union[str, Sequence[str], None] = 'e19b6d3a5c08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('technician_skills',
+    sa.Column('skill', sa.String(length=50), nullable=False),
+    sa.Column('technician_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.ForeignKeyConstraint(['technician_id'], ['technicians.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('skill', 'technician_id')
+    )
+    op.create_index(op.f('ix_technician_skills_technician_id'), 'technician_skills', ['technician_id'], unique=False)
+    # Backfill from the JSONB column; the service keeps both in sync from here on.
+    op.execute(
+        """
+        INSERT INTO technician_skills (skill, technician_id)
+        SELECT DISTINCT left(lower(btrim(s.value)), 50), t.id
+        FROM technicians t
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(t.skills) = 'array' THEN t.skills ELSE '[]'::jsonb END
+        ) AS s(value)
+        WHERE t.skills IS NOT NULL AND btrim(s.value) <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_technician_skills_technician_id'), table_name='technician_skills')
+    op.drop_table('technician_skills')
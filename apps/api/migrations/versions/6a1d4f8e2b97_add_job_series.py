@@ -0,0 +1,58 @@
+"""add job series
+
+Revision ID: 6a1d4f8e2b97
+Revises: 2d8e6f0b3c71
+Create Date: 2026-10-17 16:42:08.311905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a1d4f8e2b97'
+down_revision: Union[str, Sequence[str], None] = '2d8e6f0b3c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_series',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('technician_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('rule', sa.String(length=255), nullable=False),
+    sa.Column('dtstart', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_minutes', sa.Integer(), nullable=False),
+    sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ),
+    sa.ForeignKeyConstraint(['technician_id'], ['technicians.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_series_id'), 'job_series', ['id'], unique=False)
+    op.create_index('ix_job_series_dtstart_ends_at', 'job_series', ['dtstart', 'ends_at'], unique=False)
+
+    op.add_column('jobs', sa.Column('series_id', sa.Integer(), nullable=True))
+    op.add_column('jobs', sa.Column('occurrence_start', sa.DateTime(timezone=True), nullable=True))
+    op.create_foreign_key('fk_jobs_series_id_job_series', 'jobs', 'job_series', ['series_id'], ['id'])
+    # Also serves the per-series window lookups on (series_id, occurrence_start).
+    op.create_unique_constraint('uq_jobs_series_occurrence', 'jobs', ['series_id', 'occurrence_start'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_jobs_series_occurrence', 'jobs', type_='unique')
+    op.drop_constraint('fk_jobs_series_id_job_series', 'jobs', type_='foreignkey')
+    op.drop_column('jobs', 'occurrence_start')
+    op.drop_column('jobs', 'series_id')
+    op.drop_index('ix_job_series_dtstart_ends_at', table_name='job_series')
+    op.drop_index(op.f('ix_job_series_id'), table_name='job_series')
+    op.drop_table('job_series')
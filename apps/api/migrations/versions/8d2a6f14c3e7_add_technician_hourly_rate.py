@@ -0,0 +1,30 @@
+"""add technician hourly rate
+
+Revision ID: 8d2a6f14c3e7
+Revises: 5b0e8c7f3a19
+Create Date: 2026-10-17 21:14:09.532107
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2a6f14c3e7'
+down_revision: Union[str, Sequence[str], None] = '5b0e8c7f3a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('technicians', sa.Column('hourly_rate', sa.Numeric(10, 2), nullable=True))
+    op.create_index('ix_technicians_hourly_rate', 'technicians', ['hourly_rate'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_technicians_hourly_rate', table_name='technicians')
+    op.drop_column('technicians', 'hourly_rate')
@@ -0,0 +1,91 @@
+"""add technician overlap exclusion constraint
+
+Postgres cannot add an exclusion constraint NOT VALID, so existing rows are
+checked up front. Jobs whose end is before their start would make tstzrange
+raise, and bookings that already overlap cannot be repaired automatically
+(which one to move is a dispatch decision), so in either case the upgrade
+stops and lists the offending jobs; fix their times, or reassign or cancel
+them, and rerun.
+
+Revision ID: 9f3c2a7e5b14
+Revises: 4e2b9c1d7a30
+Create Date: 2026-10-17 11:40:02.573118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3c2a7e5b14'
+down_revision: Union[str, Sequence[str], None] = '4e2b9c1d7a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INVERTED_BOOKINGS = """
+    SELECT id, scheduled_start_at, scheduled_end_at
+    FROM jobs
+    WHERE scheduled_end_at < scheduled_start_at
+    ORDER BY id
+    LIMIT 50
+"""
+
+OVERLAPPING_BOOKINGS = """
+    SELECT a.id, b.id, a.technician_id
+    FROM jobs a
+    JOIN jobs b
+      ON b.technician_id = a.technician_id
+     AND b.id > a.id
+     AND b.scheduled_start_at < a.scheduled_end_at
+     AND a.scheduled_start_at < b.scheduled_end_at
+    WHERE a.technician_id IS NOT NULL
+      AND a.scheduled_start_at IS NOT NULL AND a.scheduled_end_at IS NOT NULL
+      AND b.scheduled_start_at IS NOT NULL AND b.scheduled_end_at IS NOT NULL
+      AND a.status <> 'CANCELLED' AND b.status <> 'CANCELLED'
+    ORDER BY a.id, b.id
+    LIMIT 50
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inverted = op.get_bind().execute(sa.text(INVERTED_BOOKINGS)).all()
+    if inverted:
+        listed = "; ".join(f"job {j} ({start} to {end})" for j, start, end in inverted)
+        raise RuntimeError(
+            "Cannot add ex_jobs_technician_no_overlap: some jobs end before they start. "
+            f"Correct their scheduled times and rerun: {listed}"
+        )
+    clashes = op.get_bind().execute(sa.text(OVERLAPPING_BOOKINGS)).all()
+    if clashes:
+        listed = "; ".join(f"jobs {a} and {b} (technician {t})" for a, b, t in clashes)
+        raise RuntimeError(
+            "Cannot add ex_jobs_technician_no_overlap: existing bookings overlap. "
+            f"Reassign or cancel one job of each pair and rerun: {listed}"
+        )
+    # btree_gist lets the GiST index combine uuid equality with range overlap.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        ALTER TABLE jobs
+        ADD CONSTRAINT ex_jobs_technician_no_overlap
+        EXCLUDE USING gist (
+            technician_id WITH =,
+            tstzrange(scheduled_start_at, scheduled_end_at, '[)') WITH &&
+        )
+        WHERE (
+            technician_id IS NOT NULL
+            AND scheduled_start_at IS NOT NULL
+            AND scheduled_end_at IS NOT NULL
+            AND status <> 'CANCELLED'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ex_jobs_technician_no_overlap', 'jobs', type_='exclude')
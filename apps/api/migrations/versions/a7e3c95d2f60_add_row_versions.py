@@ -0,0 +1,35 @@
+"""add row versions
+
+Revision ID: a7e3c95d2f60
+Revises: 8d2a6f14c3e7
+Create Date: 2026-10-17 21:40:52.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e3c95d2f60'
+down_revision: Union[str, Sequence[str], None] = '8d2a6f14c3e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('technicians', 'customers', 'jobs'):
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column(
+        'customers',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('customers', 'updated_at')
+    for table in ('jobs', 'customers', 'technicians'):
+        op.drop_column(table, 'version')
@@ -0,0 +1,30 @@
+"""add customer coordinates
+
+Revision ID: b83e5c0a9d42
+Revises: 6a1d4f8e2b97
+Create Date: 2026-10-17 18:11:54.620173
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83e5c0a9d42'
+down_revision: Union[str, Sequence[str], None] = '6a1d4f8e2b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('customers', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('customers', sa.Column('longitude', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('customers', 'longitude')
+    op.drop_column('customers', 'latitude')
@@ -0,0 +1,30 @@
+"""add technician location
+
+Revision ID: c4f7a2d91e06
+Revises: b83e5c0a9d42
+Create Date: 2026-10-17 19:02:37.148820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2d91e06'
+down_revision: Union[str, Sequence[str], None] = 'b83e5c0a9d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('technicians', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('technicians', sa.Column('longitude', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('technicians', 'longitude')
+    op.drop_column('technicians', 'latitude')
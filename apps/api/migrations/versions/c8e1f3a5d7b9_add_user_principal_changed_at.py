@@ -0,0 +1,28 @@
+"""add user principal_changed_at
+
+Revision ID: c8e1f3a5d7b9
+Revises: f2c8d46b1a73
+Create Date: 2026-10-17 23:05:41.602917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e1f3a5d7b9'
+down_revision: Union[str, Sequence[str], None] = 'f2c8d46b1a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('principal_changed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'principal_changed_at')
@@ -0,0 +1,41 @@
+"""add technician keyset indexes
+
+Revision ID: d5b1e7a04c92
+Revises: a7e3c95d2f60
+Create Date: 2026-10-17 22:05:31.640217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b1e7a04c92'
+down_revision: Union[str, Sequence[str], None] = 'a7e3c95d2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_technicians_first_name_last_name_id', 'technicians', ['first_name', 'last_name', 'id'], unique=False)
+    op.create_index('ix_technicians_last_name_first_name_id', 'technicians', ['last_name', 'first_name', 'id'], unique=False)
+    op.create_index('ix_technicians_email_id', 'technicians', ['email', 'id'], unique=False)
+    op.create_index('ix_technicians_created_at_id', 'technicians', ['created_at', 'id'], unique=False)
+    op.create_index('ix_technicians_updated_at_id', 'technicians', ['updated_at', 'id'], unique=False)
+    # Also serves min_rate / max_rate, replacing the single-column index.
+    op.create_index('ix_technicians_hourly_rate_id', 'technicians', ['hourly_rate', 'id'], unique=False)
+    op.drop_index('ix_technicians_hourly_rate', table_name='technicians')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_technicians_hourly_rate', 'technicians', ['hourly_rate'], unique=False)
+    op.drop_index('ix_technicians_hourly_rate_id', table_name='technicians')
+    op.drop_index('ix_technicians_updated_at_id', table_name='technicians')
+    op.drop_index('ix_technicians_created_at_id', table_name='technicians')
+    op.drop_index('ix_technicians_email_id', table_name='technicians')
+    op.drop_index('ix_technicians_last_name_first_name_id', table_name='technicians')
+    op.drop_index('ix_technicians_first_name_last_name_id', table_name='technicians')
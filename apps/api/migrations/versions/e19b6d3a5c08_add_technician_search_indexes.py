@@ -0,0 +1,83 @@
+"""add technician search indexes
+
+Revision ID: e19b6d3a5c08
+Revises: c4f7a2d91e06
+Create Date: 2026-10-17 20:26:13.502961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e19b6d3a5c08'
+down_revision: Union[str, Sequence[str], None] = 'c4f7a2d91e06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same statements as TECHNICIAN_FTS_DDL in models/technician.py.
+SQLITE_FTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS technicians_fts USING fts5(
+        first_name, last_name, email, phone,
+        content='technicians', content_rowid='rowid',
+        prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_ai AFTER INSERT ON technicians BEGIN
+        INSERT INTO technicians_fts(rowid, first_name, last_name, email, phone)
+        VALUES (new.rowid, new.first_name, new.last_name, new.email, new.phone);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_ad AFTER DELETE ON technicians BEGIN
+        INSERT INTO technicians_fts(technicians_fts, rowid, first_name, last_name, email, phone)
+        VALUES ('delete', old.rowid, old.first_name, old.last_name, old.email, old.phone);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_au
+    AFTER UPDATE OF first_name, last_name, email, phone ON technicians BEGIN
+        INSERT INTO technicians_fts(technicians_fts, rowid, first_name, last_name, email, phone)
+        VALUES ('delete', old.rowid, old.first_name, old.last_name, old.email, old.phone);
+        INSERT INTO technicians_fts(rowid, first_name, last_name, email, phone)
+        VALUES (new.rowid, new.first_name, new.last_name, new.email, new.phone);
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for stmt in SQLITE_FTS:
+            op.execute(stmt)
+        # Index the rows that already exist.
+        op.execute("INSERT INTO technicians_fts(technicians_fts) VALUES ('rebuild')")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Building the index backfills it. The expression must match
+    # TRGM_DOCUMENT in services/search_service.py.
+    op.execute(
+        """
+        CREATE INDEX ix_technicians_search_trgm ON technicians USING gin (
+            (lower(first_name || ' ' || last_name || ' ' || email || ' ' || coalesce(phone, '')))
+            gin_trgm_ops
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for name in ("technicians_fts_ai", "technicians_fts_ad", "technicians_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS technicians_fts")
+        return
+    op.drop_index('ix_technicians_search_trgm', table_name='technicians')
@@ -0,0 +1,85 @@
+"""add customer search indexes
+
+Revision ID: f2c8d46b1a73
+Revises: d5b1e7a04c92
+Create Date: 2026-10-17 22:31:48.907215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8d46b1a73'
+down_revision: Union[str, Sequence[str], None] = 'd5b1e7a04c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same statements as CUSTOMER_FTS_DDL in models/customer.py.
+SQLITE_FTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS customers_fts USING fts5(
+        name, email, phone, address,
+        content='customers', content_rowid='id',
+        prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_ai AFTER INSERT ON customers BEGIN
+        INSERT INTO customers_fts(rowid, name, email, phone, address)
+        VALUES (new.id, new.name, new.email, new.phone, new.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_ad AFTER DELETE ON customers BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email, phone, address)
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_au
+    AFTER UPDATE OF name, email, phone, address ON customers BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email, phone, address)
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.address);
+        INSERT INTO customers_fts(rowid, name, email, phone, address)
+        VALUES (new.id, new.name, new.email, new.phone, new.address);
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_customers_name_id', 'customers', ['name', 'id'], unique=False)
+
+    if op.get_bind().dialect.name == "sqlite":
+        for stmt in SQLITE_FTS:
+            op.execute(stmt)
+        # Index the rows that already exist.
+        op.execute("INSERT INTO customers_fts(customers_fts) VALUES ('rebuild')")
+        return
+
+    # pg_trgm was enabled by e19b6d3a5c08. The expression must match
+    # CUSTOMER_TRGM_DOCUMENT in services/search_service.py.
+    op.execute(
+        """
+        CREATE INDEX ix_customers_search_trgm ON customers USING gin (
+            (lower(name || ' ' || coalesce(email, '') || ' ' || coalesce(phone, '') || ' ' || coalesce(address, '')))
+            gin_trgm_ops
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for name in ("customers_fts_ai", "customers_fts_ad", "customers_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS customers_fts")
+    else:
+        op.drop_index('ix_customers_search_trgm', table_name='customers')
+    op.drop_index('ix_customers_name_id', table_name='customers')
@@ -0,0 +1,23 @@
+import sys
+from sqlalchemy.orm import Session
+from .db import SessionLocal
+from .services.dedupe_service import find_duplicates
+
+
+def dedupe_customers(min_score: float = 0.8):
+    """Print likely duplicate customers as tab-separated customer_id, duplicate_id, score, reasons."""
+    db: Session = SessionLocal()
+    try:
+        skipped = []
+        pairs = find_duplicates(db, min_score=min_score, skipped=skipped)
+        for pair in pairs:
+            print(pair["customer_id"], pair["duplicate_id"], pair["score"], ",".join(pair["reasons"]), sep="\t")
+        print("Found", len(pairs), "likely duplicate pairs", file=sys.stderr)
+        for (field, value), prefix, size in skipped:
+            print(f"Skipped {size} customers sharing {field} {value!r} and name prefix {prefix!r}", file=sys.stderr)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    dedupe_customers(float(sys.argv[1]) if len(sys.argv) > 1 else 0.8)
@@ -0,0 +1,43 @@
+import argparse
+import io
+import sys
+from sqlalchemy.orm import Session
+from .db import SessionLocal
+from .services.import_service import IMPORT_CHUNK_SIZE, IMPORTERS, import_records, report_lines
+
+
+def main(argv=None) -> int:
+    """
+    Upsert customers or technicians from a CSV or NDJSON file (or stdin),
+    printing the NDJSON error report as it goes. Exits 1 if any row failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m zynor_api.import_records")
+    parser.add_argument("kind", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="File to import, or - for stdin")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Default: from the file extension, else csv")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+
+    db: Session = SessionLocal()
+    # Undecodable bytes are reported per row rather than aborting the run.
+    if args.path == "-":
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    else:
+        source = open(args.path, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    summary = {}
+    try:
+        for item in import_records(db, args.kind, source, fmt=fmt, chunk_size=args.chunk_size):
+            sys.stdout.writelines(report_lines([item]))
+            if "failed" in item:
+                summary = item
+    finally:
+        if args.path == "-":
+            source.detach()
+        else:
+            source.close()
+    return 1 if summary.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
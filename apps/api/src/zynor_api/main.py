@@ -6,6 +6,10 @@ from .routers.technicians.routes import router as technicians_router
 from .routers.auth.routes import router as auth_router
 from .routers.customers.routes import router as customers_router
 from .routers.jobs.routes import router as jobs_router
+from .routers.schedule.routes import router as schedule_router
+from .routers.stats.routes import router as stats_router
+from .routers.events.routes import router as events_router
+from .routers.job_series.routes import router as job_series_router
 from apps.core.logging_config import init_logging
 from apps.core.request_logging import RequestLoggingMiddleware
 from apps.core.error_handlers import unhandled_exception_handler
@@ -48,6 +52,10 @@ app.include_router(auth_router)
 app.include_router(technicians_router, prefix="/api")
 app.include_router(customers_router, prefix="/api")
 app.include_router(jobs_router)
+app.include_router(schedule_router, prefix="/api")
+app.include_router(stats_router, prefix="/api")
+app.include_router(events_router, prefix="/api")
+app.include_router(job_series_router, prefix="/api")
 
 
 @app.get("/", tags=["meta"])
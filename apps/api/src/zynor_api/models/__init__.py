@@ -3,6 +3,9 @@ from .technician import Technician  # noqa: F401
 from .customer import Customer  # noqa: F401
 from .job import Job  # noqa: F401
 from .user import User  # noqa: F401
+from .kpi_rollup import KpiRollup  # noqa: F401
+from .job_series import JobSeries  # noqa: F401
+from .technician_skill import TechnicianSkill  # noqa: F401
 
 
 
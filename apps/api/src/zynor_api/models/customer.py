@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, DDL, event, func
 from ..db import Base
 
 class Customer(Base):
 
     __tablename__ = "customers"
+    __table_args__ = (
+        # Keyset order of the customer list (services/customers_service.py).
+        Index("ix_customers_name_id", "name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -15,3 +19,57 @@ class Customer(Base):
 
     address = Column(String, nullable=True)
 
+    # WGS84 coordinates of the address, used for routing.
+    latitude = Column(Float, nullable=True)
+
+    longitude = Column(Float, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Bumped by the ORM on every UPDATE; backs the customer ETags.
+    version = Column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# SQLite full-text index behind the list `q=` search, kept in sync by
+# triggers like technicians_fts (models/technician.py). Postgres uses a
+# pg_trgm GIN expression index instead (migration only).
+CUSTOMER_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS customers_fts USING fts5(
+        name, email, phone, address,
+        content='customers', content_rowid='id',
+        prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_ai AFTER INSERT ON customers BEGIN
+        INSERT INTO customers_fts(rowid, name, email, phone, address)
+        VALUES (new.id, new.name, new.email, new.phone, new.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_ad AFTER DELETE ON customers BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email, phone, address)
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS customers_fts_au
+    AFTER UPDATE OF name, email, phone, address ON customers BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email, phone, address)
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.address);
+        INSERT INTO customers_fts(rowid, name, email, phone, address)
+        VALUES (new.id, new.name, new.email, new.phone, new.address);
+    END
+    """,
+]
+
+for _stmt in CUSTOMER_FTS_DDL:
+    event.listen(Customer.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+event.listen(
+    Customer.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS customers_fts").execute_if(dialect="sqlite"),
+)
@@ -1,12 +1,44 @@
 import uuid
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from ..db import Base
 
 
+# Job lifecycle. Bulk transitions only move a job along these edges;
+# COMPLETED and CANCELLED are terminal.
+JOB_STATUS_TRANSITIONS = {
+    "NEW": {"SCHEDULED", "IN_PROGRESS", "ON_HOLD", "CANCELLED"},
+    "SCHEDULED": {"NEW", "IN_PROGRESS", "ON_HOLD", "CANCELLED"},
+    "IN_PROGRESS": {"ON_HOLD", "COMPLETED", "CANCELLED"},
+    "ON_HOLD": {"SCHEDULED", "IN_PROGRESS", "CANCELLED"},
+    "COMPLETED": set(),
+    "CANCELLED": set(),
+}
+JOB_STATUSES = set(JOB_STATUS_TRANSITIONS)
+TERMINAL_JOB_STATUSES = {s for s, nxt in JOB_STATUS_TRANSITIONS.items() if not nxt}
+
+
+def job_status_sources(target: str) -> set:
+    """Statuses a job may be in to move to `target`."""
+    return {s for s, nxt in JOB_STATUS_TRANSITIONS.items() if target in nxt}
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Keyset pagination / filtered listing; every index ends in `id`
+        # so (sort_value, id) is a unique, seekable position.
+        Index("ix_jobs_scheduled_start_at_id", "scheduled_start_at", "id"),
+        Index("ix_jobs_updated_at_id", "updated_at", "id"),
+        Index("ix_jobs_status_scheduled_start_at_id", "status", "scheduled_start_at", "id"),
+        Index("ix_jobs_technician_id_scheduled_start_at_id", "technician_id", "scheduled_start_at", "id"),
+        Index("ix_jobs_customer_id_scheduled_start_at_id", "customer_id", "scheduled_start_at", "id"),
+        # At most one stored job per occurrence of a recurring series.
+        UniqueConstraint("series_id", "occurrence_start", name="uq_jobs_series_occurrence"),
+        # Postgres additionally carries the `ex_jobs_technician_no_overlap`
+        # GiST exclusion constraint (migration only; SQLite has no range types).
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -27,15 +59,27 @@ class Job(Base):
         nullable=True,
     )
 
+    # Set when the job is a materialized occurrence of a recurring series;
+    # occurrence_start is the occurrence's original (rule) start time.
+    series_id = Column(Integer, ForeignKey("job_series.id"), nullable=True)
+    occurrence_start = Column(DateTime(timezone=True), nullable=True)
+
     # Audit fields
     created_by_user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
     updated_by_user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Bumped by the ORM on every UPDATE (bulk UPDATEs bump it themselves);
+    # backs the job ETags.
+    version = Column(Integer, nullable=False, server_default="1")
+
+    # Optional relationships (string class names avoid import cycles).
+    # Loaded on access only: no response schema exposes them, so eager
+    # joins would add two `users` joins to every read.
+    created_by = relationship("User", foreign_keys=[created_by_user_id], lazy="select")
+    updated_by = relationship("User", foreign_keys=[updated_by_user_id], lazy="select")
 
-    # Optional relationships (string class names avoid import cycles)
-    created_by = relationship("User", foreign_keys=[created_by_user_id], lazy="joined")
-    updated_by = relationship("User", foreign_keys=[updated_by_user_id], lazy="joined")
+    __mapper_args__ = {"version_id_col": version}
 
     def __repr__(self):
         return f"<Job id={self.id} title={self.title}>"
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from ..db import Base
+
+
+class JobSeries(Base):
+    """
+    A recurring job. Occurrences are expanded from `rule` at query time;
+    only occurrences that get changed are stored, as `jobs` rows pointing
+    back here with their original `occurrence_start`.
+    """
+    __tablename__ = "job_series"
+    __table_args__ = (
+        # Window lookups: series started before the window end and not
+        # finished before its start.
+        Index("ix_job_series_dtstart_ends_at", "dtstart", "ends_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Template for every occurrence
+    title = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)
+    technician_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("technicians.id"),
+        nullable=True,
+    )
+
+    # Recurrence: RRULE subset (see services/recurrence.py), first start,
+    # and the last possible start (null for open-ended series).
+    rule = Column(String(255), nullable=False)
+    dtstart = Column(DateTime(timezone=True), nullable=False)
+    duration_minutes = Column(Integer, nullable=False)
+    ends_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<JobSeries id={self.id} rule={self.rule}>"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String
+from ..db import Base
+
+
+class KpiRollup(Base):
+    """
+    Running counter maintained in the same transaction as the writes it
+    counts. `metric` names the breakdown (e.g. "jobs_by_status") and `key`
+    the bucket inside it (e.g. "NEW", or "<technician_id>|NEW").
+    """
+    __tablename__ = "kpi_rollups"
+
+    metric = Column(String(50), primary_key=True)
+    key = Column(String(120), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<KpiRollup {self.metric}[{self.key}]={self.value}>"
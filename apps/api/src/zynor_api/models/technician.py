@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, func, Integer, ForeignKey, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, Float, Numeric, func, Integer, ForeignKey, Index, JSON, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from ..db import Base
@@ -7,6 +7,16 @@ from ..db import Base
 
 class Technician(Base):
     __tablename__ = "technicians"
+    __table_args__ = (
+        # One per list sort key (services/technicians_service.py), ending in
+        # id so keyset pages are a single range scan.
+        Index("ix_technicians_first_name_last_name_id", "first_name", "last_name", "id"),
+        Index("ix_technicians_last_name_first_name_id", "last_name", "first_name", "id"),
+        Index("ix_technicians_email_id", "email", "id"),
+        Index("ix_technicians_created_at_id", "created_at", "id"),
+        Index("ix_technicians_updated_at_id", "updated_at", "id"),
+        Index("ix_technicians_hourly_rate_id", "hourly_rate", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_name = Column(String(100), nullable=False)
@@ -15,14 +25,69 @@ class Technician(Base):
     phone = Column(String(20), nullable=True)
     skills = Column(JSON, nullable=True)
     is_active = Column(Boolean, nullable=True, default=True)
+    hourly_rate = Column(Numeric(10, 2, asdecimal=False), nullable=True)
+    # Home base or last known position (WGS84), for nearest-technician lookups.
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
     updated_by_user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Bumped by the ORM on every UPDATE; backs the technician ETags.
+    version = Column(Integer, nullable=False, server_default="1")
 
-    # Optional relationships (string class names avoid import cycles)
-    created_by = relationship("User", foreign_keys=[created_by_user_id], lazy="joined")
-    updated_by = relationship("User", foreign_keys=[updated_by_user_id], lazy="joined")
+    # Optional relationships (string class names avoid import cycles).
+    # Loaded on access only: no response schema exposes them, so eager
+    # joins would add two `users` joins to every read.
+    created_by = relationship("User", foreign_keys=[created_by_user_id], lazy="select")
+    updated_by = relationship("User", foreign_keys=[updated_by_user_id], lazy="select")
+
+    __mapper_args__ = {"version_id_col": version}
 
     def __repr__(self):
         return f"<Technician id={self.id} email={self.email}>"
+
+
+# SQLite full-text index behind the list `q=` search (services/search_service.py),
+# an external-content FTS5 table kept in sync by triggers. Postgres uses a
+# pg_trgm GIN expression index instead (migration only). FTS5 keys rows by
+# rowid, which VACUUM may renumber here; run
+# INSERT INTO technicians_fts(technicians_fts) VALUES ('rebuild') afterwards.
+TECHNICIAN_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS technicians_fts USING fts5(
+        first_name, last_name, email, phone,
+        content='technicians', content_rowid='rowid',
+        prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_ai AFTER INSERT ON technicians BEGIN
+        INSERT INTO technicians_fts(rowid, first_name, last_name, email, phone)
+        VALUES (new.rowid, new.first_name, new.last_name, new.email, new.phone);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_ad AFTER DELETE ON technicians BEGIN
+        INSERT INTO technicians_fts(technicians_fts, rowid, first_name, last_name, email, phone)
+        VALUES ('delete', old.rowid, old.first_name, old.last_name, old.email, old.phone);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS technicians_fts_au
+    AFTER UPDATE OF first_name, last_name, email, phone ON technicians BEGIN
+        INSERT INTO technicians_fts(technicians_fts, rowid, first_name, last_name, email, phone)
+        VALUES ('delete', old.rowid, old.first_name, old.last_name, old.email, old.phone);
+        INSERT INTO technicians_fts(rowid, first_name, last_name, email, phone)
+        VALUES (new.rowid, new.first_name, new.last_name, new.email, new.phone);
+    END
+    """,
+]
+
+for _stmt in TECHNICIAN_FTS_DDL:
+    event.listen(Technician.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+event.listen(
+    Technician.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS technicians_fts").execute_if(dialect="sqlite"),
+)
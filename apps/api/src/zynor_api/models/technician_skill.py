@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from ..db import Base
+
+
+class TechnicianSkill(Base):
+    """
+    Normalized copy of `Technician.skills` (trimmed, lower-cased, one row per
+    skill) kept in sync by the technician service. The primary key leads
+    with `skill`, so skill filters are index lookups.
+    """
+    __tablename__ = "technician_skills"
+
+    skill = Column(String(50), primary_key=True)
+    technician_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("technicians.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    def __repr__(self):
+        return f"<TechnicianSkill {self.skill} technician_id={self.technician_id}>"
@@ -12,6 +12,9 @@ class User(Base):
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Last email / role / activation change; tokens issued before it no
+    # longer carry trusted role claims.
+    principal_changed_at = Column(DateTime(timezone=True), nullable=True)
 
 
 
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import Session
+from .db import SessionLocal
+from .services.stats_service import rebuild_rollups
+
+
+def rebuild_stats():
+    db: Session = SessionLocal()
+    try:
+        written = rebuild_rollups(db)
+        print("Rebuilt KPI rollups:", written, "counters")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_stats()
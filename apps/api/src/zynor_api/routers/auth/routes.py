@@ -18,7 +18,7 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == payload.username).first()
     if not user or not user.is_active or not verify_password(payload.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
-    token = create_access_token({"sub": user.email})
+    token = create_access_token({"sub": user.email, "uid": user.id, "role": user.role})
     return {"access_token": token, "token_type": "bearer"}
 
 
@@ -1,15 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import io
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from ...db import get_session
+from ...services.import_service import import_records as svc_import, report_lines, spool_upload
+from ...security.auth import require_roles
+from ...models.user import User
+from ...models.customer import Customer as CustomerModel
+from ...services.etags import entity_etag, etag_matches, not_modified, version_etag
 from ...services.customers_service import (
+    customers_list_etag as svc_list_etag,
     create_customer as svc_create,
     get_customer as svc_get,
     list_customers as svc_list,
     update_customer as svc_update,
     delete_customer as svc_delete,
+    merge_customers as svc_merge,
+    customer_overview as svc_overview,
+)
+from .schemas import (
+    Customer,
+    CustomerCreate,
+    CustomerMerge,
+    CustomerMergeResult,
+    CustomerOverview,
+    CustomerUpdate,
+    PaginatedCustomers,
 )
-from .schemas import Customer, CustomerCreate, CustomerUpdate
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
@@ -36,30 +57,81 @@ async def create_customer(
 
 @router.get(
     "",
-    response_model=list[Customer],
+    response_model=PaginatedCustomers,
     responses={
+        304: {"description": "Not modified (If-None-Match)"},
+        400: {"description": "Invalid cursor"},
         422: {"description": "Validation error"},
     }
 )
-def list_customers(db: Session = Depends(get_session)):
-    return svc_list(db)
+def list_customers(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    sort: str = Query("name", description="name or id, '-' prefix for descending"),
+    q: Optional[str] = Query(default=None, description="Words or word prefixes matched against name, email, phone and address"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,name,email"),
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_session),
+):
+    page = dict(limit=limit, cursor=cursor, sort=sort, q=q)
+    etag = svc_list_etag(db, str(request.query_params), **page)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    result = svc_list(db, fields=fields, **page)
+    if fields:
+        # Sparse rows don't satisfy the full response model.
+        return JSONResponse(jsonable_encoder(result), headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
 
 
 @router.get(
     "/{customer_id}",
     response_model=Customer,
     responses={
+        304: {"description": "Not modified (If-None-Match)"},
         404: {"description": "Customer not found"},
         422: {"description": "Validation error"},
     }
 )
-async def get_customer(customer_id: int, db: Session = Depends(get_session)):
+async def get_customer(
+    customer_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_session),
+):
+    if if_none_match:
+        etag = entity_etag(db, CustomerModel, customer_id)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
     obj = svc_get(db, customer_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Customer not found")
+    response.headers["ETag"] = version_etag(obj.version)
     return obj
 
 
+@router.get(
+    "/{customer_id}/overview",
+    response_model=CustomerOverview,
+    responses={
+        400: {"description": "Invalid cursor"},
+        404: {"description": "Customer not found"},
+        422: {"description": "Validation error"},
+    }
+)
+def get_customer_overview(
+    customer_id: int,
+    jobs_limit: int = Query(10, ge=1, le=100),
+    jobs_cursor: Optional[str] = Query(default=None, description="next_cursor from the previous overview"),
+    db: Session = Depends(get_session),
+):
+    """Customer, recent jobs, job counts by status, next visit and last technician in one call."""
+    return svc_overview(db, customer_id, jobs_limit=jobs_limit, jobs_cursor=jobs_cursor)
+
+
 @router.put(
     "/{customer_id}",
     response_model=Customer,
@@ -105,3 +177,55 @@ async def partial_update_customer(
 async def delete_customer(customer_id: int, db: Session = Depends(get_session)) -> None:
     svc_delete(db, customer_id)
 
+
+@router.post(
+    "/{customer_id}/merge",
+    response_model=CustomerMergeResult,
+    responses={
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin role required"},
+        404: {"description": "Customer not found"},
+        422: {"description": "Validation error"},
+    }
+)
+def merge_customers(
+    customer_id: int,
+    payload: CustomerMerge,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(require_roles("admin")),
+):
+    """
+    Merge duplicate customers into this one: jobs and recurring series move
+    over, missing contact details are filled in, and the duplicates are
+    deleted, all in one transaction. Candidates come from the
+    `dedupe_customers` batch job.
+    """
+    return svc_merge(db, customer_id, payload.duplicate_ids)
+
+
+@router.post(
+    "/import",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "Per-row errors, then a summary line"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin role required"},
+        422: {"description": "Validation error"},
+    },
+)
+async def import_customers(
+    request: Request,
+    format: str = Query("csv", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(require_roles("admin")),
+):
+    """
+    Upsert customers from a CSV (header row of field names) or NDJSON
+    request body, matching existing rows on email. The report streams back
+    as NDJSON: one {"line", "error"} object per rejected row, then
+    {"created", "updated", "failed"}.
+    """
+    upload = await spool_upload(request.stream())
+    lines = io.TextIOWrapper(upload, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    report = svc_import(db, "customers", lines, fmt=format, user_id=current_user.id)
+    return StreamingResponse(report_lines(report), media_type="application/x-ndjson")
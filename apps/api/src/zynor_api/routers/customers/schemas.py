@@ -1,6 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
 
 
 
@@ -16,6 +18,10 @@ class CustomerBase(BaseModel):
 
     address: Optional[str] = None
 
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+
 
 
 
@@ -38,6 +44,10 @@ class CustomerUpdate(BaseModel):
 
     address: Optional[str] = None
 
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+
 
 
 
@@ -53,13 +63,74 @@ class Customer(CustomerBase):
         orm_mode = True
 
 
+class PaginatedCustomers(BaseModel):
+
+    items: List[Customer]
+
+    limit: int
+
+    next_cursor: Optional[str] = None
+
+
+class CustomerMerge(BaseModel):
+
+    # Customers folded into the target and deleted; their jobs and series move over.
+    duplicate_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
+class CustomerMergeResult(BaseModel):
+
+    customer: Customer
+
+    merged_ids: List[int]
+
+    jobs_moved: int
+
+    series_moved: int
+
+
+class CustomerJobSummary(BaseModel):
+
+    id: int
+
+    title: str
+
+    status: str
+
+    scheduled_start_at: Optional[datetime] = None
+
+    scheduled_end_at: Optional[datetime] = None
+
+    technician_id: Optional[UUID] = None
+
+
+class LastTechnician(BaseModel):
+
+    technician_id: UUID
+
+    first_name: Optional[str] = None
+
+    last_name: Optional[str] = None
+
+    # The latest past visit this technician made.
+    job_id: int
 
+    visited_at: datetime
 
 
+class CustomerOverview(BaseModel):
 
+    customer: Customer
 
+    job_count: int
 
+    status_counts: Dict[str, int]
 
+    next_visit: Optional[CustomerJobSummary] = None
 
+    last_technician: Optional[LastTechnician] = None
 
+    # Newest first (unscheduled jobs lead); page on with next_cursor.
+    recent_jobs: List[CustomerJobSummary]
 
+    next_cursor: Optional[str] = None
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from ...services.events_service import event_hub, format_sse
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+TOPICS = {"jobs", "technicians", "customers"}
+
+# Idle connections get a comment line this often so proxies keep them open.
+KEEPALIVE_SECONDS = 15.0
+
+
+def _parse_topics(topics: Optional[str]) -> Optional[set]:
+    if not topics:
+        return None
+    return {t.strip() for t in topics.split(",") if t.strip() in TOPICS} or None
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Event stream"},
+    }
+)
+async def stream_events(
+    request: Request,
+    topics: Optional[str] = Query(None, description="Comma-separated: jobs, technicians, customers"),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Server-Sent Events feed of job, technician and customer changes
+    (`job.created`, `technician.updated`, ...). Each event carries the
+    entity id; reconnecting with `Last-Event-ID` replays what was missed.
+    A `reset` event means the gap is too old to replay and clients should
+    refetch.
+    """
+    sub, backlog, gap = event_hub.subscribe(
+        asyncio.get_running_loop(), _parse_topics(topics), last_event_id
+    )
+
+    async def body():
+        try:
+            yield "retry: 3000\n\n"
+            if gap:
+                yield "event: reset\ndata: {}\n\n"
+            for event in backlog:
+                yield format_sse(event)
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+                if sub.overflowed and sub.queue.empty():
+                    # Fell behind: close so the client resumes from its last id.
+                    break
+        finally:
+            event_hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def events_socket(
+    websocket: WebSocket,
+    topics: Optional[str] = None,
+    last_event_id: Optional[int] = None,
+):
+    """Same feed as GET /api/events, one JSON message per event."""
+    await websocket.accept()
+    sub, backlog, gap = event_hub.subscribe(
+        asyncio.get_running_loop(), _parse_topics(topics), last_event_id
+    )
+    try:
+        if gap:
+            await websocket.send_json({"type": "reset"})
+        for event in backlog:
+            await websocket.send_json(event._asdict())
+        while not sub.overflowed or not sub.queue.empty():
+            event = await sub.queue.get()
+            await websocket.send_json(event._asdict())
+        await websocket.close(code=1013)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        event_hub.unsubscribe(sub)
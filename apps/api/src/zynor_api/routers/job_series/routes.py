@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from ...db import get_session
+from ...services.series_service import (
+    get_series as svc_get,
+    create_series as svc_create,
+    delete_series as svc_delete,
+    list_occurrences as svc_list_occurrences,
+    materialize_occurrence as svc_materialize,
+)
+from ..jobs.schemas import Job
+from .schemas import JobSeries, JobSeriesCreate, OccurrenceMaterialize, SeriesOccurrence
+
+router = APIRouter(prefix="/job-series", tags=["Job series"])
+
+
+@router.post("", response_model=JobSeries, status_code=status.HTTP_201_CREATED)
+def create_series(series_in: JobSeriesCreate, db: Session = Depends(get_session)):
+    return svc_create(db, series_in)
+
+
+@router.get("/{series_id}", response_model=JobSeries)
+def get_series(series_id: int, db: Session = Depends(get_session)):
+    series = svc_get(db, series_id)
+    if series is None:
+        raise HTTPException(status_code=404, detail="Job series not found")
+    return series
+
+
+@router.get("/{series_id}/occurrences", response_model=List[SeriesOccurrence])
+def list_occurrences(
+    series_id: int,
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_session),
+):
+    """
+    Occurrences starting in [from, to), expanded from the rule; those
+    stored as jobs carry `job_id` and the job's current values.
+    """
+    return svc_list_occurrences(db, series_id, start, end)
+
+
+@router.post(
+    "/{series_id}/occurrences",
+    response_model=Job,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        409: {"description": "Occurrence already stored, or technician already booked"},
+        422: {"description": "Not an occurrence of this series"},
+    }
+)
+def materialize_occurrence(
+    series_id: int,
+    payload: OccurrenceMaterialize,
+    db: Session = Depends(get_session),
+):
+    """
+    Store one occurrence as a job (with optional overrides) so it can be
+    rescheduled, assigned or cancelled on its own. Afterwards edit it
+    through /api/jobs/{id}.
+    """
+    return svc_materialize(db, series_id, payload)
+
+
+@router.delete("/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_series(series_id: int, db: Session = Depends(get_session)) -> None:
+    svc_delete(db, series_id)
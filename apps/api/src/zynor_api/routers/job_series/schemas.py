@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class JobSeriesBase(BaseModel):
+    title: str
+    description: Optional[str] = None
+    customer_id: int
+    technician_id: Optional[UUID] = None
+    rule: str = Field(..., description='RRULE subset, e.g. "FREQ=WEEKLY;BYDAY=MO;COUNT=52"')
+    dtstart: datetime = Field(..., description="Start of the first occurrence")
+    duration_minutes: int = Field(..., gt=0, le=24 * 60)
+
+
+class JobSeriesCreate(JobSeriesBase):
+    pass
+
+
+class JobSeries(JobSeriesBase):
+    id: int
+    ends_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    class Config:
+        orm_mode = True
+
+
+class SeriesOccurrence(BaseModel):
+    series_id: int
+    occurrence_start: datetime
+    job_id: Optional[int] = None
+    title: str
+    status: str
+    scheduled_start_at: Optional[datetime] = None
+    scheduled_end_at: Optional[datetime] = None
+    customer_id: int
+    technician_id: Optional[UUID] = None
+
+
+class OccurrenceMaterialize(BaseModel):
+    occurrence_start: datetime
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    scheduled_start_at: Optional[datetime] = None
+    scheduled_end_at: Optional[datetime] = None
+    technician_id: Optional[UUID] = None
@@ -1,16 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from typing import List
 from ...db import get_session
 from ...services.jobs_service import (
     create_job as svc_create,
+    create_jobs_batch as svc_create_batch,
+    transition_jobs as svc_transition,
     get_job as svc_get,
     list_jobs as svc_list,
+    jobs_list_etag as svc_list_etag,
+    export_jobs as svc_export,
     update_job as svc_update,
     delete_job as svc_delete,
 )
-from .schemas import Job, JobCreate, JobUpdate
+from ...services.dispatch_service import recommend_technicians
+from ...services.etags import entity_etag, etag_matches, not_modified, version_etag
+from ...models.job import Job as JobModel
+from .schemas import (
+    Job,
+    JobCreate,
+    JobUpdate,
+    PaginatedJobs,
+    JobBatchCreate,
+    JobBatchResult,
+    JobBulkTransition,
+    JobBulkTransitionResult,
+    RecommendationRequest,
+    TechnicianRecommendation,
+)
 
 router = APIRouter(
     prefix="/api/jobs",
@@ -18,16 +41,97 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[Job])
-def list_jobs(db: Session = Depends(get_session)):
-    return svc_list(db)
+@router.get("/", response_model=PaginatedJobs, responses={304: {"description": "Not modified (If-None-Match)"}})
+def list_jobs(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    sort: str = Query("scheduled_start_at", description="scheduled_start_at or updated_at, '-' prefix for descending"),
+    status: Optional[List[str]] = Query(default=None),
+    technician_id: Optional[UUID] = None,
+    customer_id: Optional[int] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,title,status"),
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_session),
+):
+    filters = dict(
+        status=status,
+        technician_id=technician_id,
+        customer_id=customer_id,
+        scheduled_from=scheduled_from,
+        scheduled_to=scheduled_to,
+    )
+    etag = svc_list_etag(db, str(request.query_params), limit=limit, cursor=cursor, sort=sort, **filters)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    result = svc_list(db=db, limit=limit, cursor=cursor, sort=sort, fields=fields, **filters)
+    if fields:
+        # Sparse rows don't satisfy the full response model.
+        return JSONResponse(jsonable_encoder(result), headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
 
 
-@router.get("/{job_id}", response_model=Job)
-def get_job(job_id: int, db: Session = Depends(get_session)):
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {m: {} for m in EXPORT_MEDIA_TYPES.values()}},
+        422: {"description": "Validation error"},
+    },
+)
+def export_jobs(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status: Optional[List[str]] = Query(default=None),
+    technician_id: Optional[UUID] = None,
+    customer_id: Optional[int] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    db: Session = Depends(get_session),
+):
+    """
+    Stream every matching job as NDJSON or CSV without buffering the result set.
+    """
+    body = svc_export(
+        db=db,
+        fmt=format,
+        status=status,
+        technician_id=technician_id,
+        customer_id=customer_id,
+        scheduled_from=scheduled_from,
+        scheduled_to=scheduled_to,
+    )
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+    )
+
+
+@router.get("/{job_id}", response_model=Job, responses={304: {"description": "Not modified (If-None-Match)"}})
+def get_job(
+    job_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_session),
+):
+    if if_none_match:
+        etag = entity_etag(db, JobModel, job_id)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
     job = svc_get(db, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    response.headers["ETag"] = version_etag(job.version)
     return job
 
 
@@ -39,6 +143,64 @@ def create_job(job_in: JobCreate, db: Session = Depends(get_session)):
         raise HTTPException(status_code=409, detail="Invalid foreign key reference")
 
 
+@router.post(
+    ":batch",
+    response_model=JobBatchResult,
+    responses={
+        422: {"description": "Validation error"},
+    },
+)
+def create_jobs_batch(
+    payload: JobBatchCreate,
+    atomic: bool = Query(False, description="Insert nothing unless every item is valid"),
+    db: Session = Depends(get_session),
+):
+    """
+    Create many jobs in one request. Foreign keys and technician double
+    bookings (within the batch and against existing jobs) are checked per
+    item; the response reports the outcome of each item by index.
+    """
+    return svc_create_batch(db, payload.items, atomic=atomic)
+
+
+@router.post(
+    ":transition",
+    response_model=JobBulkTransitionResult,
+    responses={
+        409: {"description": "Reassignment would double-book the technician"},
+        422: {"description": "Validation error"},
+    },
+)
+def transition_jobs(payload: JobBulkTransition, db: Session = Depends(get_session)):
+    """
+    Move many jobs to a new status and/or technician in one statement.
+    Only transitions allowed by the job status state machine are applied;
+    each requested id gets an outcome.
+    """
+    return svc_transition(db, payload)
+
+
+@router.post(
+    "/{job_id}/recommendations",
+    response_model=List[TechnicianRecommendation],
+    responses={
+        404: {"description": "Job not found"},
+        422: {"description": "Validation error"},
+    },
+)
+def recommend_for_job(
+    job_id: int,
+    payload: Optional[RecommendationRequest] = None,
+    db: Session = Depends(get_session),
+):
+    """
+    Rank active technicians for the job by skill match, open-job load and
+    availability during the job's scheduled window; returns the top k.
+    """
+    payload = payload or RecommendationRequest()
+    return recommend_technicians(db, job_id, skills=payload.skills, k=payload.k)
+
+
 @router.put("/{job_id}", response_model=Job)
 def update_job(job_id: int, job_in: JobUpdate, db: Session = Depends(get_session)):
     return svc_update(db, job_id, job_in)
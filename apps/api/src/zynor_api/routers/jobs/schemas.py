@@ -1,7 +1,10 @@
 from datetime import datetime
 
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field, model_validator
+
+from ...models.job import JOB_STATUSES
 
 
 class JobBase(BaseModel):
@@ -11,7 +14,7 @@ class JobBase(BaseModel):
     scheduled_start_at: Optional[datetime] = None
     scheduled_end_at: Optional[datetime] = None
     customer_id: int
-    technician_id: Optional[int] = None
+    technician_id: Optional[UUID] = None
 
 
 class JobCreate(JobBase):
@@ -25,21 +28,95 @@ class JobUpdate(BaseModel):
     scheduled_start_at: Optional[datetime] = None
     scheduled_end_at: Optional[datetime] = None
     customer_id: Optional[int] = None
-    technician_id: Optional[int] = None
+    technician_id: Optional[UUID] = None
 
 
 class Job(JobBase):
     id: int
+    series_id: Optional[int] = None
+    occurrence_start: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     class Config:
         orm_mode = True
 
 
+class PaginatedJobs(BaseModel):
+    items: List[Job]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class JobBatchCreate(BaseModel):
+    items: List[JobCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class JobBatchItemResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class JobBatchResult(BaseModel):
+    created: int
+    failed: int
+    results: List[JobBatchItemResult]
 
 
+class RecommendationRequest(BaseModel):
+    skills: List[str] = Field(default_factory=list, description="Skills the job needs")
+    k: int = Field(10, ge=1, le=100)
 
 
+class TechnicianRecommendation(BaseModel):
+    technician_id: UUID
+    first_name: str
+    last_name: str
+    score: float
+    skill_match: float
+    open_jobs: int
+    available: bool
 
 
+class JobFilter(BaseModel):
+    status: Optional[List[str]] = None
+    technician_id: Optional[UUID] = None
+    customer_id: Optional[int] = None
+    scheduled_from: Optional[datetime] = None
+    scheduled_to: Optional[datetime] = None
+
+
+class JobBulkTransition(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=5000)
+    filter: Optional[JobFilter] = None
+    status: Optional[str] = None
+    technician_id: Optional[UUID] = None
+    unassign: bool = False
+
+    @model_validator(mode="after")
+    def _validate_selection_and_change(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter must have at least one criterion")
+        if self.status is None and self.technician_id is None and not self.unassign:
+            raise ValueError("Provide status, technician_id or unassign")
+        if self.technician_id is not None and self.unassign:
+            raise ValueError("technician_id and unassign are mutually exclusive")
+        if self.status is not None and self.status not in JOB_STATUSES:
+            raise ValueError(f"Unknown status: {self.status}")
+        return self
+
+
+class JobTransitionOutcome(BaseModel):
+    id: int
+    ok: bool
+    status: Optional[str] = None
+    technician_id: Optional[UUID] = None
+    error: Optional[str] = None
+
 
+class JobBulkTransitionResult(BaseModel):
+    updated: int
+    results: List[JobTransitionOutcome]
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from ...db import get_session
+from ...services.schedule_service import get_schedule as svc_get_schedule
+from .schemas import Schedule
+
+router = APIRouter(prefix="/schedule", tags=["Schedule"])
+
+
+@router.get(
+    "",
+    response_model=Schedule,
+    responses={
+        422: {"description": "Validation error"},
+    }
+)
+def get_schedule(
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_session),
+):
+    """
+    Dispatch board timeline: jobs starting in [from, to) grouped into one
+    lane per technician, ordered by start time, plus an unassigned lane.
+    """
+    return svc_get_schedule(db, start, end)
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ScheduleJob(BaseModel):
+    # None for an occurrence of a recurring series not stored as a job yet.
+    id: Optional[int] = None
+    title: str
+    status: str
+    scheduled_start_at: Optional[datetime] = None
+    scheduled_end_at: Optional[datetime] = None
+    customer_id: int
+    series_id: Optional[int] = None
+    occurrence_start: Optional[datetime] = None
+
+
+class ScheduleLane(BaseModel):
+    technician_id: UUID
+    first_name: str
+    last_name: str
+    jobs: List[ScheduleJob]
+
+
+class Schedule(BaseModel):
+    start: datetime
+    end: datetime
+    lanes: List[ScheduleLane]
+    unassigned: List[ScheduleJob]
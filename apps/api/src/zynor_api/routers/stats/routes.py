@@ -0,0 +1,30 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from ...db import get_session
+from ...services.stats_service import get_stats as svc_get_stats
+from .schemas import Stats
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@router.get(
+    "",
+    response_model=Stats,
+    responses={
+        422: {"description": "Validation error"},
+    }
+)
+def get_stats(
+    day_from: Optional[date] = None,
+    day_to: Optional[date] = None,
+    db: Session = Depends(get_session),
+):
+    """
+    Operations dashboard counters, read from the maintained KPI rollups.
+    `day_from`/`day_to` (inclusive) bound the per-day breakdown; a missing
+    end defaults to 30 days from the other, or from today.
+    """
+    return svc_get_stats(db, day_from=day_from, day_to=day_to)
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class TechnicianTotals(BaseModel):
+    active: int
+    inactive: int
+
+
+class Stats(BaseModel):
+    jobs_by_status: Dict[str, int]
+    # technician id (or "unassigned") -> status -> count
+    jobs_by_technician: Dict[str, Dict[str, int]]
+    # YYYY-MM-DD of scheduled_start_at (or "unscheduled") -> status -> count
+    jobs_by_day: Dict[str, Dict[str, int]]
+    technicians: TechnicianTotals
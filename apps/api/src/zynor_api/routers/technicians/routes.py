@@ -1,21 +1,44 @@
+import io
 from uuid import UUID
-from typing import Optional, List
+from typing import Literal, Optional, List
+from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from ...db import get_session
+from ...services.import_service import import_records as svc_import, report_lines, spool_upload
 from ...security.auth import get_current_user, require_roles
 from ...models.user import User
 from ...services.technicians_service import (
     create_technician as svc_create,
     get_technician as svc_get,
     list_technicians_db as svc_list_db,
+    technicians_list_etag as svc_list_etag,
     update_technician as svc_update,
     patch_technician as svc_patch,
+    patch_technicians_batch as svc_patch_batch,
     delete_technician as svc_delete,
 )
-from .schemas import TechnicianCreate, TechnicianUpdate, TechnicianPatch, TechnicianOut, PaginatedTechnicians
+from ...services.conflicts_service import find_conflicts
+from ...services.etags import entity_etag, etag_matches, not_modified, version_etag
+from ...models.technician import Technician
+from ...services.routing_service import plan_route
+from ...services.geo_service import nearest_technicians
+from ..jobs.schemas import Job
+from .schemas import (
+    TechnicianCreate,
+    TechnicianUpdate,
+    TechnicianPatch,
+    TechnicianOut,
+    TechnicianBulkPatch,
+    TechnicianBulkPatchResult,
+    PaginatedTechnicians,
+    RoutePlan,
+    NearbyTechnician,
+)
 
 router = APIRouter(prefix="/technicians", tags=["Technicians"])
 
@@ -44,10 +67,13 @@ async def create_technician(
     "",
     response_model=PaginatedTechnicians,
     responses={
+        304: {"description": "Not modified (If-None-Match)"},
         422: {"description": "Validation error"},
     }
 )
 def list_techs(
+    request: Request,
+    response: Response,
     page: int = 1,
     page_size: int = 25,
     q: Optional[str] = None,
@@ -55,43 +81,158 @@ def list_techs(
     last_name: Optional[str] = None,
     email: Optional[str] = None,
     is_active: Optional[bool] = None,
-    skill: Optional[str] = None,
+    skill: Optional[List[str]] = Query(default=None, description="Repeat for several skills"),
+    match: Literal["all", "any"] = Query(default="all", description="Whether technicians need all or any of the skills"),
     min_rate: Optional[float] = None,
     max_rate: Optional[float] = None,
-    sort: Optional[List[str]] = Query(default=None, description="Fields like first_name,-email,created_at"),
+    sort: Optional[str] = Query(default=None, description="first_name, last_name, email, created_at, updated_at or hourly_rate; '-' prefix for descending"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor or prev_cursor from an earlier page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return, e.g. id,first_name,last_name"),
+    count: Literal["exact", "estimated", "none"] = Query(default="exact", description="How to compute total: exact, estimated (may lag recent writes) or none"),
+    facets: Optional[str] = Query(default=None, description="Comma-separated facet counts to include: skills,is_active,hourly_rate"),
+    if_none_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_session),
 ):
-    return svc_list_db(
-        db=db,
-        page=page,
-        page_size=page_size,
+    filters = dict(
         q=q,
         first_name=first_name,
         last_name=last_name,
         email=email,
         is_active=is_active,
         skill=skill,
+        match=match,
         min_rate=min_rate,
         max_rate=max_rate,
-        sort=sort,
     )
+    page_args = dict(page=page, page_size=page_size, sort=sort, cursor=cursor, count=count, facets=facets)
+    etag = svc_list_etag(db, str(request.query_params), **page_args, **filters)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    result = svc_list_db(db=db, fields=fields, **page_args, **filters)
+    if fields:
+        # Sparse rows don't satisfy the full response model.
+        return JSONResponse(jsonable_encoder(result), headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return result
+
+
+@router.patch(
+    "",
+    response_model=TechnicianBulkPatchResult,
+    responses={
+        422: {"description": "Validation error"},
+    }
+)
+def patch_technicians_batch(
+    payload: TechnicianBulkPatch,
+    atomic: bool = Query(False, description="Update nothing unless every item is valid"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(require_roles("admin")),
+):
+    """
+    Partially update many technicians in one transaction. Missing rows and
+    email/phone collisions (with other technicians or within the batch)
+    are reported per item.
+    """
+    return svc_patch_batch(db, payload.items, current_user.id, atomic=atomic)
+
+
+@router.get(
+    "/nearest",
+    response_model=List[NearbyTechnician],
+    responses={
+        422: {"description": "Validation error"},
+    }
+)
+def nearest_techs(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    k: int = Query(10, ge=1, le=100),
+    skill: Optional[str] = None,
+    db: Session = Depends(get_session),
+):
+    """
+    The `k` closest active technicians to (lat, lon) by home base or last
+    known position, optionally only those with `skill`. Served from an
+    in-memory grid index.
+    """
+    return nearest_technicians(db, lat, lon, k=k, skill=skill)
 
 
 @router.get(
     "/{tech_id}",
     response_model=TechnicianOut,
     responses={
+        304: {"description": "Not modified (If-None-Match)"},
         404: {"description": "Technician not found"},
         422: {"description": "Validation error"},
     }
 )
-async def get_technician(tech_id: UUID, db: Session = Depends(get_session)):
+async def get_technician(
+    tech_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_session),
+):
+    if if_none_match:
+        etag = entity_etag(db, Technician, tech_id)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
     obj = svc_get(db, tech_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Technician not found")
+    response.headers["ETag"] = version_etag(obj.version)
     return obj
 
 
+@router.get(
+    "/{tech_id}/conflicts",
+    response_model=List[Job],
+    responses={
+        404: {"description": "Technician not found"},
+        422: {"description": "Validation error"},
+    }
+)
+def list_technician_conflicts(
+    tech_id: UUID,
+    start: datetime,
+    end: datetime,
+    exclude_job_id: Optional[int] = None,
+    db: Session = Depends(get_session),
+):
+    """
+    Jobs already booked for the technician that overlap [start, end).
+    """
+    if end <= start:
+        raise HTTPException(status_code=422, detail="end must be after start")
+    if not svc_get(db, tech_id):
+        raise HTTPException(status_code=404, detail="Technician not found")
+    return find_conflicts(db, tech_id, start, end, exclude_job_id=exclude_job_id)
+
+
+@router.post(
+    "/{tech_id}/route",
+    response_model=RoutePlan,
+    responses={
+        404: {"description": "Technician not found"},
+        422: {"description": "Validation error"},
+    }
+)
+def plan_technician_route(
+    tech_id: UUID,
+    day: date = Query(..., alias="date"),
+    service_minutes: int = Query(30, ge=0, le=480, description="Time spent at each stop"),
+    speed_kmh: float = Query(40.0, gt=0, le=130, description="Average driving speed"),
+    db: Session = Depends(get_session),
+):
+    """
+    Suggested visiting order for the technician's open jobs on `date`
+    (UTC), using customer coordinates and each job's scheduled window.
+    Computed in-process; jobs are not modified.
+    """
+    return plan_route(db, tech_id, day, service_minutes=service_minutes, speed_kmh=speed_kmh)
+
+
 @router.put(
     "/{tech_id}",
     response_model=TechnicianOut,
@@ -142,3 +283,30 @@ async def partial_update_technician(
 async def delete_technician(tech_id: UUID, db: Session = Depends(get_session)) -> None:
     svc_delete(db, tech_id)
 
+
+@router.post(
+    "/import",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "Per-row errors, then a summary line"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin role required"},
+        422: {"description": "Validation error"},
+    },
+)
+async def import_technicians(
+    request: Request,
+    format: str = Query("csv", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(require_roles("admin")),
+):
+    """
+    Upsert technicians from a CSV (header row of field names, skills
+    separated by ';') or NDJSON request body, matching existing rows on
+    email. The report streams back as NDJSON: one {"line", "error"} object
+    per rejected row, then {"created", "updated", "failed"}.
+    """
+    upload = await spool_upload(request.stream())
+    lines = io.TextIOWrapper(upload, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    report = svc_import(db, "technicians", lines, fmt=format, user_id=current_user.id)
+    return StreamingResponse(report_lines(report), media_type="application/x-ndjson")
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field, EmailStr, field_validator, ConfigDict
 from typing import List, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime
 import re
 
 _PHONE_RE = re.compile(r"^\+?[0-9\-()\s]{7,20}$")
@@ -14,6 +14,9 @@ class TechnicianBase(BaseModel):
     phone: Optional[str] = Field(None)
     skills: Optional[List[str]] = Field(default=None, description="Up to 20 skills; each 1–50 chars")
     is_active: bool = True
+    hourly_rate: Optional[float] = Field(None, ge=0)
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Home base or last known position")
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
     @field_validator("phone")
     @classmethod
@@ -54,6 +57,9 @@ class TechnicianUpdate(BaseModel):
     phone: Optional[str] = None
     skills: Optional[List[str]] = None
     is_active: Optional[bool] = None
+    hourly_rate: Optional[float] = Field(None, ge=0)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
     @field_validator("phone")
     @classmethod
@@ -103,6 +109,8 @@ class TechnicianPatch(BaseModel):
     is_active: Optional[bool] = None
     skills: Optional[List[str]] = None
     hourly_rate: Optional[float] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
     @field_validator("first_name", "last_name", mode="before")
     @classmethod
@@ -159,9 +167,84 @@ class TechnicianPatch(BaseModel):
         return v
 
 
+class TechnicianBulkPatchItem(BaseModel):
+    id: UUID
+    patch: TechnicianPatch
+
+
+class TechnicianBulkPatch(BaseModel):
+    items: List[TechnicianBulkPatchItem] = Field(..., min_length=1, max_length=5000)
+
+
+class TechnicianBulkPatchItemResult(BaseModel):
+    index: int
+    id: UUID
+    ok: bool
+    error: Optional[str] = None
+
+
+class TechnicianBulkPatchResult(BaseModel):
+    updated: int
+    failed: int
+    results: List[TechnicianBulkPatchItemResult]
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+    # hourly_rate buckets only: min <= rate < max (max None = open-ended).
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+
+class TechnicianFacets(BaseModel):
+    skills: Optional[List[FacetCount]] = None
+    is_active: Optional[List[FacetCount]] = None
+    hourly_rate: Optional[List[FacetCount]] = None
+
+
 class PaginatedTechnicians(BaseModel):
     items: List[TechnicianOut]
     page: int
     page_size: int
-    total: int
-
+    total: Optional[int] = None
+    has_more: bool
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    facets: Optional[TechnicianFacets] = None
+
+
+
+class NearbyTechnician(BaseModel):
+    technician_id: UUID
+    first_name: str
+    last_name: str
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+class RouteStop(BaseModel):
+    job_id: int
+    title: str
+    customer_id: int
+    latitude: float
+    longitude: float
+    window_start: datetime
+    window_end: Optional[datetime] = None
+    arrival_at: datetime
+    departure_at: datetime
+    wait_minutes: float
+    late_minutes: float
+    leg_km: float
+
+
+class RoutePlan(BaseModel):
+    technician_id: UUID
+    date: date
+    stops: List[RouteStop]
+    unrouted_job_ids: List[int]
+    total_km: float
+    scheduled_order_km: float
+    drive_minutes: float
+    late_stops: int
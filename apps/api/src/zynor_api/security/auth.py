@@ -9,6 +9,12 @@ from passlib.context import CryptContext
 SECRET_KEY = os.getenv("JWT_SECRET", "dev-only")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_MIN = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+# How long a verified user lookup is reused before the database is asked again.
+PRINCIPAL_CACHE_SECONDS = float(os.getenv("PRINCIPAL_CACHE_SECONDS", "60"))
+# Authorize from a token's signed `uid`/`role` claims, checked only against
+# the user's cached `principal_changed_at`. A role change or deactivation
+# takes effect in other processes within PRINCIPAL_CACHE_SECONDS.
+TRUST_ROLE_CLAIMS = os.getenv("JWT_TRUST_ROLE_CLAIMS", "false").lower() in ("1", "true", "yes")
 
 
 # ---- Password hashing (bcrypt via passlib) ----
@@ -29,8 +35,9 @@ def create_access_token(data: Dict[str, Any], expires_minutes: int = ACCESS_MIN)
     Encodes a JWT with `sub` and any extra claims in `data`.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
-    to_encode.update({"exp": expire})
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=expires_minutes)
+    to_encode.update({"exp": expire, "iat": int(now.timestamp())})
     token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return token
 
@@ -38,9 +45,12 @@ def create_access_token(data: Dict[str, Any], expires_minutes: int = ACCESS_MIN)
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
-from ..db import SessionLocal
+from ..db import SessionLocal, get_session
 from ..models.user import User
+from ..services.cache import TTLCache
+from ..services.conflicts_service import as_utc
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -54,11 +64,70 @@ def get_db():
         db.close()
 
 
-async def get_current_user(
+# Verified active users by email, as (id, email, role).
+principal_cache = TTLCache(ttl_seconds=PRINCIPAL_CACHE_SECONDS, max_entries=4096)
+
+# Each user's persisted `principal_changed_at` by email, as a Unix timestamp
+# (0 if never changed). Only saves the lookup: after an eviction or restart
+# the value is read back from the row.
+principal_changes = TTLCache(ttl_seconds=PRINCIPAL_CACHE_SECONDS, max_entries=4096)
+
+_PENDING_INVALIDATIONS = "principal_invalidations"
+
+
+def invalidate_principal(*emails: str) -> None:
+    """Forget cached lookups for these users."""
+    for email in emails:
+        if email:
+            principal_cache.invalidate(email)
+            principal_changes.invalidate(email)
+
+
+@event.listens_for(User, "before_update")
+def _stamp_principal_change(mapper, connection, target) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("email", "role", "is_active")):
+        target.principal_changed_at = datetime.now(timezone.utc)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target) -> None:
+    state = inspect(target)
+    emails = {target.email}
+    for name in ("email", "role", "is_active"):
+        history = state.attrs[name].history
+        if history.deleted:
+            emails.update(history.deleted)
+    invalidate_principal(*emails)
+    # Drop entries cached again from the old row before the commit, too.
+    if state.session is not None:
+        state.session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_principal_invalidations(session) -> None:
+    emails = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if emails:
+        invalidate_principal(*emails)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_principal_invalidations(session, previous_transaction) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_session),
 ) -> User:
-    """Decode token, fetch active user, or raise 401."""
+    """
+    Decode token and return the active user, or raise 401. The user is a
+    detached snapshot: from the token's own claims when those are trusted
+    and postdate the user's last change, else from `principal_cache`, else
+    from one lookup. Runs in the
+    threadpool, so a lookup never blocks the event loop.
+    """
     cred_exc = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -73,10 +142,26 @@ async def get_current_user(
     except JWTError:
         raise cred_exc
 
-    user = db.query(User).filter(User.email == email, User.is_active == True).first()
-    if not user:
-        raise cred_exc
-    return user
+    if TRUST_ROLE_CLAIMS and isinstance(payload.get("uid"), int) and isinstance(payload.get("role"), str):
+        changed_at = principal_changes.get(email)
+        if changed_at is None:
+            row = db.query(User.principal_changed_at).filter(User.email == email).first()
+            if not row:
+                raise cred_exc
+            changed_at = as_utc(row[0]).timestamp() if row[0] is not None else 0.0
+            principal_changes.set(email, changed_at)
+        if payload.get("iat", 0) > changed_at:
+            return User(id=payload["uid"], email=email, role=payload["role"], is_active=True)
+
+    principal = principal_cache.get(email)
+    if principal is None:
+        row = db.query(User.id, User.email, User.role).filter(User.email == email, User.is_active == True).first()
+        if not row:
+            raise cred_exc
+        principal = tuple(row)
+        principal_cache.set(email, principal)
+    user_id, email, role = principal
+    return User(id=user_id, email=email, role=role, is_active=True)
 
 
 def require_roles(*roles: str):
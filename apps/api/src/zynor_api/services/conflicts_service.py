@@ -0,0 +1,259 @@
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..models.job import Job
+
+
+# Jobs in these statuses no longer hold a slot on the technician's calendar.
+NON_BLOCKING_STATUSES = {"CANCELLED"}
+
+# Name of the Postgres exclusion constraint (see migration 9f3c2a7e5b14).
+EXCLUSION_CONSTRAINT = "ex_jobs_technician_no_overlap"
+
+
+def as_utc(value: datetime) -> datetime:
+    """Comparable UTC datetime; naive values (SQLite) are taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def is_blocking(technician_id, start, end, status) -> bool:
+    """Whether a job with these values occupies a slot on a technician's calendar."""
+    return (
+        technician_id is not None
+        and start is not None
+        and end is not None
+        and status not in NON_BLOCKING_STATUSES
+    )
+
+
+def uses_range_types(db: Session) -> bool:
+    """Postgres enforces and indexes bookings itself; elsewhere we do it in-process."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+class _TechnicianBookings:
+    """
+    One technician's bookings as a start-sorted list of (start, end, job_id).
+    `max_len` bounds the longest booking, so every interval overlapping
+    [s, e) starts inside [s - max_len, e): one bisect, then a scan of every
+    entry starting in that window. With bookings of similar length that
+    window holds little more than the hits, but one very long booking widens
+    it for every lookup. `max_len` only grows; removals leave it a valid
+    upper bound. Inserts and removals shift the list, O(n) per technician.
+    """
+
+    __slots__ = ("entries", "max_len")
+
+    def __init__(self):
+        self.entries: list = []
+        self.max_len = timedelta(0)
+
+    def add(self, start: datetime, end: datetime, job_id: int) -> None:
+        insort(self.entries, (start, end, job_id))
+        if end - start > self.max_len:
+            self.max_len = end - start
+
+    def remove(self, start: datetime, end: datetime, job_id: int) -> None:
+        pos = bisect_left(self.entries, (start, end, job_id))
+        if pos < len(self.entries) and self.entries[pos][2] == job_id:
+            del self.entries[pos]
+
+    def overlapping(self, start: datetime, end: datetime) -> List[int]:
+        hits = []
+        pos = bisect_left(self.entries, (start - self.max_len,))
+        while pos < len(self.entries) and self.entries[pos][0] < end:
+            if self.entries[pos][1] > start:
+                hits.append(self.entries[pos][2])
+            pos += 1
+        return hits
+
+
+class BookingIndex:
+    """
+    In-process per-technician interval index used where the database has
+    no range types (SQLite). A technician's bookings are loaded on first
+    use and kept current by the job service after each commit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_tech: dict = {}
+        self._by_job: dict = {}
+        # Bumped on every change, so a load that raced a write is not cached.
+        self._generation = 0
+
+    def _load(self, db: Session, technician_id: UUID) -> List[tuple]:
+        rows = db.execute(
+            select(Job.id, Job.scheduled_start_at, Job.scheduled_end_at).where(
+                Job.technician_id == technician_id,
+                Job.scheduled_start_at.isnot(None),
+                Job.scheduled_end_at.isnot(None),
+                Job.status.notin_(NON_BLOCKING_STATUSES),
+            )
+        )
+        return [(job_id, as_utc(start), as_utc(end)) for job_id, start, end in rows]
+
+    def overlapping(self, db: Session, technician_id: UUID, start: datetime, end: datetime) -> List[int]:
+        start, end = as_utc(start), as_utc(end)
+        with self._lock:
+            bookings = self._by_tech.get(technician_id)
+            if bookings is not None:
+                return bookings.overlapping(start, end)
+            generation = self._generation
+
+        # Query without the lock so one technician's load doesn't stall
+        # every other conflict check.
+        loaded = _TechnicianBookings()
+        rows = self._load(db, technician_id)
+        for job_id, job_start, job_end in rows:
+            loaded.add(job_start, job_end, job_id)
+
+        with self._lock:
+            bookings = self._by_tech.get(technician_id)
+            if bookings is None and self._generation == generation:
+                bookings = self._by_tech[technician_id] = loaded
+                for job_id, job_start, job_end in rows:
+                    self._by_job[job_id] = (technician_id, job_start, job_end)
+            return (loaded if bookings is None else bookings).overlapping(start, end)
+
+    def discard(self, job_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            previous = self._by_job.pop(job_id, None)
+            if previous is None:
+                return
+            technician_id, start, end = previous
+            bookings = self._by_tech.get(technician_id)
+            if bookings is not None:
+                bookings.remove(start, end, job_id)
+
+    def record(self, job_id: int, technician_id, start, end, status) -> None:
+        """Reflect a committed job: drop its old slot, add the new one if it blocks."""
+        self.discard(job_id)
+        if not is_blocking(technician_id, start, end, status):
+            return
+        with self._lock:
+            self._generation += 1
+            bookings = self._by_tech.get(technician_id)
+            # Unloaded technicians pick the row up from the DB on first use.
+            if bookings is None:
+                return
+            start, end = as_utc(start), as_utc(end)
+            bookings.add(start, end, job_id)
+            self._by_job[job_id] = (technician_id, start, end)
+
+    def evict(self, technician_id) -> None:
+        """Forget a technician; the next lookup reloads from the database."""
+        with self._lock:
+            self._generation += 1
+            bookings = self._by_tech.pop(technician_id, None)
+            if bookings is not None:
+                for _, _, job_id in bookings.entries:
+                    self._by_job.pop(job_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._by_tech.clear()
+            self._by_job.clear()
+
+
+booking_index = BookingIndex()
+
+
+def find_conflicts(
+    db: Session,
+    technician_id: UUID,
+    start: datetime,
+    end: datetime,
+    exclude_job_id: Optional[int] = None,
+) -> List[Job]:
+    """
+    Jobs already booked for the technician that overlap [start, end).
+    Postgres answers from the GiST index behind the exclusion constraint;
+    SQLite from the in-process booking index.
+    """
+    qry = db.query(Job)
+    if uses_range_types(db):
+        span = func.tstzrange(Job.scheduled_start_at, Job.scheduled_end_at, "[)")
+        qry = qry.filter(
+            Job.technician_id == technician_id,
+            Job.scheduled_start_at.isnot(None),
+            Job.scheduled_end_at.isnot(None),
+            Job.status.notin_(NON_BLOCKING_STATUSES),
+            span.op("&&")(func.tstzrange(start, end, "[)")),
+        )
+    else:
+        ids = booking_index.overlapping(db, technician_id, start, end)
+        if not ids:
+            return []
+        qry = qry.filter(Job.id.in_(ids))
+    if exclude_job_id is not None:
+        qry = qry.filter(Job.id != exclude_job_id)
+    return qry.order_by(Job.scheduled_start_at, Job.id).all()
+
+
+def busy_technicians(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    exclude_job_id: Optional[int] = None,
+) -> set:
+    """Ids of technicians with a blocking job overlapping [start, end)."""
+    stmt = select(Job.technician_id).distinct().where(
+        Job.technician_id.isnot(None),
+        Job.scheduled_start_at.isnot(None),
+        Job.scheduled_end_at.isnot(None),
+        Job.status.notin_(NON_BLOCKING_STATUSES),
+    )
+    if uses_range_types(db):
+        span = func.tstzrange(Job.scheduled_start_at, Job.scheduled_end_at, "[)")
+        stmt = stmt.where(span.op("&&")(func.tstzrange(start, end, "[)")))
+    else:
+        stmt = stmt.where(Job.scheduled_start_at < end, Job.scheduled_end_at > start)
+    if exclude_job_id is not None:
+        stmt = stmt.where(Job.id != exclude_job_id)
+    return set(db.execute(stmt).scalars())
+
+
+def ensure_schedule_available(
+    db: Session,
+    technician_id,
+    start,
+    end,
+    status,
+    job_id: Optional[int] = None,
+) -> None:
+    """Raise 422 for an inverted window and 409 if the slot is already taken."""
+    if start is not None and end is not None and as_utc(end) <= as_utc(start):
+        raise HTTPException(status_code=422, detail="scheduled_end_at must be after scheduled_start_at")
+    if not is_blocking(technician_id, start, end, status):
+        return
+    clashes = find_conflicts(db, technician_id, start, end, exclude_job_id=job_id)
+    if clashes:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Technician is already booked: overlaps job(s) {', '.join(str(j.id) for j in clashes)}",
+        )
+
+
+def is_overlap_violation(exc: IntegrityError) -> bool:
+    """True when Postgres rejected a write through the no-overlap exclusion constraint."""
+    return EXCLUSION_CONSTRAINT in str(exc.orig)
+
+
+def record_jobs(jobs: Iterable[Job]) -> None:
+    """Update the in-process booking index after jobs were committed."""
+    for job in jobs:
+        booking_index.record(
+            job.id, job.technician_id, job.scheduled_start_at, job.scheduled_end_at, job.status
+        )
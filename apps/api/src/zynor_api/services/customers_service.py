@@ -1,18 +1,229 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
 from fastapi import HTTPException, status
+from sqlalchemy import delete, func, literal, select, union_all, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from ..models.customer import Customer
-from ..routers.customers.schemas import CustomerCreate, CustomerUpdate
+from ..models.job import Job, TERMINAL_JOB_STATUSES
+from ..models.job_series import JobSeries
+from ..models.technician import Technician
+from ..routers.customers.schemas import CustomerCreate, CustomerUpdate, Customer as CustomerSchema
+from .cache import TTLCache
+from .etags import CONCURRENT_UPDATE, list_etag
+from .fieldsets import parse_fields, project
+from .pagination import cursor_key, decode_cursor, encode_cursor, keyset_after, keyset_order, parse_cursor_key
+from .search_service import customer_search
+from .schedule_service import invalidate_schedule, schedule_cache
+from .events_service import publish_change
+
+
+# Keyset sort keys of the customer list, each matching an index.
+CUSTOMER_SORT_KEYS = {
+    "name": (Customer.name, Customer.id),
+    "id": (Customer.id,),
+}
+
+
+def _customer_page(
+    db: Session,
+    limit: int,
+    cursor: Optional[str],
+    sort: str,
+    q: Optional[str],
+):
+    """
+    The query for one page (plus one row to detect the next) and its sort
+    key columns. Search narrows the set; rows still come in keyset order,
+    so the cost is bounded by `limit` and the matches, not the table.
+    """
+    descending = sort.startswith("-")
+    name = sort[1:] if descending else sort
+    cols = CUSTOMER_SORT_KEYS.get(name)
+    if cols is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unsupported sort: {sort}. Use one of: {', '.join(sorted(CUSTOMER_SORT_KEYS))}",
+        )
+    qry = db.query(Customer)
+    if q:
+        qry, _ = customer_search(db).apply(qry, q)
+    if cursor:
+        values = parse_cursor_key(cols, decode_cursor(cursor, sort))
+        qry = qry.filter(keyset_after(cols, values, descending))
+    return qry.order_by(*keyset_order(cols, descending)).limit(limit + 1), cols
 
 
-def list_customers(db: Session) -> list[Customer]:
-    return db.query(Customer).all()
+def customers_list_etag(
+    db: Session,
+    *salt,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "name",
+    q: Optional[str] = None,
+) -> str:
+    """
+    ETag of one customer page from an aggregate over just that page's rows,
+    so revalidating costs the same bounded index range as the page itself.
+    """
+    page, _ = _customer_page(db, limit, cursor, sort, q)
+    rows = page.with_entities(Customer.id, Customer.version, Customer.updated_at).subquery()
+    aggregates = db.execute(
+        select(func.count(), func.sum(rows.c.id), func.sum(rows.c.version), func.max(rows.c.updated_at))
+    ).one()
+    return list_etag(aggregates, *salt)
+
+
+def list_customers(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "name",
+    q: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> dict:
+    columns = parse_fields(fields, CustomerSchema.model_fields)
+    qry, cols = _customer_page(db, limit, cursor, sort, q)
+    if columns is not None:
+        # The cursor needs the sort key even if not requested.
+        qry = qry.with_entities(*(getattr(Customer, c) for c in dict.fromkeys([*columns, *(c.key for c in cols)])))
+    rows = qry.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort, cursor_key(cols, rows[-1]))
+    return {
+        "items": rows if columns is None else project(rows, columns),
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
 
 
 def get_customer(db: Session, customer_id: int) -> Customer | None:
     return db.get(Customer, customer_id)
 
 
+# Keyed by (customer_id, jobs_limit, jobs_cursor); writes to a customer or
+# its jobs drop that customer's entries. The TTL bounds how stale "next
+# visit" can get as time passes.
+overview_cache = TTLCache(ttl_seconds=15, max_entries=1024)
+
+# Recent jobs of a customer, newest first, over ix_jobs_customer_id_scheduled_start_at_id.
+OVERVIEW_JOB_KEY = (Job.scheduled_start_at, Job.id)
+
+
+def invalidate_overview(*customer_ids) -> None:
+    ids = {i for i in customer_ids if i is not None}
+    if ids:
+        overview_cache.invalidate_where(lambda key: key[0] in ids)
+
+
+def customer_overview(
+    db: Session,
+    customer_id: int,
+    jobs_limit: int = 10,
+    jobs_cursor: Optional[str] = None,
+) -> dict:
+    """
+    A customer with a page of its most recent jobs, job counts by status,
+    the next open scheduled visit and the technician of the latest visit.
+    Apart from the customer row this is two queries on the customer's
+    slice of the jobs index: a GROUP BY for the counts and a UNION ALL of
+    three bounded seeks (the page, the next visit, the last visit).
+    """
+    key = (customer_id, jobs_limit, jobs_cursor)
+    cached = overview_cache.get(key)
+    if cached is not None:
+        return cached
+
+    obj = db.get(Customer, customer_id)
+    if obj is None:
+        raise HTTPException(status_code=404, detail="Customer not found")
+
+    counts = dict(
+        db.execute(
+            select(Job.status, func.count()).where(Job.customer_id == customer_id).group_by(Job.status)
+        ).all()
+    )
+
+    now = datetime.now(timezone.utc)
+    columns = (
+        Job.id, Job.title, Job.status, Job.scheduled_start_at, Job.scheduled_end_at,
+        Job.technician_id, Technician.first_name, Technician.last_name,
+    )
+
+    def seek(kind, *criteria, order, limit):
+        return select(*columns, literal(kind).label("kind")).outerjoin(
+            Technician, Technician.id == Job.technician_id
+        ).where(Job.customer_id == customer_id, *criteria).order_by(*order).limit(limit).subquery()
+
+    page = []
+    if jobs_cursor:
+        values = parse_cursor_key(OVERVIEW_JOB_KEY, decode_cursor(jobs_cursor, "overview"))
+        page.append(keyset_after(OVERVIEW_JOB_KEY, values, descending=True))
+    parts = [
+        seek("recent", *page, order=keyset_order(OVERVIEW_JOB_KEY, descending=True), limit=jobs_limit + 1),
+        seek(
+            "next",
+            Job.scheduled_start_at >= now,
+            Job.status.notin_(TERMINAL_JOB_STATUSES),
+            order=keyset_order(OVERVIEW_JOB_KEY, descending=False),
+            limit=1,
+        ),
+        seek(
+            "last",
+            Job.scheduled_start_at < now,
+            Job.technician_id.isnot(None),
+            order=keyset_order(OVERVIEW_JOB_KEY, descending=True),
+            limit=1,
+        ),
+    ]
+    rows = db.execute(union_all(*(select(p) for p in parts))).all()
+
+    def summary(row):
+        return {
+            "id": row.id,
+            "title": row.title,
+            "status": row.status,
+            "scheduled_start_at": row.scheduled_start_at,
+            "scheduled_end_at": row.scheduled_end_at,
+            "technician_id": row.technician_id,
+        }
+
+    # UNION ALL keeps no order across its parts; restore the page order.
+    recent = sorted(
+        (r for r in rows if r.kind == "recent"),
+        key=lambda r: (r.scheduled_start_at is None, r.scheduled_start_at or datetime.min, r.id),
+        reverse=True,
+    )
+    next_cursor = None
+    if len(recent) > jobs_limit:
+        recent = recent[:jobs_limit]
+        next_cursor = encode_cursor("overview", cursor_key(OVERVIEW_JOB_KEY, recent[-1]))
+    next_visit = next((r for r in rows if r.kind == "next"), None)
+    last_visit = next((r for r in rows if r.kind == "last"), None)
+
+    result = {
+        "customer": {c.key: getattr(obj, c.key) for c in Customer.__table__.columns},
+        "job_count": sum(counts.values()),
+        "status_counts": counts,
+        "next_visit": summary(next_visit) if next_visit else None,
+        "last_technician": {
+            "technician_id": last_visit.technician_id,
+            "first_name": last_visit.first_name,
+            "last_name": last_visit.last_name,
+            "job_id": last_visit.id,
+            "visited_at": last_visit.scheduled_start_at,
+        } if last_visit else None,
+        "recent_jobs": [summary(r) for r in recent],
+        "next_cursor": next_cursor,
+    }
+    overview_cache.set(key, result)
+    return result
+
+
 def create_customer(db: Session, customer_in: CustomerCreate) -> Customer:
     fields = {
         "name": customer_in.name.strip(),
@@ -23,6 +234,10 @@ def create_customer(db: Session, customer_in: CustomerCreate) -> Customer:
         fields["email"] = str(customer_in.email).lower()
     if customer_in.address is not None and customer_in.address != "":
         fields["address"] = customer_in.address.strip()
+    if customer_in.latitude is not None:
+        fields["latitude"] = customer_in.latitude
+    if customer_in.longitude is not None:
+        fields["longitude"] = customer_in.longitude
 
     obj = Customer(**fields)
     db.add(obj)
@@ -32,6 +247,7 @@ def create_customer(db: Session, customer_in: CustomerCreate) -> Customer:
         db.rollback()
         raise
     db.refresh(obj)
+    publish_change("customer", "created", obj.id)
     return obj
 
 
@@ -51,6 +267,10 @@ def update_customer(db: Session, customer_id: int, customer_in: CustomerUpdate)
         obj.email = str(update_data["email"]).lower() if update_data["email"] else None
     if "address" in update_data:
         obj.address = update_data["address"].strip() if update_data["address"] else None
+    if "latitude" in update_data:
+        obj.latitude = update_data["latitude"]
+    if "longitude" in update_data:
+        obj.longitude = update_data["longitude"]
 
     db.add(obj)
     try:
@@ -58,7 +278,12 @@ def update_customer(db: Session, customer_id: int, customer_in: CustomerUpdate)
     except IntegrityError:
         db.rollback()
         raise
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
     db.refresh(obj)
+    invalidate_overview(obj.id)
+    publish_change("customer", "updated", obj.id)
     return obj
 
 
@@ -68,16 +293,83 @@ def delete_customer(db: Session, customer_id: int) -> None:
         raise HTTPException(status_code=404, detail="Customer not found")
 
     db.delete(obj)
-    db.commit()
-
-
-
-
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
+    invalidate_overview(customer_id)
+    publish_change("customer", "deleted", customer_id)
 
 
+# Contact fields a merge copies from a duplicate when the target has none.
+MERGE_FILL_FIELDS = ("phone", "email", "address")
 
 
+def merge_customers(db: Session, customer_id: int, duplicate_ids: List[int]) -> dict:
+    """
+    Fold duplicates into `customer_id` in one transaction: their jobs and
+    series are re-pointed to it, contact fields it lacks are taken from
+    them (in the order given), and they are deleted. All rows are locked
+    first, so a concurrent write to any of them waits for the merge.
+    """
+    duplicate_ids = list(dict.fromkeys(duplicate_ids))
+    if customer_id in duplicate_ids:
+        raise HTTPException(status_code=422, detail="Cannot merge a customer into itself")
 
+    ids = [customer_id, *duplicate_ids]
+    found = {
+        c.id: c
+        for c in db.execute(select(Customer).where(Customer.id.in_(ids)).with_for_update()).scalars()
+    }
+    missing = [i for i in ids if i not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Customer(s) not found: {', '.join(map(str, missing))}")
 
+    obj = found[customer_id]
+    for dup_id in duplicate_ids:
+        dup = found[dup_id]
+        for name in MERGE_FILL_FIELDS:
+            if getattr(obj, name) is None and getattr(dup, name) is not None:
+                setattr(obj, name, getattr(dup, name))
+        if obj.latitude is None and obj.longitude is None and dup.latitude is not None:
+            obj.latitude, obj.longitude = dup.latitude, dup.longitude
 
+    moved = db.execute(
+        update(Job)
+        .where(Job.customer_id.in_(duplicate_ids))
+        .values(customer_id=customer_id, version=Job.version + 1)
+        .returning(Job.id, Job.scheduled_start_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+    series_moved = db.execute(
+        update(JobSeries)
+        .where(JobSeries.customer_id.in_(duplicate_ids))
+        .values(customer_id=customer_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.flush()
+    for dup_id in duplicate_ids:
+        db.expunge(found[dup_id])
+    db.execute(
+        delete(Customer).where(Customer.id.in_(duplicate_ids)).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(obj)
 
+    invalidate_overview(customer_id, *duplicate_ids)
+    if series_moved:
+        # Expanded occurrences carry the series' customer in every window.
+        schedule_cache.clear()
+    else:
+        invalidate_schedule(*(start for _, start in moved))
+    if moved:
+        publish_change("job", "updated", *(job_id for job_id, _ in moved))
+    publish_change("customer", "deleted", *duplicate_ids)
+    publish_change("customer", "updated", customer_id)
+    return {
+        "customer": obj,
+        "merged_ids": duplicate_ids,
+        "jobs_moved": len(moved),
+        "series_moved": series_moved,
+    }
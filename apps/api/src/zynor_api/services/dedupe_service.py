@@ -0,0 +1,218 @@
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.customer import Customer
+
+
+# Blocks with more members than this (a shared office phone or address) are
+# split by name prefix before pairing, since pairing them whole would be
+# quadratic; sub-blocks still this large are skipped and reported.
+MAX_BLOCK_SIZE = 50
+
+# Leading letters of each name word that sub-block an oversized block.
+NAME_PREFIX = 3
+
+# Relative weight of each field in a pair's score; only fields present on
+# both sides count.
+FIELD_WEIGHTS = {"name": 0.4, "phone": 0.25, "email": 0.25, "address": 0.2}
+
+# A field "agrees" (and is listed in the pair's reasons) at this similarity.
+AGREEMENT = 0.85
+
+ADDRESS_ABBREVIATIONS = {
+    "street": "st", "str": "st",
+    "road": "rd",
+    "avenue": "ave", "av": "ave",
+    "boulevard": "blvd",
+    "drive": "dr",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "square": "sq",
+    "terrace": "ter",
+    "highway": "hwy",
+    "parkway": "pkwy",
+    "apartment": "apt",
+    "suite": "ste",
+    "north": "n", "south": "s", "east": "e", "west": "w",
+}
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _fold(value: str) -> str:
+    """Lower case without diacritics."""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Digits only, keeping the last ten so country and trunk prefixes don't matter."""
+    if not phone:
+        return None
+    digits = "".join(c for c in phone if c.isdigit())
+    if len(digits) < 7:
+        return None
+    return digits[-10:]
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    email = (email or "").strip().lower()
+    return email or None
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Folded words in sorted order, so "Smith, John" matches "John Smith"."""
+    return " ".join(sorted(_WORD_RE.findall(_fold(name or ""))))
+
+
+def address_tokens(address: Optional[str]) -> Tuple[str, ...]:
+    """Folded words with common street abbreviations applied."""
+    return tuple(ADDRESS_ABBREVIATIONS.get(w, w) for w in _WORD_RE.findall(_fold(address or "")))
+
+
+def address_key(tokens: Tuple[str, ...]) -> Optional[str]:
+    """House number plus the first street word, or None without a number."""
+    number = next((t for t in tokens if t.isdigit()), None)
+    word = next((t for t in tokens if not t.isdigit()), None)
+    if number is None or word is None:
+        return None
+    return f"{number} {word}"
+
+
+class CustomerKey(NamedTuple):
+    """The normalized fields of one customer that blocking and scoring use."""
+    id: int
+    name: str
+    phone: Optional[str]
+    email: Optional[str]
+    address: Tuple[str, ...]
+
+
+def customer_key(id, name, phone, email, address) -> CustomerKey:
+    return CustomerKey(id, normalize_name(name), normalize_phone(phone), normalize_email(email), address_tokens(address))
+
+
+def blocking_keys(c: CustomerKey) -> Iterator[tuple]:
+    if c.phone:
+        yield ("phone", c.phone)
+    if c.email:
+        yield ("email", c.email)
+    key = address_key(c.address)
+    if key:
+        yield ("address", key)
+
+
+def _name_similarity(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    # quick_ratio is an upper bound; skip the full comparison when it can't agree.
+    if matcher.quick_ratio() < AGREEMENT:
+        return matcher.quick_ratio()
+    return matcher.ratio()
+
+
+def _jaccard(a: Tuple[str, ...], b: Tuple[str, ...]) -> float:
+    sa, sb = set(a), set(b)
+    return len(sa & sb) / len(sa | sb)
+
+
+def score_pair(a: CustomerKey, b: CustomerKey) -> Tuple[float, List[str]]:
+    """Weighted similarity in [0, 1] over the fields both have, and the fields that agree."""
+    similarities = {}
+    if a.name and b.name:
+        similarities["name"] = _name_similarity(a.name, b.name)
+    if a.phone and b.phone:
+        similarities["phone"] = float(a.phone == b.phone)
+    if a.email and b.email:
+        similarities["email"] = float(a.email == b.email)
+    if a.address and b.address:
+        similarities["address"] = _jaccard(a.address, b.address)
+    weight = sum(FIELD_WEIGHTS[f] for f in similarities)
+    if not weight:
+        return 0.0, []
+    score = sum(FIELD_WEIGHTS[f] * s for f, s in similarities.items()) / weight
+    return score, [f for f, s in similarities.items() if s >= AGREEMENT]
+
+
+def _sub_blocks(keys: List[CustomerKey], members: List[int]) -> dict:
+    """An oversized block's members grouped by the prefixes of their name words."""
+    blocks = defaultdict(list)
+    for i in members:
+        for prefix in {word[:NAME_PREFIX] for word in keys[i].name.split()} or {""}:
+            blocks[prefix].append(i)
+    return blocks
+
+
+def candidate_pairs(
+    keys: List[CustomerKey],
+    max_block_size: int = MAX_BLOCK_SIZE,
+    skipped: Optional[list] = None,
+) -> set:
+    """
+    Index pairs (i < j into `keys`) sharing at least one blocking key. Only
+    rows that collide on a normalized phone, email or house number + street
+    are ever compared, so the work follows the number of near-duplicates
+    rather than the square of the table. Oversized blocks are only paired
+    within a shared name prefix; keys that stay too large are appended to
+    `skipped` as (key, prefix, size).
+    """
+    blocks = defaultdict(list)
+    for i, c in enumerate(keys):
+        for key in blocking_keys(c):
+            blocks[key].append(i)
+    pairs = set()
+    for key, members in blocks.items():
+        groups = {None: members}
+        if len(members) > max_block_size:
+            groups = _sub_blocks(keys, members)
+        for prefix, group in groups.items():
+            if len(group) > max_block_size:
+                if skipped is not None:
+                    skipped.append((key, prefix, len(group)))
+                continue
+            for x in range(len(group)):
+                for y in range(x + 1, len(group)):
+                    pairs.add((group[x], group[y]))
+    return pairs
+
+
+def find_duplicates(
+    db: Session,
+    min_score: float = 0.8,
+    max_block_size: int = MAX_BLOCK_SIZE,
+    batch_size: int = 10000,
+    skipped: Optional[list] = None,
+) -> List[dict]:
+    """
+    Likely duplicate customer pairs, best first. Customers are streamed in
+    batches and kept only as their normalized keys; each candidate pair
+    from `candidate_pairs` is scored once. Blocks too large to pair are
+    appended to `skipped`.
+    """
+    stmt = (
+        select(Customer.id, Customer.name, Customer.phone, Customer.email, Customer.address)
+        .order_by(Customer.id)
+        .execution_options(yield_per=batch_size)
+    )
+    keys = [customer_key(*row) for row in db.execute(stmt)]
+
+    duplicates = []
+    for i, j in candidate_pairs(keys, max_block_size, skipped):
+        a, b = keys[i], keys[j]
+        score, reasons = score_pair(a, b)
+        if score >= min_score:
+            duplicates.append({
+                "customer_id": a.id,
+                "duplicate_id": b.id,
+                "score": round(score, 3),
+                "reasons": reasons,
+            })
+    duplicates.sort(key=lambda d: (-d["score"], d["customer_id"], d["duplicate_id"]))
+    return duplicates
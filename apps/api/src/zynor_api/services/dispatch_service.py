@@ -0,0 +1,211 @@
+import heapq
+import threading
+import time
+from collections import Counter
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from ..models.job import Job, TERMINAL_JOB_STATUSES
+from ..models.technician import Technician
+from .conflicts_service import busy_technicians
+
+
+# Relative weight of each signal in the final score (sums to 1).
+SKILL_WEIGHT = 0.5
+LOAD_WEIGHT = 0.3
+FIT_WEIGHT = 0.2
+
+
+class RosterSnapshot:
+    """
+    Columnar, in-memory view of the active technician roster for scoring.
+
+    Parallel lists hold one slot per technician (id, name, skill bitmask,
+    alive flag). Skills are interned to bit positions so a skill match is an
+    AND plus a popcount. The snapshot is refreshed at most every
+    `refresh_seconds` (or right after `invalidate()`): technicians changed
+    since the last refresh are upserted in place and open-job loads are
+    re-aggregated in one grouped query. Job writes in this process adjust
+    the loads through `move_jobs()` instead, so they don't force that
+    query. A full rebuild every `rebuild_seconds` compacts tombstoned slots.
+    Readers go through `rank()`, which holds the lock, so a concurrent
+    refresh never hands them half-rebuilt lists.
+    """
+
+    def __init__(self, refresh_seconds: float = 5.0, rebuild_seconds: float = 300.0):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.ids: list = []
+        self.names: list = []
+        self.masks: list = []
+        self.alive: list = []
+        self.slot: dict = {}
+        self.skill_bits: dict = {}
+        self.loads: dict = {}
+        self._high_water = None
+        self._next_refresh = 0.0
+        self._next_rebuild = 0.0
+
+    def invalidate(self) -> None:
+        """Make the next read pick up recent writes."""
+        self._next_refresh = 0.0
+
+    def move_jobs(self, before: Iterable = (), after: Iterable = ()) -> None:
+        """
+        Reflect committed job writes in the open-job loads. `before` and
+        `after` are (technician_id, status) pairs for the jobs' old and new
+        values; a created job has no `before`, a deleted one no `after`.
+        """
+        deltas = Counter()
+        for tech_id, status in before:
+            if tech_id is not None and status not in TERMINAL_JOB_STATUSES:
+                deltas[tech_id] -= 1
+        for tech_id, status in after:
+            if tech_id is not None and status not in TERMINAL_JOB_STATUSES:
+                deltas[tech_id] += 1
+        with self._lock:
+            for tech_id, delta in deltas.items():
+                if delta:
+                    self.loads[tech_id] = self.loads.get(tech_id, 0) + delta
+
+    def forget(self, technician_id: UUID) -> None:
+        with self._lock:
+            pos = self.slot.get(technician_id)
+            if pos is not None:
+                self.alive[pos] = False
+
+    def skill_mask(self, skills) -> int:
+        mask = 0
+        for skill in skills or []:
+            key = skill.strip().lower()
+            bit = self.skill_bits.get(key)
+            if bit is None:
+                bit = self.skill_bits[key] = 1 << len(self.skill_bits)
+            mask |= bit
+        return mask
+
+    def required_mask(self, skills) -> int:
+        """Mask of the known skills among `skills`, without interning new ones."""
+        mask = 0
+        for skill in skills or []:
+            mask |= self.skill_bits.get(skill.strip().lower(), 0)
+        return mask
+
+    def _upsert(self, tech_id, first_name, last_name, skills, is_active) -> None:
+        pos = self.slot.get(tech_id)
+        if pos is None:
+            if not is_active:
+                return
+            self.slot[tech_id] = len(self.ids)
+            self.ids.append(tech_id)
+            self.names.append((first_name, last_name))
+            self.masks.append(self.skill_mask(skills))
+            self.alive.append(True)
+            return
+        self.names[pos] = (first_name, last_name)
+        self.masks[pos] = self.skill_mask(skills)
+        self.alive[pos] = bool(is_active)
+
+    def refresh(self, db: Session) -> None:
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return
+        with self._lock:
+            if now < self._next_refresh:
+                return
+            if now >= self._next_rebuild:
+                self._reset()
+                self._next_rebuild = now + self.rebuild_seconds
+
+            stmt = select(
+                Technician.id,
+                Technician.first_name,
+                Technician.last_name,
+                Technician.skills,
+                Technician.is_active,
+                Technician.updated_at,
+            )
+            if self._high_water is not None:
+                # >= so rows sharing the last timestamp are never skipped;
+                # re-applying them is idempotent.
+                stmt = stmt.where(Technician.updated_at >= self._high_water)
+            for tech_id, first_name, last_name, skills, is_active, updated_at in db.execute(stmt):
+                self._upsert(tech_id, first_name, last_name, skills, is_active is not False)
+                if self._high_water is None or updated_at > self._high_water:
+                    self._high_water = updated_at
+
+            self.loads = dict(
+                db.execute(
+                    select(Job.technician_id, func.count())
+                    .where(Job.technician_id.isnot(None), Job.status.notin_(TERMINAL_JOB_STATUSES))
+                    .group_by(Job.technician_id)
+                ).all()
+            )
+            self._next_refresh = now + self.refresh_seconds
+
+    def rank(self, skills: Optional[List[str]], busy: set, k: int) -> List[dict]:
+        """Score every live technician under the lock and return the top `k`."""
+        n_required = len({s.strip().lower() for s in skills or []})
+        with self._lock:
+            required = self.required_mask(skills)
+            ids, masks, alive, loads = self.ids, self.masks, self.alive, self.loads
+
+            def scored():
+                for pos in range(len(ids)):
+                    if not alive[pos]:
+                        continue
+                    tech_id = ids[pos]
+                    skill = (masks[pos] & required).bit_count() / n_required if n_required else 1.0
+                    load = loads.get(tech_id, 0)
+                    available = tech_id not in busy
+                    score = SKILL_WEIGHT * skill + LOAD_WEIGHT / (1 + load) + FIT_WEIGHT * available
+                    yield score, pos, skill, load, available
+
+            top = heapq.nlargest(k, scored(), key=lambda r: r[0])
+            return [
+                {
+                    "technician_id": ids[pos],
+                    "first_name": self.names[pos][0],
+                    "last_name": self.names[pos][1],
+                    "score": round(score, 4),
+                    "skill_match": round(skill, 4),
+                    "open_jobs": load,
+                    "available": available,
+                }
+                for score, pos, skill, load, available in top
+            ]
+
+
+roster_snapshot = RosterSnapshot()
+
+
+def recommend_technicians(
+    db: Session,
+    job_id: int,
+    skills: Optional[List[str]] = None,
+    k: int = 10,
+) -> List[dict]:
+    """
+    Rank every active technician for a job in one pass over the roster
+    snapshot and return the top `k`.
+
+    score = SKILL_WEIGHT * share of required skills held
+          + LOAD_WEIGHT  * 1 / (1 + open jobs)
+          + FIT_WEIGHT   * (1 if free during the job's window else 0)
+    """
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    roster_snapshot.refresh(db)
+    busy = set()
+    if job.scheduled_start_at is not None and job.scheduled_end_at is not None:
+        busy = busy_technicians(db, job.scheduled_start_at, job.scheduled_end_at, exclude_job_id=job.id)
+    return roster_snapshot.rank(skills, busy, k)
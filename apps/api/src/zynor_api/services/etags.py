@@ -0,0 +1,43 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+# Detail of the 409 returned when an ORM write finds the row's version moved
+# on since it was read (StaleDataError): another request updated it first.
+CONCURRENT_UPDATE = "Modified by another request; reload and retry"
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag of one row: its version counter, bumped on every write."""
+    return f'"v{version}"'
+
+
+def entity_etag(db: Session, model, pk) -> Optional[str]:
+    """ETag of the row with primary key `pk`, reading only its version; None if missing."""
+    version = db.execute(select(model.version).where(model.id == pk)).scalar_one_or_none()
+    return None if version is None else version_etag(version)
+
+
+def list_etag(aggregates, *salt) -> str:
+    """Strong ETag from a row of aggregates over a page plus whatever else shapes it (`salt`)."""
+    digest = hashlib.sha1(repr((tuple(aggregates), salt)).encode("utf-8")).hexdigest()
+    return f'"{digest[:24]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 prescribes for GET)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
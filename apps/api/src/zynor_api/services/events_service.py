@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+
+class Event(NamedTuple):
+    id: int
+    topic: str
+    type: str
+    data: dict
+
+
+class Subscription:
+    """
+    One connected client. Events are handed over to the client's event loop
+    thread-safely and kept in a bounded queue; a client that falls behind
+    is flagged `overflowed` and should reconnect with its last event id.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, topics: Optional[set], queue_size: int):
+        self.loop = loop
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def wants(self, event: Event) -> bool:
+        return not self.topics or event.topic in self.topics
+
+    def deliver(self, events: List[Event]) -> None:
+        """Called from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, events)
+        except RuntimeError:
+            # The client's loop is gone; unsubscribe happens on its side.
+            pass
+
+    def _put(self, events: List[Event]) -> None:
+        for event in events:
+            if self.overflowed or not self.wants(event):
+                continue
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.overflowed = True
+
+
+class EventHub:
+    """
+    In-process broadcast of create/update/delete events. Keeps the last
+    `history` events so clients can resume from a Last-Event-ID; idle
+    clients only hold an empty queue.
+    """
+
+    def __init__(self, history: int = 1000, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._history: deque = deque(maxlen=history)
+        self._next_id = 1
+        self._subscribers: set = set()
+
+    def publish_many(self, events: Iterable[Tuple[str, str, dict]]) -> None:
+        with self._lock:
+            batch = []
+            for topic, type_, data in events:
+                batch.append(Event(self._next_id, topic, type_, data))
+                self._next_id += 1
+            self._history.extend(batch)
+            subscribers = list(self._subscribers)
+        if batch:
+            for sub in subscribers:
+                sub.deliver(batch)
+
+    def subscribe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        topics: Optional[set] = None,
+        last_event_id: Optional[int] = None,
+    ) -> Tuple[Subscription, List[Event], bool]:
+        """
+        Register a client. Returns the subscription, the buffered events
+        after `last_event_id`, and whether events were lost (the id is
+        older than the retained history, or one this hub never issued
+        because it came from another worker or an earlier process), in
+        which case the client should refetch its state.
+        """
+        sub = Subscription(loop, topics, self.queue_size)
+        with self._lock:
+            self._subscribers.add(sub)
+            backlog, gap = [], False
+            if last_event_id is not None:
+                oldest = self._history[0].id if self._history else self._next_id
+                gap = last_event_id < oldest - 1 or last_event_id >= self._next_id
+                backlog = [e for e in self._history if e.id > last_event_id and sub.wants(e)]
+        return sub, backlog, gap
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+event_hub = EventHub()
+
+
+def publish_change(entity: str, action: str, *ids) -> None:
+    """Broadcast e.g. ("job", "updated", 1, 2) as job.updated events on the "jobs" topic."""
+    event_hub.publish_many(
+        (f"{entity}s", f"{entity}.{action}", {"id": str(i) if not isinstance(i, int) else i})
+        for i in ids
+    )
+
+
+def format_sse(event: Event) -> str:
+    return f"id: {event.id}\nevent: {event.type}\ndata: {json.dumps(event.data)}\n\n"
@@ -0,0 +1,23 @@
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    Parse a sparse fieldset such as `fields=first_name,last_name` into the
+    column names to select (`id` is always included), or None when the
+    caller wants the full representation.
+    """
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(names) - set(allowed))
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown field(s): {', '.join(unknown)}")
+    return list(dict.fromkeys(["id", *names]))
+
+
+def project(rows, columns: List[str]) -> List[dict]:
+    """Turn column-only result rows into dicts holding just `columns`."""
+    return [{c: getattr(row, c) for c in columns} for row in rows]
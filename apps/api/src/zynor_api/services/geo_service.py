@@ -0,0 +1,221 @@
+import heapq
+import math
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.technician import Technician
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    h = math.sin((p2 - p1) / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+class TechnicianLocator:
+    """
+    In-memory uniform grid over active technicians with a location.
+
+    Cells are `cell_degrees` square; a k-nearest query scans rings of cells
+    outward from the query point and stops once the next ring cannot hold
+    anything closer than the k-th hit, so cost depends on local density
+    rather than fleet size. The technician service re-places a row right
+    after each committed write; rows changed elsewhere (by updated_at) are
+    picked up at most every `refresh_seconds`, with a full rebuild every
+    `rebuild_seconds`.
+    """
+
+    def __init__(self, cell_degrees: float = 0.05, refresh_seconds: float = 5.0, rebuild_seconds: float = 300.0):
+        self.cell_degrees = cell_degrees
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # cell -> {technician_id: (lat, lon, first_name, last_name, skills)}
+        self.cells: dict = {}
+        self.cell_of: dict = {}
+        self._bounds = None
+        self._high_water = None
+        self._next_refresh = 0.0
+        self._next_rebuild = 0.0
+
+    def _cell(self, lat: float, lon: float) -> tuple:
+        return (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+
+    def record(self, tech: Technician) -> None:
+        """Reflect a committed technician write."""
+        with self._lock:
+            self._place(
+                tech.id, tech.first_name, tech.last_name, tech.skills,
+                tech.is_active is not False, tech.latitude, tech.longitude,
+            )
+
+    def forget(self, technician_id) -> None:
+        with self._lock:
+            self._remove(technician_id)
+
+    def _remove(self, technician_id) -> None:
+        cell = self.cell_of.pop(technician_id, None)
+        if cell is not None:
+            members = self.cells[cell]
+            members.pop(technician_id, None)
+            if not members:
+                del self.cells[cell]
+
+    def _place(self, tech_id, first_name, last_name, skills, is_active, lat, lon) -> None:
+        self._remove(tech_id)
+        if not is_active or lat is None or lon is None:
+            return
+        cell = self._cell(lat, lon)
+        lowered = frozenset(s.strip().lower() for s in skills or [])
+        self.cells.setdefault(cell, {})[tech_id] = (lat, lon, first_name, last_name, lowered)
+        self.cell_of[tech_id] = cell
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            b = self._bounds
+            b[0], b[1] = min(b[0], cell[0]), max(b[1], cell[0])
+            b[2], b[3] = min(b[2], cell[1]), max(b[3], cell[1])
+
+    def refresh(self, db: Session) -> None:
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return
+        with self._lock:
+            if now < self._next_refresh:
+                return
+            if now >= self._next_rebuild:
+                self._reset()
+                self._next_rebuild = now + self.rebuild_seconds
+
+            stmt = select(
+                Technician.id,
+                Technician.first_name,
+                Technician.last_name,
+                Technician.skills,
+                Technician.is_active,
+                Technician.latitude,
+                Technician.longitude,
+                Technician.updated_at,
+            )
+            if self._high_water is not None:
+                stmt = stmt.where(Technician.updated_at >= self._high_water)
+            for tech_id, first_name, last_name, skills, is_active, lat, lon, updated_at in db.execute(stmt):
+                self._place(tech_id, first_name, last_name, skills, is_active is not False, lat, lon)
+                if self._high_water is None or updated_at > self._high_water:
+                    self._high_water = updated_at
+            self._next_refresh = now + self.refresh_seconds
+
+    def _ring(self, center: tuple, r: int):
+        """Cells at Chebyshev distance r from center, clipped to the occupied bounds."""
+        ci, cj = center
+        min_i, max_i, min_j, max_j = self._bounds
+        if r == 0:
+            yield center
+            return
+        for i in (ci - r, ci + r):
+            if min_i <= i <= max_i:
+                for j in range(max(cj - r, min_j), min(cj + r, max_j) + 1):
+                    yield (i, j)
+        for j in (cj - r, cj + r):
+            if min_j <= j <= max_j:
+                for i in range(max(ci - r + 1, min_i), min(ci + r - 1, max_i) + 1):
+                    yield (i, j)
+
+    def _ring_floor_km(self, lat: float, lon: float, center: tuple, r: int) -> float:
+        """
+        Lower bound on the distance from (lat, lon) to any technician r or
+        more rings out. A cell in ring r is r rows away and at least as many
+        columns as the bounds allow, or the other way round; feeding those
+        gaps (less the query's own cell) into the haversine formula, with the
+        bounds' most poleward latitude for the far end, gives a floor that
+        holds however far outside the fleet's area the query is.
+        """
+        cell = self.cell_degrees
+        ci, cj = center
+        min_i, max_i, min_j, max_j = self._bounds
+        min_rows = max(min_i - ci, ci - max_i, 0)
+        min_cols = max(min_j - cj, cj - max_j, 0)
+        poleward = min(90.0, max(abs(min_i * cell), abs((max_i + 1) * cell)))
+        # Columns don't wrap at the antimeridian, so a wide gap may be short the other way round.
+        spread = max(abs(lon - min_j * cell), abs((max_j + 1) * cell - lon))
+        cos_lat = math.cos(math.radians(lat)) * math.cos(math.radians(poleward))
+
+        def hav_rows(n: int) -> float:
+            return math.sin(math.radians(min(180.0, max(n - 1, 0) * cell)) / 2) ** 2
+
+        def hav_cols(n: int) -> float:
+            gap = max(0.0, min(max(n - 1, 0) * cell, 360.0 - spread))
+            return cos_lat * math.sin(math.radians(gap) / 2) ** 2
+
+        h = min(hav_rows(r) + hav_cols(min_cols), hav_rows(min_rows) + hav_cols(r))
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+    def nearest(self, lat: float, lon: float, k: int = 10, skill: Optional[str] = None) -> List[dict]:
+        """The k closest located, active technicians (optionally holding `skill`)."""
+        wanted = skill.strip().lower() if skill else None
+        with self._lock:
+            if self._bounds is None:
+                return []
+            center = self._cell(lat, lon)
+            min_i, max_i, min_j, max_j = self._bounds
+            max_r = max(center[0] - min_i, max_i - center[0], center[1] - min_j, max_j - center[1], 0)
+            # Rings closer than the bounds box are empty; start at the first
+            # one that touches it (0 when the point is inside the fleet's area).
+            min_r = max(min_i - center[0], center[0] - max_i, min_j - center[1], center[1] - max_j, 0)
+            # Upper bound on the cells one ring clipped to the bounds can visit.
+            perimeter = 2 * (max_i - min_i + max_j - min_j + 2)
+            heap: list = []  # max-heap of (-distance, id, ...) holding the best k
+
+            def consider(members):
+                for tech_id, row in members.items():
+                    if wanted is not None and wanted not in row[4]:
+                        continue
+                    d = haversine_km(lat, lon, row[0], row[1])
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d, str(tech_id), tech_id, row))
+                    elif d < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d, str(tech_id), tech_id, row))
+
+            for r in range(min_r, max_r + 1):
+                if len(heap) == k and r > 0 and self._ring_floor_km(lat, lon, center, r) > -heap[0][0]:
+                    break
+                if min(8 * r, perimeter) > len(self.cells):
+                    # Sparse grid (few matches, far-flung fleet): visiting the
+                    # occupied cells not yet scanned beats walking empty rings.
+                    for cell, members in self.cells.items():
+                        if max(abs(cell[0] - center[0]), abs(cell[1] - center[1])) >= r:
+                            consider(members)
+                    break
+                for cell in self._ring(center, r):
+                    members = self.cells.get(cell)
+                    if members:
+                        consider(members)
+        hits = sorted(((-neg, tech_id, row) for neg, _, tech_id, row in heap), key=lambda h: h[0])
+        return [
+            {
+                "technician_id": tech_id,
+                "first_name": row[2],
+                "last_name": row[3],
+                "latitude": row[0],
+                "longitude": row[1],
+                "distance_km": round(d, 3),
+            }
+            for d, tech_id, row in hits
+        ]
+
+
+technician_locator = TechnicianLocator()
+
+
+def nearest_technicians(db: Session, lat: float, lon: float, k: int = 10, skill: Optional[str] = None) -> List[dict]:
+    technician_locator.refresh(db)
+    return technician_locator.nearest(lat, lon, k=k, skill=skill)
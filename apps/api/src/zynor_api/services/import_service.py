@@ -0,0 +1,421 @@
+import csv
+import json
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import JSON, bindparam, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..models.customer import Customer
+from ..models.technician import Technician
+from ..models.technician_skill import TechnicianSkill
+from ..routers.customers.schemas import CustomerCreate
+from ..routers.technicians.schemas import TechnicianCreate
+from .customers_service import invalidate_overview
+from .dispatch_service import roster_snapshot
+from .geo_service import technician_locator
+from .stats_service import apply_rollup_deltas, rollup_deltas, technician_buckets
+from .technicians_service import normalize_skills
+from .events_service import publish_change
+
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Rows validated, looked up and written per transaction. Memory is bounded
+# by this, not by the size of the file.
+IMPORT_CHUNK_SIZE = 1000
+
+# Uploads larger than this are spooled to a temporary file.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+async def spool_upload(chunks: AsyncIterator[bytes]) -> tempfile.SpooledTemporaryFile:
+    """Buffer a request body in memory up to SPOOL_MAX_BYTES and on disk beyond."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    async for chunk in chunks:
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def _text_error(record: dict) -> Optional[str]:
+    """Why a record's text can't be stored, if it can't."""
+    for key, value in record.items():
+        for text in [key, *(value if isinstance(value, list) else [value])]:
+            if not isinstance(text, str):
+                continue
+            if "\x00" in text:
+                return "Contains a NUL character"
+            # Undecodable bytes arrive as lone surrogates (errors="surrogateescape").
+            if any("\udc80" <= ch <= "\udcff" for ch in text):
+                return "Not valid UTF-8"
+    return None
+
+
+def parse_records(lines: Iterable[str], fmt: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    (line number, record, error) per CSV row or NDJSON line, read lazily.
+    CSV headers are field names; empty cells count as not given. Malformed
+    rows, NUL characters and bytes that aren't UTF-8 (read with
+    errors="surrogateescape") are reported against their line.
+    """
+    if fmt == "csv":
+        read = 0
+
+        def counted():
+            nonlocal read
+            for text in lines:
+                read += 1
+                yield text
+
+        reader = csv.DictReader(counted())
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield read, None, f"Invalid CSV: {e}"
+                continue
+            if None in row:
+                yield reader.line_num, None, "More values than header columns"
+                continue
+            record = {k.strip(): v for k, v in row.items() if k and v not in (None, "")}
+            yield reader.line_num, record, _text_error(record)
+        return
+    for line_no, text in enumerate(lines, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            yield line_no, None, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "Expected a JSON object"
+            continue
+        yield line_no, record, _text_error(record)
+
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in e.errors()
+    )
+
+
+def _insert_rows(db: Session, table, rows: List[dict]) -> list:
+    """
+    Insert uniform dict rows and return their ids in order. Postgres gets a
+    COPY (ids are drawn from the sequence first, or supplied); elsewhere a
+    multi-row INSERT ... RETURNING.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        result = db.execute(insert(table).returning(table.c.id, sort_by_parameter_order=True), rows)
+        return list(result.scalars())
+
+    if "id" not in rows[0]:
+        ids = db.execute(
+            select(func.nextval(func.pg_get_serial_sequence(table.name, "id")))
+            .select_from(func.generate_series(1, len(rows)))
+        ).scalars().all()
+        rows = [{"id": i, **row} for i, row in zip(ids, rows)]
+    columns = list(rows[0])
+    as_json = {c for c in columns if isinstance(table.c[c].type, JSON)}
+    raw = db.connection().connection.driver_connection
+    with raw.cursor() as cur:
+        with cur.copy(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([
+                    json.dumps(row[c]) if c in as_json and row[c] is not None else row[c]
+                    for c in columns
+                ])
+    return [row["id"] for row in rows]
+
+
+def _update_rows(db: Session, table, changes: list, **extra) -> None:
+    """UPDATE (id, fields) pairs with one executemany per distinct field set."""
+    groups: dict = {}
+    for row_id, fields in changes:
+        groups.setdefault(tuple(sorted(fields)), []).append(
+            {"b_id": row_id, **{f"b_{k}": v for k, v in fields.items()}}
+        )
+    for names, params in groups.items():
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                **{name: bindparam(f"b_{name}", type_=table.c[name].type) for name in names},
+                version=table.c.version + 1,
+                **extra,
+            ),
+            params,
+        )
+
+
+class _Import(ABC):
+    """
+    Upsert-on-email import of one entity. Each chunk costs one lookup of
+    the existing rows by email, one COPY / multi-row INSERT for the new
+    rows and one executemany UPDATE per field set for the rest, in a
+    single transaction.
+    """
+    model = None
+    schema = None
+    entity = ""
+    # Inserted columns; rows are padded to all of them so they stay uniform.
+    insert_columns: Tuple[str, ...] = ()
+
+    def prepare(self, record: dict) -> dict:
+        """The given fields of a valid record, normalized like the create endpoint does."""
+        data = self.schema.model_validate(record)
+        fields = data.model_dump(exclude_unset=True)
+        for name in ("name", "first_name", "last_name"):
+            if name in fields:
+                fields[name] = fields[name].strip()
+        for name in ("phone", "address"):
+            if isinstance(fields.get(name), str):
+                fields[name] = fields[name].strip() or None
+        if fields.get("email") is not None:
+            fields["email"] = str(fields["email"]).lower()
+        return fields
+
+    @abstractmethod
+    def existing(self, db: Session, emails: set) -> dict:
+        """email -> id of the row an import with that email updates."""
+
+    def check(self, db: Session, rows: list) -> dict:
+        """Extra per-row conflicts as line -> error."""
+        return {}
+
+    @abstractmethod
+    def write(self, db: Session, inserts: list, updates: list, user_id) -> list:
+        """Write the chunk; returns the new ids in `inserts` order."""
+
+    def committed(self, db: Session, created: list, updated: list) -> None:
+        publish_change(self.entity, "created", *created)
+        publish_change(self.entity, "updated", *updated)
+
+
+class CustomerImport(_Import):
+    model = Customer
+    schema = CustomerCreate
+    entity = "customer"
+    insert_columns = ("name", "phone", "email", "address", "latitude", "longitude")
+
+    def existing(self, db, emails):
+        # Existing duplicates share an email; the oldest row is the one updated.
+        return {
+            email: row_id
+            for row_id, email in db.execute(
+                select(func.min(Customer.id), Customer.email)
+                .where(Customer.email.in_(emails))
+                .group_by(Customer.email)
+            )
+        }
+
+    def write(self, db, inserts, updates, user_id):
+        now = datetime.now(timezone.utc)
+        _update_rows(db, Customer.__table__, [(row_id, fields) for row_id, _, fields in updates], updated_at=now)
+        if not inserts:
+            return []
+        return _insert_rows(db, Customer.__table__, [
+            {c: fields.get(c) for c in self.insert_columns} for _, fields in inserts
+        ])
+
+    def committed(self, db, created, updated):
+        invalidate_overview(*updated)
+        super().committed(db, created, updated)
+
+
+class TechnicianImport(_Import):
+    model = Technician
+    schema = TechnicianCreate
+    entity = "technician"
+    insert_columns = (
+        "id", "first_name", "last_name", "email", "phone", "skills", "is_active",
+        "hourly_rate", "latitude", "longitude", "created_by_user_id", "updated_by_user_id",
+    )
+
+    def prepare(self, record):
+        if isinstance(record.get("skills"), str):
+            # CSV cells hold skills separated by semicolons.
+            record = {**record, "skills": [s for s in record["skills"].split(";") if s.strip()]}
+        fields = super().prepare(record)
+        if fields.get("latitude") is None or fields.get("longitude") is None:
+            fields.pop("latitude", None)
+            fields.pop("longitude", None)
+        return fields
+
+    def existing(self, db, emails):
+        return dict(
+            db.execute(select(Technician.email, Technician.id).where(Technician.email.in_(emails))).all()
+        )
+
+    def check(self, db, rows):
+        # Phones stay unique across technicians, as in the single and bulk writes.
+        phones = {fields["phone"] for _, _, fields in rows if fields.get("phone")}
+        owner = dict(
+            db.execute(select(Technician.phone, Technician.id).where(Technician.phone.in_(phones))).all()
+        ) if phones else {}
+        errors = {}
+        for line, row_id, fields in rows:
+            phone = fields.get("phone")
+            if not phone:
+                continue
+            holder = owner.get(phone)
+            if holder is not None and holder != row_id:
+                errors[line] = "Phone already in use"
+            else:
+                # New rows hold their phone by line for the rest of the chunk.
+                owner[phone] = row_id if row_id is not None else ("line", line)
+        return errors
+
+    def write(self, db, inserts, updates, user_id):
+        now = datetime.now(timezone.utc)
+        table = Technician.__table__
+        deltas = Counter()
+        if updates:
+            before = dict(
+                db.execute(
+                    select(Technician.id, Technician.is_active)
+                    .where(Technician.id.in_([row_id for row_id, _, _ in updates]))
+                    .with_for_update()
+                ).all()
+            )
+            for row_id, _, fields in updates:
+                if "is_active" in fields:
+                    deltas.update(rollup_deltas(
+                        technician_buckets(before.get(row_id)), technician_buckets(fields["is_active"])
+                    ))
+            _update_rows(
+                db, table, [(row_id, fields) for row_id, _, fields in updates],
+                updated_at=now, updated_by_user_id=user_id,
+            )
+        rows = [
+            {
+                **{c: fields.get(c) for c in self.insert_columns},
+                "id": uuid.uuid4(),
+                "is_active": fields.get("is_active", True),
+                "created_by_user_id": user_id,
+                "updated_by_user_id": user_id,
+            }
+            for _, fields in inserts
+        ]
+        for row in rows:
+            deltas.update(rollup_deltas(after=technician_buckets(row["is_active"])))
+        ids = _insert_rows(db, table, rows) if rows else []
+
+        reskilled = [row_id for row_id, _, fields in updates if "skills" in fields]
+        if reskilled:
+            db.execute(delete(TechnicianSkill).where(TechnicianSkill.technician_id.in_(reskilled)))
+        skill_rows = [
+            {"skill": s, "technician_id": row_id}
+            for row_id, fields in [
+                *((row_id, fields) for row_id, _, fields in updates),
+                *((tech_id, fields) for tech_id, (_, fields) in zip(ids, inserts)),
+            ]
+            for s in normalize_skills(fields.get("skills"))
+        ]
+        if skill_rows:
+            db.execute(insert(TechnicianSkill), skill_rows)
+        apply_rollup_deltas(db, deltas)
+        return ids
+
+    def committed(self, db, created, updated):
+        roster_snapshot.invalidate()
+        for tech in db.execute(select(Technician).where(Technician.id.in_(created + updated))).scalars():
+            technician_locator.record(tech)
+        super().committed(db, created, updated)
+
+
+IMPORTERS = {"customers": CustomerImport(), "technicians": TechnicianImport()}
+
+
+def _import_chunk(db: Session, importer: _Import, chunk: list, user_id) -> Tuple[int, int, dict]:
+    """Upsert one chunk of (line, fields); returns (created, updated, errors by line)."""
+    errors = {}
+    # A later row with the same email wins over an earlier one.
+    last_with_email = {}
+    for line, fields in chunk:
+        email = fields.get("email")
+        if email is None:
+            continue
+        if email in last_with_email:
+            errors[last_with_email[email]] = f"Superseded by line {line} with the same email"
+        last_with_email[email] = line
+    chunk = [(line, fields) for line, fields in chunk if line not in errors]
+
+    existing = importer.existing(db, set(last_with_email)) if last_with_email else {}
+    rows = [(line, existing.get(fields.get("email")), fields) for line, fields in chunk]
+    errors.update(importer.check(db, rows))
+    inserts = [(line, fields) for line, row_id, fields in rows if row_id is None and line not in errors]
+    updates = [(row_id, line, fields) for line, row_id, fields in rows if row_id is not None and line not in errors]
+
+    try:
+        created = importer.write(db, inserts, updates, user_id)
+        db.commit()
+    except IntegrityError:
+        # A concurrent write took an email or phone: nothing of the chunk is kept.
+        db.rollback()
+        for line, _ in chunk:
+            errors.setdefault(line, "Email or phone already exists")
+        return 0, 0, errors
+    importer.committed(db, created, [row_id for row_id, _, _ in updates])
+    return len(created), len(updates), errors
+
+
+def import_records(
+    db: Session,
+    kind: str,
+    lines: Iterable[str],
+    fmt: str = "csv",
+    user_id: Optional[int] = None,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Upsert customers or technicians from CSV or NDJSON `lines`, matching
+    existing rows on email. Records are parsed lazily and handled
+    `chunk_size` at a time, one transaction each, so memory does not grow
+    with the input. Yields {"line", "error"} for every rejected record as
+    soon as its chunk is done, then one {"created", "updated", "failed"}
+    summary. Closes `db` when exhausted.
+    """
+    importer = IMPORTERS[kind]
+    totals = Counter()
+    try:
+        chunk, errors = [], {}
+
+        def flush():
+            created, updated, chunk_errors = _import_chunk(db, importer, chunk, user_id) if chunk else (0, 0, {})
+            chunk_errors.update(errors)
+            totals.update(created=created, updated=updated, failed=len(chunk_errors))
+            report = [{"line": line, "error": chunk_errors[line]} for line in sorted(chunk_errors)]
+            chunk.clear()
+            errors.clear()
+            return report
+
+        for line, record, error in parse_records(lines, fmt):
+            if error is None:
+                try:
+                    chunk.append((line, importer.prepare(record)))
+                except ValidationError as e:
+                    error = _validation_message(e)
+            if error is not None:
+                errors[line] = error
+            if len(chunk) + len(errors) >= chunk_size:
+                yield from flush()
+        yield from flush()
+        yield {"created": totals["created"], "updated": totals["updated"], "failed": totals["failed"]}
+    finally:
+        db.close()
+
+
+def report_lines(report: Iterable[dict]) -> Iterator[str]:
+    for item in report:
+        yield json.dumps(item, separators=(",", ":")) + "\n"
@@ -1,19 +1,248 @@
+import csv
+import io
+import json
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from typing import Iterator, List, Optional
+from uuid import UUID
+
 from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_, select, insert, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from ..models.job import Job
-from ..routers.jobs.schemas import JobCreate, JobUpdate
+from sqlalchemy.orm.exc import StaleDataError
+from ..models.job import Job, TERMINAL_JOB_STATUSES, job_status_sources
+from ..models.customer import Customer
+from ..models.technician import Technician
+from ..routers.jobs import schemas as job_schemas
+from ..routers.jobs.schemas import JobCreate, JobUpdate, JobBulkTransition
+from .etags import CONCURRENT_UPDATE, list_etag
+from .pagination import encode_cursor, decode_cursor
+from .fieldsets import parse_fields, project
+from .conflicts_service import (
+    NON_BLOCKING_STATUSES,
+    as_utc,
+    booking_index,
+    ensure_schedule_available,
+    is_blocking,
+    is_overlap_violation,
+    uses_range_types,
+    record_jobs,
+)
+from .dispatch_service import roster_snapshot
+from .schedule_service import invalidate_schedule
+from .customers_service import invalidate_overview
+from .stats_service import apply_rollup_deltas, job_buckets, rollup_deltas
+from .events_service import publish_change
+
+
+# Sort keys accepted by list_jobs; each is backed by a (column, id) index.
+JOB_SORT_KEYS = {
+    "scheduled_start_at": Job.scheduled_start_at,
+    "updated_at": Job.updated_at,
+}
+
+
+def _keyset_predicate(column, descending: bool, last_value, last_id: int):
+    """
+    Rows strictly after (last_value, last_id) in the listing order.
+    NULL sort values go last ascending and first descending, which is the
+    order an index on (column, id) yields when scanned either way.
+    """
+    if not descending:
+        if last_value is None:
+            return and_(column.is_(None), Job.id > last_id)
+        return or_(
+            column > last_value,
+            and_(column == last_value, Job.id > last_id),
+            column.is_(None),
+        )
+    if last_value is None:
+        return or_(and_(column.is_(None), Job.id < last_id), column.isnot(None))
+    return or_(column < last_value, and_(column == last_value, Job.id < last_id))
+
+
+def _filter_jobs(qry, status, technician_id, customer_id, scheduled_from, scheduled_to):
+    """Apply the shared job filters to an ORM query or Core select."""
+    if status:
+        qry = qry.filter(Job.status.in_(status))
+    if technician_id is not None:
+        qry = qry.filter(Job.technician_id == technician_id)
+    if customer_id is not None:
+        qry = qry.filter(Job.customer_id == customer_id)
+    if scheduled_from is not None:
+        qry = qry.filter(Job.scheduled_start_at >= scheduled_from)
+    if scheduled_to is not None:
+        qry = qry.filter(Job.scheduled_start_at < scheduled_to)
+    return qry
+
+
+def _job_page(db: Session, limit: int, cursor: Optional[str], sort: str, **filters):
+    """
+    The query for one page of jobs (plus one row to detect the next), its
+    sort column and that column's name.
+    """
+    descending = sort.startswith("-")
+    sort_name = sort[1:] if descending else sort
+    column = JOB_SORT_KEYS.get(sort_name)
+    if column is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unsupported sort: {sort}. Use one of: {', '.join(sorted(JOB_SORT_KEYS))}",
+        )
+
+    qry = _filter_jobs(db.query(Job), **filters)
+    if cursor:
+        values = decode_cursor(cursor, sort)
+        try:
+            raw_value, last_id = values
+            last_value = datetime.fromisoformat(raw_value) if raw_value is not None else None
+            last_id = int(last_id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        qry = qry.filter(_keyset_predicate(column, descending, last_value, last_id))
+
+    if descending:
+        qry = qry.order_by(column.desc().nulls_first(), Job.id.desc())
+    else:
+        qry = qry.order_by(column.asc().nulls_last(), Job.id.asc())
+    # One extra row tells us whether another page exists without a COUNT.
+    return qry.limit(limit + 1), sort_name
+
+
+def jobs_list_etag(
+    db: Session,
+    *salt,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "scheduled_start_at",
+    **filters,
+) -> str:
+    """
+    ETag of one job page from an aggregate over just that page's rows, so
+    revalidating costs the same bounded index range as the page itself.
+    """
+    page, _ = _job_page(db, limit, cursor, sort, **filters)
+    rows = page.with_entities(Job.id, Job.version, Job.updated_at).subquery()
+    aggregates = db.execute(
+        select(func.count(), func.sum(rows.c.id), func.sum(rows.c.version), func.max(rows.c.updated_at))
+    ).one()
+    return list_etag(aggregates, *salt)
+
+
+def list_jobs(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "scheduled_start_at",
+    status: Optional[List[str]] = None,
+    technician_id: Optional[UUID] = None,
+    customer_id: Optional[int] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    fields: Optional[str] = None,
+):
+    columns = parse_fields(fields, job_schemas.Job.model_fields)
+    qry, sort_name = _job_page(
+        db, limit, cursor, sort,
+        status=status, technician_id=technician_id, customer_id=customer_id,
+        scheduled_from=scheduled_from, scheduled_to=scheduled_to,
+    )
+
+    if columns is not None:
+        # The cursor needs the sort value and id even if not requested.
+        qry = qry.with_entities(*(getattr(Job, c) for c in dict.fromkeys([*columns, sort_name])))
+
+    rows = qry.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        last_value = getattr(last, sort_name)
+        next_cursor = encode_cursor(
+            sort, [last_value.isoformat() if last_value is not None else None, last.id]
+        )
+    return {
+        "items": rows if columns is None else project(rows, columns),
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
 
 
-def list_jobs(db: Session) -> list[Job]:
-    return db.query(Job).all()
+EXPORT_COLUMNS = [
+    Job.id,
+    Job.title,
+    Job.description,
+    Job.status,
+    Job.scheduled_start_at,
+    Job.scheduled_end_at,
+    Job.customer_id,
+    Job.technician_id,
+    Job.created_at,
+    Job.updated_at,
+]
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def export_jobs(
+    db: Session,
+    fmt: str = "ndjson",
+    status: Optional[List[str]] = None,
+    technician_id: Optional[UUID] = None,
+    customer_id: Optional[int] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+) -> Iterator[str]:
+    """
+    Yield the matching jobs as NDJSON lines or CSV text, one chunk per batch.
+    Rows come straight from Core result tuples read with `yield_per`
+    (a server-side cursor on Postgres), so memory stays bounded by the
+    batch size no matter how many rows match. Closes `db` when exhausted.
+    """
+    names = [c.key for c in EXPORT_COLUMNS]
+    stmt = _filter_jobs(
+        select(*EXPORT_COLUMNS), status, technician_id, customer_id, scheduled_from, scheduled_to
+    ).order_by(Job.id)
+
+    try:
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(names)
+            yield buf.getvalue()
+
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for partition in result.partitions():
+            if fmt == "csv":
+                buf.seek(0)
+                buf.truncate()
+                writer.writerows(
+                    ["" if v is None else _export_value(v) for v in row] for row in partition
+                )
+                yield buf.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(names, map(_export_value, row))), separators=(",", ":")) + "\n"
+                    for row in partition
+                )
+    finally:
+        db.close()
 
 
 def get_job(db: Session, job_id: int) -> Job | None:
     return db.get(Job, job_id)
 
 
-def create_job(db: Session, job_in: JobCreate) -> Job:
+def _job_fields(job_in: JobCreate) -> dict:
     fields = {
         "title": job_in.title.strip(),
         "status": job_in.status,
@@ -27,18 +256,345 @@ def create_job(db: Session, job_in: JobCreate) -> Job:
         fields["scheduled_end_at"] = job_in.scheduled_end_at
     if job_in.technician_id is not None:
         fields["technician_id"] = job_in.technician_id
+    return fields
 
-    obj = Job(**fields)
-    db.add(obj)
+
+def _commit_job_write(db: Session) -> None:
     try:
         db.commit()
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="Technician is already booked for that time")
         raise
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
+
+
+def _execute_job_write(db: Session, statement, params=None):
+    """
+    Run a Core INSERT/UPDATE on jobs. The exclusion constraint is checked
+    per statement, so an overlap surfaces here rather than at commit.
+    """
+    try:
+        return db.execute(statement, params)
+    except IntegrityError as e:
+        db.rollback()
+        if is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="Technician is already booked for that time")
+        raise
+
+
+def _buckets(job) -> list:
+    return job_buckets(job.status, job.technician_id, job.scheduled_start_at)
+
+
+def create_job(
+    db: Session,
+    job_in: JobCreate,
+    series_id: Optional[int] = None,
+    occurrence_start: Optional[datetime] = None,
+) -> Job:
+    obj = Job(**_job_fields(job_in), series_id=series_id, occurrence_start=occurrence_start)
+    ensure_schedule_available(
+        db, obj.technician_id, obj.scheduled_start_at, obj.scheduled_end_at, obj.status
+    )
+    db.add(obj)
+    apply_rollup_deltas(db, rollup_deltas(after=_buckets(obj)))
+    _commit_job_write(db)
     db.refresh(obj)
+    record_jobs([obj])
+    roster_snapshot.move_jobs(after=[(obj.technician_id, obj.status)])
+    invalidate_schedule(obj.scheduled_start_at)
+    invalidate_overview(obj.customer_id)
+    publish_change("job", "created", obj.id)
     return obj
 
 
+BATCH_ROW_DEFAULTS = dict.fromkeys(
+    ["description", "scheduled_start_at", "scheduled_end_at", "technician_id"]
+)
+
+
+def create_jobs_batch(db: Session, items: List[JobCreate], atomic: bool = False) -> dict:
+    """
+    Validate and insert many jobs with a fixed number of round-trips:
+    one lookup each for customers and technicians, one range query for the
+    technicians' existing bookings, and one multi-row INSERT ... RETURNING.
+    Items that fail validation are reported and skipped; with `atomic`
+    nothing is inserted unless every item is valid.
+    """
+    errors: dict[int, str] = {}
+
+    customer_ids = {it.customer_id for it in items}
+    tech_ids = {it.technician_id for it in items if it.technician_id is not None}
+    known_customers = set(
+        db.execute(select(Customer.id).where(Customer.id.in_(customer_ids))).scalars()
+    ) if customer_ids else set()
+    known_techs = set(
+        db.execute(select(Technician.id).where(Technician.id.in_(tech_ids))).scalars()
+    ) if tech_ids else set()
+
+    # (index, technician_id, start, end) for every item that books a slot
+    timed = []
+    for i, it in enumerate(items):
+        if it.customer_id not in known_customers:
+            errors[i] = f"Customer {it.customer_id} not found"
+        elif it.technician_id is not None and it.technician_id not in known_techs:
+            errors[i] = f"Technician {it.technician_id} not found"
+        elif it.scheduled_start_at and it.scheduled_end_at:
+            start, end = as_utc(it.scheduled_start_at), as_utc(it.scheduled_end_at)
+            if end <= start:
+                errors[i] = "scheduled_end_at must be after scheduled_start_at"
+            elif it.technician_id is not None and it.status not in NON_BLOCKING_STATUSES:
+                timed.append((i, it.technician_id, start, end))
+
+    # Existing bookings for the batch's technicians inside the batch window.
+    existing: dict[UUID, list] = {}
+    if timed:
+        window_start = min(t[2] for t in timed)
+        window_end = max(t[3] for t in timed)
+        rows = db.execute(
+            select(Job.id, Job.technician_id, Job.scheduled_start_at, Job.scheduled_end_at)
+            .where(
+                Job.technician_id.in_({t[1] for t in timed}),
+                Job.scheduled_start_at < window_end,
+                Job.scheduled_end_at > window_start,
+                Job.status.notin_(NON_BLOCKING_STATUSES),
+            )
+            .order_by(Job.technician_id, Job.scheduled_start_at)
+        )
+        for job_id, tech_id, start, end in rows:
+            existing.setdefault(tech_id, []).append((as_utc(start), as_utc(end), job_id))
+
+    # Prefix max of end times over start-sorted bookings: the latest end
+    # among everything starting before a point, found with one bisect.
+    existing_index = {}
+    for tech_id, spans in existing.items():
+        starts, max_ends, running = [], [], None
+        for start, end, _ in spans:
+            running = end if running is None or end > running else running
+            starts.append(start)
+            max_ends.append(running)
+        existing_index[tech_id] = (starts, max_ends, spans)
+
+    accepted: dict[UUID, list] = {}
+    for i, tech_id, start, end in timed:
+        starts, max_ends, spans = existing_index.get(tech_id, ([], [], []))
+        pos = bisect_left(starts, end)
+        if pos and max_ends[pos - 1] > start:
+            clash = next(s[2] for s in reversed(spans[:pos]) if s[1] > start)
+            errors[i] = f"Overlaps existing job {clash} for technician {tech_id}"
+            continue
+        # Accepted in-batch bookings never overlap each other, so only the
+        # neighbours around the insertion point need checking.
+        booked = accepted.setdefault(tech_id, [])
+        pos = bisect_left(booked, (start,))
+        if pos and booked[pos - 1][1] > start:
+            errors[i] = f"Overlaps batch item {booked[pos - 1][2]} for technician {tech_id}"
+            continue
+        if pos < len(booked) and booked[pos][0] < end:
+            errors[i] = f"Overlaps batch item {booked[pos][2]} for technician {tech_id}"
+            continue
+        booked.insert(pos, (start, end, i))
+
+    valid = [i for i in range(len(items)) if i not in errors]
+    ids: dict[int, int] = {}
+    if valid and not (atomic and errors):
+        result = _execute_job_write(
+            db,
+            insert(Job).returning(Job.id, sort_by_parameter_order=True),
+            # Uniform key sets keep the ORM on a single batched INSERT.
+            [{**BATCH_ROW_DEFAULTS, **_job_fields(items[i])} for i in valid],
+        )
+        ids = dict(zip(valid, result.scalars()))
+        deltas = Counter()
+        for i in ids:
+            deltas.update(rollup_deltas(after=_buckets(items[i])))
+        apply_rollup_deltas(db, deltas)
+        _commit_job_write(db)
+        for i, job_id in ids.items():
+            it = items[i]
+            booking_index.record(
+                job_id, it.technician_id, it.scheduled_start_at, it.scheduled_end_at, it.status
+            )
+        roster_snapshot.move_jobs(after=[(items[i].technician_id, items[i].status) for i in ids])
+        invalidate_schedule(*(items[i].scheduled_start_at for i in ids))
+        invalidate_overview(*(items[i].customer_id for i in ids))
+        publish_change("job", "created", *ids.values())
+
+    results = []
+    for i in range(len(items)):
+        if i in ids:
+            results.append({"index": i, "ok": True, "id": ids[i]})
+        elif i in errors:
+            results.append({"index": i, "ok": False, "error": errors[i]})
+        else:
+            results.append({"index": i, "ok": False, "error": "Not inserted: batch has invalid items"})
+    return {
+        "created": len(ids),
+        "failed": len(items) - len(ids),
+        "results": results,
+    }
+
+
+def transition_jobs(db: Session, payload: JobBulkTransition) -> dict:
+    """
+    Apply a status change and/or technician reassignment to an id list or a
+    filter in a single UPDATE ... WHERE <selection> ... RETURNING. The state
+    machine is enforced in the WHERE clause, so rows that may not move are
+    left alone. The old status and technician, which move the KPI rollups
+    and open-job loads, come back through RETURNING as well.
+    """
+    if payload.ids is not None:
+        selection = Job.id.in_(payload.ids)
+    else:
+        f = payload.filter
+        selection = _filter_jobs(
+            select(Job.id), f.status, f.technician_id, f.customer_id, f.scheduled_from, f.scheduled_to
+        ).whereclause
+        if selection is None:
+            raise HTTPException(status_code=422, detail="filter must have at least one criterion")
+
+    values = {}
+    guard = []
+    if payload.status is not None:
+        values["status"] = payload.status
+        guard.append(Job.status.in_(job_status_sources(payload.status)))
+    if payload.technician_id is not None or payload.unassign:
+        values["technician_id"] = payload.technician_id
+        # Finished work keeps the technician who did it.
+        guard.append(Job.status.notin_(TERMINAL_JOB_STATUSES))
+
+    rows, previous = [], {}
+    for job_id, status_, tech_id, start, end, customer_id, old_status, old_tech_id in _transition(
+        db, selection, guard, values
+    ):
+        rows.append((job_id, status_, tech_id, start, end))
+        previous[job_id] = (old_status, old_tech_id, customer_id)
+    deltas = Counter()
+    for job_id, status_, tech_id, start, _ in rows:
+        old_status, old_tech_id, _ = previous[job_id]
+        deltas.update(rollup_deltas(
+            job_buckets(old_status, old_tech_id, start),
+            job_buckets(status_, tech_id, start),
+        ))
+
+    if payload.technician_id is not None and not uses_range_types(db):
+        clashes = _reassignment_clashes(db, payload.technician_id, rows)
+        if clashes:
+            db.rollback()
+            # The lookup may have loaded rows from the rolled-back UPDATE.
+            booking_index.evict(payload.technician_id)
+            raise HTTPException(
+                status_code=409,
+                detail=f"Technician is already booked for job(s) {', '.join(map(str, sorted(clashes)))}",
+            )
+    apply_rollup_deltas(db, deltas)
+    _commit_job_write(db)
+
+    for job_id, status_, tech_id, start, end in rows:
+        booking_index.record(job_id, tech_id, start, end, status_)
+    if rows:
+        roster_snapshot.move_jobs(
+            before=[(previous[r[0]][1], previous[r[0]][0]) for r in rows],
+            after=[(r[2], r[1]) for r in rows],
+        )
+        invalidate_schedule(*(r[3] for r in rows))
+        invalidate_overview(*(previous[r[0]][2] for r in rows))
+        publish_change("job", "updated", *(r[0] for r in rows))
+
+    results = {
+        job_id: {"id": job_id, "ok": True, "status": status_, "technician_id": tech_id}
+        for job_id, status_, tech_id, _, _ in rows
+    }
+    if payload.ids is None:
+        return {"updated": len(rows), "results": list(results.values())}
+
+    requested = list(dict.fromkeys(payload.ids))
+    skipped = [job_id for job_id in requested if job_id not in results]
+    statuses = dict(db.execute(select(Job.id, Job.status).where(Job.id.in_(skipped))).all()) if skipped else {}
+    for job_id in skipped:
+        current = statuses.get(job_id)
+        if current is None:
+            error = "Job not found"
+        elif payload.status is not None and current == payload.status:
+            error = f"Already {payload.status}"
+        elif payload.status is not None and current not in job_status_sources(payload.status):
+            error = f"Cannot move from {current} to {payload.status}"
+        else:
+            error = f"Cannot reassign a {current} job"
+        results[job_id] = {"id": job_id, "ok": False, "error": error}
+    return {"updated": len(rows), "results": [results[i] for i in requested]}
+
+
+def _transition(db: Session, selection, guard: list, values: dict) -> list:
+    """
+    Run the bulk transition UPDATE. Rows come back as (id, status,
+    technician_id, scheduled_start_at, scheduled_end_at, customer_id,
+    old_status, old_technician_id); a transition never moves the start or
+    the customer, so only status and technician need their old values.
+    """
+    returning = (
+        Job.id, Job.status, Job.technician_id, Job.scheduled_start_at, Job.scheduled_end_at, Job.customer_id
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        # Join the row to a locked copy of itself; the copy keeps the
+        # pre-update values for RETURNING.
+        old = (
+            select(Job.id, Job.status, Job.technician_id)
+            .where(selection, *guard)
+            .with_for_update()
+            .subquery("old")
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id == old.c.id)
+            .values(**values, version=Job.version + 1)
+            .returning(*returning, old.c.status, old.c.technician_id)
+            .execution_options(synchronize_session=False)
+        )
+        return _execute_job_write(db, stmt).all()
+
+    # SQLite's RETURNING only sees the updated table, but it serialises
+    # writers, so the old values can be read first in the same transaction.
+    previous = {
+        row.id: (row.status, row.technician_id)
+        for row in db.execute(select(Job.id, Job.status, Job.technician_id).where(selection, *guard))
+    }
+    if not previous:
+        return []
+    stmt = (
+        update(Job)
+        .where(selection, *guard)
+        .values(**values, version=Job.version + 1)
+        .returning(*returning)
+        .execution_options(synchronize_session=False)
+    )
+    return [(*row, *previous[row[0]]) for row in _execute_job_write(db, stmt)]
+
+
+def _reassignment_clashes(db: Session, technician_id: UUID, rows) -> set:
+    """Ids of reassigned jobs that overlap each other or the technician's other bookings."""
+    moved = {r[0] for r in rows}
+    spans = sorted(
+        (as_utc(start), as_utc(end), job_id)
+        for job_id, status_, _, start, end in rows
+        if is_blocking(technician_id, start, end, status_)
+    )
+    clashes = set()
+    latest_end, latest_id = None, None
+    for start, end, job_id in spans:
+        if latest_end is not None and start < latest_end:
+            clashes.update((latest_id, job_id))
+        if latest_end is None or end > latest_end:
+            latest_end, latest_id = end, job_id
+        if any(other not in moved for other in booking_index.overlapping(db, technician_id, start, end)):
+            clashes.add(job_id)
+    return clashes
+
+
 def update_job(db: Session, job_id: int, job_in: JobUpdate) -> Job:
     obj = db.get(Job, job_id)
     if not obj:
@@ -46,6 +602,10 @@ def update_job(db: Session, job_id: int, job_in: JobUpdate) -> Job:
 
     # Update only fields that are provided (exclude unset)
     data = job_in.dict(exclude_unset=True)
+    previous_start = obj.scheduled_start_at
+    previous_customer_id = obj.customer_id
+    previous_buckets = _buckets(obj)
+    previous_assignment = (obj.technician_id, obj.status)
     
     if "title" in data and data["title"] is not None:
         obj.title = data["title"].strip()
@@ -62,13 +622,18 @@ def update_job(db: Session, job_id: int, job_in: JobUpdate) -> Job:
     if "technician_id" in data:
         obj.technician_id = data["technician_id"]
 
+    ensure_schedule_available(
+        db, obj.technician_id, obj.scheduled_start_at, obj.scheduled_end_at, obj.status, job_id=obj.id
+    )
     db.add(obj)
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        raise
+    apply_rollup_deltas(db, rollup_deltas(previous_buckets, _buckets(obj)))
+    _commit_job_write(db)
     db.refresh(obj)
+    record_jobs([obj])
+    roster_snapshot.move_jobs(before=[previous_assignment], after=[(obj.technician_id, obj.status)])
+    invalidate_schedule(previous_start, obj.scheduled_start_at)
+    invalidate_overview(previous_customer_id, obj.customer_id)
+    publish_change("job", "updated", obj.id)
     return obj
 
 
@@ -78,7 +643,14 @@ def delete_job(db: Session, job_id: int) -> None:
         raise HTTPException(status_code=404, detail="Job not found")
 
     db.delete(obj)
-    db.commit()
+    apply_rollup_deltas(db, rollup_deltas(before=_buckets(obj)))
+    _commit_job_write(db)
+    booking_index.discard(job_id)
+    roster_snapshot.move_jobs(before=[(obj.technician_id, obj.status)])
+    # A deleted occurrence of a series falls back to its rule-generated slot.
+    invalidate_schedule(obj.scheduled_start_at, obj.occurrence_start)
+    invalidate_overview(obj.customer_id)
+    publish_change("job", "deleted", job_id)
 
 
 
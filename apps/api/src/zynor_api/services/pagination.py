@@ -0,0 +1,120 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, Integer, and_, literal, or_, tuple_
+
+
+def encode_cursor(sort_key: str, values: list[Any], backwards: bool = False, total: int | None = None) -> str:
+    """
+    Opaque keyset cursor: the sort key it was issued for plus the values of
+    the last row on the page (e.g. [scheduled_start_at, id]). A `backwards`
+    cursor holds the first row instead and asks for the page before it.
+    `total` carries a count taken on an earlier page (see `cursor_total`).
+    """
+    data = {"k": sort_key, "v": values}
+    if backwards:
+        data["b"] = 1
+    if total is not None:
+        data["t"] = total
+    raw = json.dumps(data, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor_with_direction(token: str, sort_key: str) -> tuple[list[Any], bool]:
+    """Decode a cursor issued by `encode_cursor` into (values, backwards), or raise 400."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = data["v"]
+        issued_for = data["k"]
+        backwards = bool(data.get("b"))
+    except (ValueError, KeyError, TypeError, AttributeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if issued_for != sort_key or not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+    return values, backwards
+
+
+def cursor_total(token: str) -> int | None:
+    """The total carried by a cursor already checked by `decode_cursor_with_direction`, if any."""
+    padded = token + "=" * (-len(token) % 4)
+    total = json.loads(base64.urlsafe_b64decode(padded.encode("ascii"))).get("t")
+    return total if isinstance(total, int) and total >= 0 else None
+
+
+def decode_cursor(token: str, sort_key: str) -> list[Any]:
+    """Decode a forward cursor issued by `encode_cursor`, or raise 400."""
+    values, backwards = decode_cursor_with_direction(token, sort_key)
+    if backwards:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def keyset_order(cols: Sequence, descending: bool) -> list:
+    """
+    ORDER BY for a keyset over `cols`, whose last column is unique (the
+    id). Only the leading column may be nullable; NULLs go last ascending
+    and first descending, which is the order an index on `cols` yields
+    when scanned either way.
+    """
+    lead, rest = cols[0], cols[1:]
+    if descending:
+        return [lead.desc().nulls_first(), *(c.desc() for c in rest)]
+    return [lead.asc().nulls_last(), *(c.asc() for c in rest)]
+
+
+def keyset_after(cols: Sequence, values: list, descending: bool):
+    """
+    Rows strictly after `values` in `keyset_order`. Non-null keys compare
+    as a row value, which both Postgres and SQLite turn into a single
+    index range.
+    """
+    def beyond(cs, vs):
+        bound = [literal(v, c.type) for c, v in zip(cs, vs)]
+        if len(cs) > 1:
+            left, right = tuple_(*cs), tuple_(*bound)
+        else:
+            left, right = cs[0], bound[0]
+        return left < right if descending else left > right
+
+    lead = cols[0]
+    if values[0] is None:
+        ties = and_(lead.is_(None), beyond(cols[1:], values[1:]))
+        return or_(ties, lead.isnot(None)) if descending else ties
+    after = beyond(cols, values)
+    if lead.nullable and not descending:
+        return or_(after, lead.is_(None))
+    return after
+
+
+def cursor_key(cols: Sequence, row) -> list:
+    """A row's values for `cols`, JSON-ready for `encode_cursor`."""
+    values = [getattr(row, c.key) for c in cols]
+    return [v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, uuid.UUID) else v for v in values]
+
+
+def parse_cursor_key(cols: Sequence, values: list) -> list:
+    """Decoded cursor values back to the types of `cols`; 400 if they don't fit."""
+    if len(values) != len(cols):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    parsed = []
+    try:
+        for col, value in zip(cols, values):
+            if value is None:
+                if not col.nullable:
+                    raise ValueError(col.key)
+            elif isinstance(col.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(col.type, Integer):
+                value = int(value)
+            elif getattr(col.type, "as_uuid", False):
+                value = uuid.UUID(value)
+            parsed.append(value)
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return parsed
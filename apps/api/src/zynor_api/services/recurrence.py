@@ -0,0 +1,225 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from ..models.job import Job
+from ..models.job_series import JobSeries
+from .conflicts_service import as_utc
+
+
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY"}
+
+# Status reported for occurrences that only exist as part of the rule.
+OCCURRENCE_STATUS = "SCHEDULED"
+
+
+class RecurrenceRule(NamedTuple):
+    """
+    The supported RRULE subset: FREQ=DAILY|WEEKLY|MONTHLY with INTERVAL,
+    BYDAY (weekly only), and an optional COUNT or UNTIL. Monthly series
+    repeat on the start date's day of the month, which must be 1-28.
+    """
+    freq: str
+    interval: int = 1
+    byday: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if fmt == "%Y%m%d":
+            parsed = parsed.replace(hour=23, minute=59, second=59)
+        return parsed.replace(tzinfo=timezone.utc)
+    raise ValueError(f"Invalid UNTIL: {value}")
+
+
+def parse_rule(text: str, dtstart: datetime) -> RecurrenceRule:
+    """Parse e.g. "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=10". Raises ValueError."""
+    parts = {}
+    for part in text.strip().removeprefix("RRULE:").split(";"):
+        if not part:
+            continue
+        name, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"Invalid rule part: {part}")
+        parts[name.strip().upper()] = value.strip().upper()
+
+    unknown = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "COUNT", "UNTIL"}
+    if unknown:
+        raise ValueError(f"Unsupported rule part(s): {', '.join(sorted(unknown))}")
+    freq = parts.get("FREQ")
+    if freq not in FREQUENCIES:
+        raise ValueError("FREQ must be DAILY, WEEKLY or MONTHLY")
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise ValueError("COUNT and UNTIL are mutually exclusive")
+
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        raise ValueError("INTERVAL and COUNT must be integers")
+    if interval < 1 or (count is not None and count < 1):
+        raise ValueError("INTERVAL and COUNT must be positive")
+
+    byday: Tuple[int, ...] = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        try:
+            byday = tuple(sorted({WEEKDAYS.index(d.strip()) for d in parts["BYDAY"].split(",")}))
+        except ValueError:
+            raise ValueError("BYDAY must list MO, TU, WE, TH, FR, SA or SU")
+    if freq == "MONTHLY" and dtstart.day > 28:
+        raise ValueError("Monthly series must start on day 1-28")
+
+    until = _parse_until(parts["UNTIL"]) if "UNTIL" in parts else None
+    return RecurrenceRule(freq, interval, byday, count, until)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month = value.month - 1 + months
+    return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+
+
+class _Periods:
+    """
+    A rule seen as numbered periods (a day, a week or a month, times
+    INTERVAL) with fixed day offsets inside each. Occurrence numbers are
+    computed arithmetically, so a window is reached without walking the
+    series from its start.
+    """
+
+    def __init__(self, rule: RecurrenceRule, dtstart: datetime):
+        self.rule = rule
+        self.dtstart = as_utc(dtstart)
+        if rule.freq == "WEEKLY":
+            self.base = self.dtstart - timedelta(days=self.dtstart.weekday())
+            self.offsets = rule.byday or (self.dtstart.weekday(),)
+            # Days of the first week before dtstart are not occurrences.
+            self.skipped = sum(1 for o in self.offsets if o < self.dtstart.weekday())
+        else:
+            self.base = self.dtstart
+            self.offsets = (0,)
+            self.skipped = 0
+
+    def start_of(self, period: int) -> datetime:
+        if self.rule.freq == "MONTHLY":
+            return _add_months(self.base, period * self.rule.interval)
+        days = 7 if self.rule.freq == "WEEKLY" else 1
+        return self.base + timedelta(days=days * period * self.rule.interval)
+
+    def period_at(self, moment: datetime) -> int:
+        """Last period starting at or before `moment` (0 if before the series)."""
+        if moment <= self.base:
+            return 0
+        if self.rule.freq == "MONTHLY":
+            months = (moment.year - self.base.year) * 12 + moment.month - self.base.month
+            period = months // self.rule.interval
+            while period > 0 and self.start_of(period) > moment:
+                period -= 1
+            return period
+        days = 7 if self.rule.freq == "WEEKLY" else 1
+        return (moment - self.base) // timedelta(days=days * self.rule.interval)
+
+    def number(self, period: int, slot: int) -> int:
+        return period * len(self.offsets) + slot - self.skipped
+
+
+def occurrences(rule: RecurrenceRule, dtstart: datetime, start: datetime, end: datetime) -> Iterator[datetime]:
+    """Occurrence start times in [start, end), in order; cost is bounded by the window."""
+    periods = _Periods(rule, dtstart)
+    start, end = as_utc(start), as_utc(end)
+    period = periods.period_at(start)
+    while True:
+        period_start = periods.start_of(period)
+        if period_start >= end:
+            return
+        for slot, offset in enumerate(periods.offsets):
+            occurrence = period_start + timedelta(days=offset)
+            if occurrence < periods.dtstart:
+                continue
+            if rule.count is not None and periods.number(period, slot) >= rule.count:
+                return
+            if rule.until is not None and occurrence > rule.until:
+                return
+            if occurrence >= end:
+                return
+            if occurrence >= start:
+                yield occurrence
+        period += 1
+
+
+def last_occurrence(rule: RecurrenceRule, dtstart: datetime) -> Optional[datetime]:
+    """Upper bound on the last occurrence start, or None for an open-ended series."""
+    if rule.until is not None:
+        return rule.until
+    if rule.count is None:
+        return None
+    periods = _Periods(rule, dtstart)
+    period, slot = divmod(rule.count - 1 + periods.skipped, len(periods.offsets))
+    return periods.start_of(period) + timedelta(days=periods.offsets[slot])
+
+
+def is_occurrence(rule: RecurrenceRule, dtstart: datetime, moment: datetime) -> bool:
+    moment = as_utc(moment)
+    return next(occurrences(rule, dtstart, moment, moment + timedelta(microseconds=1)), None) == moment
+
+
+def expand_series(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    series_id: Optional[int] = None,
+) -> List[dict]:
+    """
+    Rule-generated occurrences starting in [start, end) that have no stored
+    job. One query finds the series active in the window, one more the
+    occurrences already materialized there; neither depends on how long
+    the series run.
+    """
+    qry = select(JobSeries).where(
+        JobSeries.dtstart < end,
+        or_(JobSeries.ends_at.is_(None), JobSeries.ends_at >= start),
+    )
+    if series_id is not None:
+        qry = qry.where(JobSeries.id == series_id)
+    series = db.execute(qry).scalars().all()
+    if not series:
+        return []
+
+    stored = {
+        (sid, as_utc(occurrence_start))
+        for sid, occurrence_start in db.execute(
+            select(Job.series_id, Job.occurrence_start).where(
+                Job.series_id.in_([s.id for s in series]),
+                Job.occurrence_start >= start,
+                Job.occurrence_start < end,
+            )
+        )
+    }
+
+    items = []
+    for s in series:
+        rule = parse_rule(s.rule, as_utc(s.dtstart))
+        duration = timedelta(minutes=s.duration_minutes)
+        for occurrence in occurrences(rule, s.dtstart, start, end):
+            if (s.id, occurrence) in stored:
+                continue
+            items.append({
+                "series_id": s.id,
+                "occurrence_start": occurrence,
+                "title": s.title,
+                "status": OCCURRENCE_STATUS,
+                "scheduled_start_at": occurrence,
+                "scheduled_end_at": occurrence + duration,
+                "customer_id": s.customer_id,
+                "technician_id": s.technician_id,
+            })
+    return items
@@ -0,0 +1,301 @@
+import math
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.customer import Customer
+from ..models.job import Job, TERMINAL_JOB_STATUSES
+from ..models.technician import Technician
+from .conflicts_service import as_utc
+from .geo_service import EARTH_RADIUS_KM, haversine_km
+
+# Seconds of driving one second of arriving after a window closes is worth
+# when comparing two orders.
+LATENESS_WEIGHT = 100.0
+
+# Improvement passes of 2-opt + Or-opt; each pass is O(n^2) moves.
+MAX_PASSES = 50
+
+
+def distance_matrix(points: Sequence[Tuple[float, float]]) -> List[List[float]]:
+    """
+    Great-circle distances in km between all (lat, lon) pairs. Radians and
+    cosines are computed once per point and each pair once, mirrored.
+    """
+    lat = [math.radians(p[0]) for p in points]
+    lon = [math.radians(p[1]) for p in points]
+    cos_lat = [math.cos(v) for v in lat]
+    n = len(points)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        row, lat_i, lon_i, cos_i = matrix[i], lat[i], lon[i], cos_lat[i]
+        for j in range(i + 1, n):
+            h = math.sin((lat[j] - lat_i) / 2) ** 2 + cos_i * cos_lat[j] * math.sin((lon[j] - lon_i) / 2) ** 2
+            row[j] = matrix[j][i] = 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+    return matrix
+
+
+class _Problem:
+    """
+    Open-path TSP with time windows over stops 0..n-1. `travel` is in
+    seconds and windows [opens, closes] bound the arrival. Routes are
+    handled padded with a virtual node n at both ends: leaving it costs the
+    `depot` leg (nothing without one), reaching it costs nothing, so every
+    stop has two neighbours and all lookups are plain list indexing. The
+    technician reaches the first stop as it opens.
+    """
+
+    def __init__(self, travel, opens, closes, service, depot=None):
+        n = len(opens)
+        self.home = n
+        self.travel = [row + [0.0] for row in travel]
+        self.travel.append((list(depot) if depot is not None else [0.0] * n) + [0.0])
+        self.opens = opens
+        self.closes = closes
+        self.service = service
+
+    def simulate(self, order: Sequence[int]):
+        """Arrival time, wait and lateness per stop; total drive and lateness."""
+        timeline, drive, late_total = [], 0.0, 0.0
+        t, prev = None, self.home
+        for s in order:
+            leg = self.travel[prev][s]
+            drive += leg
+            arrival = self.opens[s] if t is None else t + leg
+            wait = max(0.0, self.opens[s] - arrival)
+            late = max(0.0, arrival - self.closes[s])
+            late_total += late
+            timeline.append((arrival, wait, late))
+            t = arrival + wait + self.service
+            prev = s
+        return timeline, drive, late_total
+
+    def _states(self, route: Sequence[int]) -> list:
+        """(departure, drive, lateness) after each position of a padded route."""
+        states = [(None, 0.0, 0.0)]
+        t, drive, late = None, 0.0, 0.0
+        for pos in range(1, len(route) - 1):
+            s = route[pos]
+            leg = self.travel[route[pos - 1]][s]
+            arrival = self.opens[s] if t is None else t + leg
+            drive += leg
+            if arrival > self.closes[s]:
+                late += arrival - self.closes[s]
+            t = max(arrival, self.opens[s]) + self.service
+            states.append((t, drive, late))
+        return states
+
+    def _cost_from(self, route, start: int, stop: int, states: list, bound: float):
+        """
+        Cost of a padded route that differs from the one behind `states`
+        only at positions start..stop. Returns None once it cannot beat
+        `bound`, including as soon as the first unchanged stop is reached
+        no earlier and no cheaper than before: the rest is then the same
+        drive with at least the same lateness.
+        """
+        travel, opens, closes, service = self.travel, self.opens, self.closes, self.service
+        t, drive, late = states[start - 1]
+        prev = route[start - 1]
+        for pos in range(start, len(route) - 1):
+            s = route[pos]
+            leg = travel[prev][s]
+            arrival = opens[s] if t is None else t + leg
+            drive += leg
+            if arrival > closes[s]:
+                late += arrival - closes[s]
+            cost = drive + LATENESS_WEIGHT * late
+            if cost >= bound:
+                return None
+            t = arrival if arrival > opens[s] else opens[s]
+            t += service
+            if pos == stop + 1:
+                old_t, old_drive, old_late = states[pos]
+                if t >= old_t and cost >= old_drive + LATENESS_WEIGHT * old_late:
+                    return None
+            prev = s
+        return drive + LATENESS_WEIGHT * late, late
+
+    def nearest_neighbour(self) -> List[int]:
+        """Greedy build: always go where work can start soonest, on time first."""
+        travel = self.travel
+        todo = set(range(self.home))
+        first = min(todo, key=lambda s: (self.opens[s], travel[self.home][s]))
+        order, t = [first], self.opens[first] + self.service
+        todo.discard(first)
+        while todo:
+            row = travel[order[-1]]
+
+            def key(s):
+                arrival = t + row[s]
+                return (arrival > self.closes[s], max(arrival, self.opens[s]), row[s])
+
+            nxt = min(todo, key=key)
+            t = max(t + row[nxt], self.opens[nxt]) + self.service
+            order.append(nxt)
+            todo.discard(nxt)
+        return order
+
+    def improve(self, order: List[int]) -> List[int]:
+        """
+        2-opt (reverse a segment) and Or-opt (move a run of 1-3 stops)
+        until no move helps. The drive-time change of a move is O(1) from
+        the matrix, so while the route is on time only shorter candidates
+        are simulated; simulations resume from the unchanged prefix and
+        stop as soon as they can no longer win.
+        """
+        travel = self.travel
+        route = [self.home] + list(order) + [self.home]
+        n = len(order)
+        states = self._states(route)
+        best = states[-1][1] + LATENESS_WEIGHT * states[-1][2]
+        late = states[-1][2]
+
+        def accept(candidate, start, stop):
+            nonlocal route, states, best, late
+            result = self._cost_from(candidate, start, stop, states, best - 1e-6)
+            if result is None:
+                return False
+            best, late = result
+            route = candidate
+            states = self._states(route)
+            return True
+
+        for _ in range(MAX_PASSES):
+            improved = False
+            # 2-opt: reverse positions i..j
+            for i in range(1, n):
+                for j in range(i + 1, n + 1):
+                    a, b = route[i - 1], route[j + 1]
+                    delta = (travel[a][route[j]] + travel[route[i]][b]
+                             - travel[a][route[i]] - travel[route[j]][b])
+                    if delta >= -1e-9 and not late:
+                        continue
+                    if accept(route[:i] + route[i:j + 1][::-1] + route[j + 1:], i, j):
+                        improved = True
+            # Or-opt: move positions i..i+length-1 between rest[k-1] and rest[k]
+            for length in (1, 2, 3):
+                for i in range(1, n - length + 2):
+                    seg = route[i:i + length]
+                    rest = route[:i] + route[i + length:]
+                    p, q = route[i - 1], route[i + length]
+                    removed = travel[p][q] - travel[p][seg[0]] - travel[seg[-1]][q]
+                    for k in range(1, len(rest)):
+                        if k == i:
+                            continue
+                        a, b = rest[k - 1], rest[k]
+                        delta = removed + travel[a][seg[0]] + travel[seg[-1]][b] - travel[a][b]
+                        if delta >= -1e-9 and not late:
+                            continue
+                        if accept(rest[:k] + seg + rest[k:], min(i, k), max(i, k) + length - 1):
+                            improved = True
+                            break
+            if not improved:
+                break
+        return route[1:-1]
+
+
+def solve(problem: _Problem) -> List[int]:
+    if problem.home <= 1:
+        return list(range(problem.home))
+    return problem.improve(problem.nearest_neighbour())
+
+
+def plan_route(
+    db: Session,
+    technician_id: UUID,
+    day: date,
+    service_minutes: int = 30,
+    speed_kmh: float = 40.0,
+) -> dict:
+    """
+    Order a technician's open jobs starting on `day` (UTC) to cut drive
+    time while arriving inside each job's [scheduled_start_at,
+    scheduled_end_at] window where possible, starting from the
+    technician's home base when one is set. Distances are straight-line;
+    nothing is written back. Jobs whose customer has no coordinates are
+    returned in `unrouted_job_ids`.
+    """
+    tech = db.get(Technician, technician_id)
+    if tech is None:
+        raise HTTPException(status_code=404, detail="Technician not found")
+
+    day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    rows = db.execute(
+        select(
+            Job.id,
+            Job.title,
+            Job.customer_id,
+            Job.scheduled_start_at,
+            Job.scheduled_end_at,
+            Customer.latitude,
+            Customer.longitude,
+        )
+        .join(Customer, Customer.id == Job.customer_id)
+        .where(
+            Job.technician_id == technician_id,
+            Job.scheduled_start_at >= day_start,
+            Job.scheduled_start_at < day_start + timedelta(days=1),
+            Job.status.notin_(TERMINAL_JOB_STATUSES),
+        )
+        .order_by(Job.scheduled_start_at, Job.id)
+    ).all()
+
+    stops = [r for r in rows if r.latitude is not None and r.longitude is not None]
+    unrouted = [r.id for r in rows if r.latitude is None or r.longitude is None]
+
+    km = distance_matrix([(r.latitude, r.longitude) for r in stops])
+    # With a known home base the day starts there; otherwise at the first stop.
+    depot_km = None
+    if tech.latitude is not None and tech.longitude is not None:
+        depot_km = [haversine_km(tech.latitude, tech.longitude, r.latitude, r.longitude) for r in stops]
+    seconds_per_km = 3600.0 / speed_kmh
+    epoch = day_start.timestamp()
+    problem = _Problem(
+        travel=[[d * seconds_per_km for d in row] for row in km],
+        opens=[as_utc(r.scheduled_start_at).timestamp() - epoch for r in stops],
+        closes=[
+            as_utc(r.scheduled_end_at).timestamp() - epoch if r.scheduled_end_at else math.inf
+            for r in stops
+        ],
+        service=service_minutes * 60.0,
+        depot=[d * seconds_per_km for d in depot_km] if depot_km is not None else None,
+    )
+    order = solve(problem)
+    timeline, drive, _ = problem.simulate(order)
+
+    result_stops = []
+    for pos, (s, (arrival, wait, late)) in enumerate(zip(order, timeline)):
+        r = stops[s]
+        arrival_at = day_start + timedelta(seconds=arrival)
+        result_stops.append({
+            "job_id": r.id,
+            "title": r.title,
+            "customer_id": r.customer_id,
+            "latitude": r.latitude,
+            "longitude": r.longitude,
+            "window_start": r.scheduled_start_at,
+            "window_end": r.scheduled_end_at,
+            "arrival_at": arrival_at,
+            "departure_at": arrival_at + timedelta(seconds=wait + problem.service),
+            "wait_minutes": round(wait / 60, 1),
+            "late_minutes": round(late / 60, 1),
+            "leg_km": round(km[order[pos - 1]][s] if pos else (depot_km[s] if depot_km else 0.0), 3),
+        })
+
+    def path_km(seq):
+        start = depot_km[seq[0]] if depot_km and seq else 0.0
+        return start + sum(km[a][b] for a, b in zip(seq, seq[1:]))
+
+    return {
+        "technician_id": technician_id,
+        "date": day,
+        "stops": result_stops,
+        "unrouted_job_ids": unrouted,
+        "total_km": round(path_km(order), 3),
+        "scheduled_order_km": round(path_km(list(range(len(stops)))), 3),
+        "drive_minutes": round(drive / 60, 1),
+        "late_stops": sum(1 for s in result_stops if s["late_minutes"] > 0),
+    }
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.job import Job
+from ..models.technician import Technician
+from .cache import TTLCache
+from .conflicts_service import as_utc
+from .recurrence import expand_series
+
+
+SCHEDULE_MAX_WINDOW = timedelta(days=14)
+
+# Keyed by the (start, end) window in UTC; job writes drop the windows they touch.
+schedule_cache = TTLCache(ttl_seconds=10, max_entries=256)
+
+
+def invalidate_schedule(*starts) -> None:
+    """Drop cached windows containing any of the given scheduled_start_at values."""
+    points = [as_utc(s) for s in starts if s is not None]
+    if points:
+        schedule_cache.invalidate_where(
+            lambda key: any(key[0] <= p < key[1] for p in points)
+        )
+
+
+def get_schedule(db: Session, start: datetime, end: datetime) -> dict:
+    """
+    Jobs starting in [start, end), one lane per technician plus an
+    unassigned lane. One range query on scheduled_start_at, already ordered
+    by lane, is grouped in a single pass; occurrences of recurring series
+    not stored as jobs are then expanded for the window and merged in.
+    """
+    if end <= start:
+        raise HTTPException(status_code=422, detail="to must be after from")
+    if end - start > SCHEDULE_MAX_WINDOW:
+        raise HTTPException(status_code=422, detail="Window must be at most 14 days")
+
+    key = (as_utc(start), as_utc(end))
+    cached = schedule_cache.get(key)
+    if cached is not None:
+        return cached
+
+    rows = db.execute(
+        select(
+            Job.id,
+            Job.title,
+            Job.status,
+            Job.scheduled_start_at,
+            Job.scheduled_end_at,
+            Job.customer_id,
+            Job.technician_id,
+            Job.series_id,
+            Job.occurrence_start,
+            Technician.first_name,
+            Technician.last_name,
+        )
+        .outerjoin(Technician, Technician.id == Job.technician_id)
+        .where(Job.scheduled_start_at >= start, Job.scheduled_start_at < end)
+        .order_by(
+            Technician.last_name,
+            Technician.first_name,
+            Job.technician_id,
+            Job.scheduled_start_at,
+            Job.id,
+        )
+    )
+
+    lanes, unassigned, lane = [], [], None
+    for (job_id, title, status, job_start, job_end, customer_id, tech_id,
+         series_id, occurrence_start, first_name, last_name) in rows:
+        item = {
+            "id": job_id,
+            "title": title,
+            "status": status,
+            "scheduled_start_at": job_start,
+            "scheduled_end_at": job_end,
+            "customer_id": customer_id,
+            "series_id": series_id,
+            "occurrence_start": occurrence_start,
+        }
+        if tech_id is None:
+            unassigned.append(item)
+            continue
+        if lane is None or lane["technician_id"] != tech_id:
+            lane = {
+                "technician_id": tech_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "jobs": [],
+            }
+            lanes.append(lane)
+        lane["jobs"].append(item)
+
+    occurrences = expand_series(db, start, end)
+    if occurrences:
+        _merge_occurrences(db, occurrences, lanes, unassigned)
+
+    result = {"start": start, "end": end, "lanes": lanes, "unassigned": unassigned}
+    schedule_cache.set(key, result)
+    return result
+
+
+def _merge_occurrences(db: Session, occurrences: list, lanes: list, unassigned: list) -> None:
+    by_tech = {lane["technician_id"]: lane for lane in lanes}
+    missing = {o["technician_id"] for o in occurrences if o["technician_id"] is not None} - set(by_tech)
+    if missing:
+        for tech_id, first_name, last_name in db.execute(
+            select(Technician.id, Technician.first_name, Technician.last_name).where(Technician.id.in_(missing))
+        ):
+            by_tech[tech_id] = {"technician_id": tech_id, "first_name": first_name, "last_name": last_name, "jobs": []}
+            lanes.append(by_tech[tech_id])
+        lanes.sort(key=lambda lane: (lane["last_name"], lane["first_name"], str(lane["technician_id"])))
+
+    for occ in occurrences:
+        item = {
+            "id": None,
+            "series_id": occ["series_id"],
+            "occurrence_start": occ["occurrence_start"],
+            "title": occ["title"],
+            "status": occ["status"],
+            "scheduled_start_at": occ["scheduled_start_at"],
+            "scheduled_end_at": occ["scheduled_end_at"],
+            "customer_id": occ["customer_id"],
+        }
+        lane = by_tech.get(occ["technician_id"])
+        (lane["jobs"] if lane is not None else unassigned).append(item)
+    for jobs in [lane["jobs"] for lane in lanes] + [unassigned]:
+        jobs.sort(key=lambda item: (as_utc(item["scheduled_start_at"]), item["id"] or 0))
@@ -0,0 +1,126 @@
+import re
+from abc import ABC, abstractmethod
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import desc, func, literal, literal_column, or_, select, text
+from sqlalchemy.orm import Query, Session
+from ..models.customer import Customer
+from ..models.technician import Technician
+
+
+# Must match the expressions of ix_technicians_search_trgm (migration
+# e19b6d3a5c08) and ix_customers_search_trgm character for character, or
+# Postgres won't use the indexes.
+TRGM_DOCUMENT = literal_column(
+    "lower(technicians.first_name || ' ' || technicians.last_name || ' ' || "
+    "technicians.email || ' ' || coalesce(technicians.phone, ''))"
+)
+CUSTOMER_TRGM_DOCUMENT = literal_column(
+    "lower(customers.name || ' ' || coalesce(customers.email, '') || ' ' || "
+    "coalesce(customers.phone, '') || ' ' || coalesce(customers.address, ''))"
+)
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[.@+-][^\W_]+)*", re.UNICODE)
+
+
+def search_terms(q: str) -> List[str]:
+    """Lower-cased words of a search box entry; punctuation is dropped."""
+    return _TOKEN_RE.findall(q.lower())
+
+
+class TextSearch(ABC):
+    """
+    Text search behind a list `q=` filter. `apply` narrows a query to rows
+    matching every term (as a word prefix, or more loosely where the
+    backend supports it) and returns the ORDER BY clauses that rank the
+    best matches first.
+    """
+
+    @abstractmethod
+    def apply(self, qry: Query, q: str) -> Tuple[Query, list]:
+        """(narrowed query, ranking ORDER BY clauses) for search string `q`."""
+
+
+class TrigramSearch(TextSearch):
+    """Postgres: substring and fuzzy word matches served by a pg_trgm GIN index on `document`."""
+
+    def __init__(self, document):
+        self.document = document
+
+    def apply(self, qry, q):
+        terms = search_terms(q)
+        if not terms:
+            return qry, []
+        score = None
+        for term in terms:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            qry = qry.filter(or_(
+                self.document.like(pattern, escape="\\"),
+                literal(term).op("<%")(self.document),
+            ))
+            term_score = func.word_similarity(term, self.document)
+            score = term_score if score is None else score + term_score
+        return qry, [desc(score)]
+
+
+class FullTextSearch(TextSearch):
+    """SQLite: FTS5 word-prefix matches ranked by bm25, from the `fts_table` mirroring `table`."""
+
+    def __init__(self, fts_table: str, table: str):
+        self.fts_table = fts_table
+        self.table = table
+
+    def apply(self, qry, q):
+        terms = search_terms(q)
+        if not terms:
+            return qry, []
+        # Every term as a quoted prefix query: "jo"* "smi"*
+        match = " ".join('"' + t.replace('"', '""') + '"*' for t in terms)
+        hits = (
+            select(
+                literal_column("rowid").label("rowid"),
+                literal_column(f"bm25({self.fts_table})").label("rank"),
+            )
+            .select_from(text(self.fts_table))
+            .where(text(f"{self.fts_table} MATCH :match").bindparams(match=match))
+            .subquery()
+        )
+        qry = qry.join(hits, hits.c.rowid == literal_column(f"{self.table}.rowid"))
+        return qry, [hits.c.rank]
+
+
+class LikeSearch(TextSearch):
+    """Any other database: unindexed substring match of each term on `columns`."""
+
+    def __init__(self, columns: Sequence):
+        self.columns = columns
+
+    def apply(self, qry, q):
+        for term in search_terms(q):
+            like = f"%{term}%"
+            qry = qry.filter(or_(*(c.ilike(like) for c in self.columns)))
+        return qry, []
+
+
+_TECHNICIAN_BACKENDS = {
+    "postgresql": TrigramSearch(TRGM_DOCUMENT),
+    "sqlite": FullTextSearch("technicians_fts", "technicians"),
+}
+_CUSTOMER_BACKENDS = {
+    "postgresql": TrigramSearch(CUSTOMER_TRGM_DOCUMENT),
+    "sqlite": FullTextSearch("customers_fts", "customers"),
+}
+
+
+def technician_search(db: Session) -> TextSearch:
+    return _TECHNICIAN_BACKENDS.get(
+        db.get_bind().dialect.name,
+        LikeSearch([Technician.first_name, Technician.last_name, Technician.email, Technician.phone]),
+    )
+
+
+def customer_search(db: Session) -> TextSearch:
+    return _CUSTOMER_BACKENDS.get(
+        db.get_bind().dialect.name,
+        LikeSearch([Customer.name, Customer.email, Customer.phone, Customer.address]),
+    )
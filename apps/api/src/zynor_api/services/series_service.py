@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from ..models.customer import Customer
+from ..models.job import Job
+from ..models.job_series import JobSeries
+from ..models.technician import Technician
+from ..routers.jobs.schemas import JobCreate
+from ..routers.job_series.schemas import JobSeriesCreate, OccurrenceMaterialize
+from .conflicts_service import as_utc
+from .jobs_service import create_job
+from .recurrence import OCCURRENCE_STATUS, expand_series, is_occurrence, last_occurrence, parse_rule
+from .schedule_service import invalidate_schedule, schedule_cache
+
+
+OCCURRENCES_MAX_WINDOW = timedelta(days=366)
+
+
+def get_series(db: Session, series_id: int) -> JobSeries | None:
+    return db.get(JobSeries, series_id)
+
+
+def create_series(db: Session, data: JobSeriesCreate) -> JobSeries:
+    try:
+        rule = parse_rule(data.rule, as_utc(data.dtstart))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid rule: {e}")
+    if db.get(Customer, data.customer_id) is None:
+        raise HTTPException(status_code=409, detail="Invalid foreign key reference")
+    if data.technician_id is not None and db.get(Technician, data.technician_id) is None:
+        raise HTTPException(status_code=409, detail="Invalid foreign key reference")
+
+    obj = JobSeries(
+        title=data.title.strip(),
+        description=data.description.strip() if data.description else None,
+        customer_id=data.customer_id,
+        technician_id=data.technician_id,
+        rule=data.rule.strip(),
+        dtstart=data.dtstart,
+        duration_minutes=data.duration_minutes,
+        ends_at=last_occurrence(rule, data.dtstart),
+    )
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    # A new series can show up in any cached window.
+    schedule_cache.clear()
+    return obj
+
+
+def delete_series(db: Session, series_id: int) -> None:
+    """Stop the series. Occurrences already stored as jobs are kept as plain jobs."""
+    obj = db.get(JobSeries, series_id)
+    if not obj:
+        raise HTTPException(status_code=404, detail="Job series not found")
+
+    db.execute(update(Job).where(Job.series_id == series_id).values(series_id=None, version=Job.version + 1))
+    db.delete(obj)
+    db.commit()
+    schedule_cache.clear()
+
+
+def list_occurrences(db: Session, series_id: int, start: datetime, end: datetime) -> list:
+    """
+    Occurrences of one series whose rule start falls in [start, end):
+    stored ones carry their job's current values and `job_id`.
+    """
+    if end <= start:
+        raise HTTPException(status_code=422, detail="to must be after from")
+    if end - start > OCCURRENCES_MAX_WINDOW:
+        raise HTTPException(status_code=422, detail="Window must be at most 366 days")
+    if db.get(JobSeries, series_id) is None:
+        raise HTTPException(status_code=404, detail="Job series not found")
+
+    items = expand_series(db, start, end, series_id=series_id)
+    stored = db.execute(
+        select(Job).where(
+            Job.series_id == series_id,
+            Job.occurrence_start >= start,
+            Job.occurrence_start < end,
+        )
+    ).scalars()
+    for job in stored:
+        items.append({
+            "series_id": series_id,
+            "occurrence_start": as_utc(job.occurrence_start),
+            "job_id": job.id,
+            "title": job.title,
+            "status": job.status,
+            "scheduled_start_at": job.scheduled_start_at,
+            "scheduled_end_at": job.scheduled_end_at,
+            "customer_id": job.customer_id,
+            "technician_id": job.technician_id,
+        })
+    items.sort(key=lambda item: item["occurrence_start"])
+    return items
+
+
+def materialize_occurrence(db: Session, series_id: int, payload: OccurrenceMaterialize) -> Job:
+    """
+    Store one occurrence as a job so it can be changed or assigned on its
+    own. Fields not given are taken from the series; materializing with
+    status CANCELLED skips the occurrence.
+    """
+    series = db.get(JobSeries, series_id)
+    if not series:
+        raise HTTPException(status_code=404, detail="Job series not found")
+    occurrence_start = as_utc(payload.occurrence_start)
+    rule = parse_rule(series.rule, as_utc(series.dtstart))
+    if not is_occurrence(rule, series.dtstart, occurrence_start):
+        raise HTTPException(status_code=422, detail="occurrence_start is not an occurrence of this series")
+
+    existing = db.execute(
+        select(Job.id).where(Job.series_id == series_id, Job.occurrence_start == occurrence_start)
+    ).scalar()
+    if existing is not None:
+        raise HTTPException(status_code=409, detail=f"Occurrence is already stored as job {existing}")
+
+    overrides = payload.model_dump(exclude_unset=True, exclude={"occurrence_start"})
+    job_in = JobCreate(**{
+        "title": series.title,
+        "description": series.description,
+        "status": OCCURRENCE_STATUS,
+        "scheduled_start_at": occurrence_start,
+        "scheduled_end_at": occurrence_start + timedelta(minutes=series.duration_minutes),
+        "customer_id": series.customer_id,
+        "technician_id": series.technician_id,
+        **overrides,
+    })
+    job = create_job(db, job_in, series_id=series_id, occurrence_start=occurrence_start)
+    # The generated occurrence disappears from its original window.
+    invalidate_schedule(occurrence_start)
+    return job
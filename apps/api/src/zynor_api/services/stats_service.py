@@ -0,0 +1,156 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, delete
+from sqlalchemy.orm import Session
+from ..models.job import Job
+from ..models.technician import Technician
+from ..models.kpi_rollup import KpiRollup
+from .conflicts_service import as_utc
+
+
+JOBS_BY_STATUS = "jobs_by_status"
+JOBS_BY_TECHNICIAN = "jobs_by_technician_status"
+JOBS_BY_DAY = "jobs_by_day_status"
+TECHNICIANS_BY_ACTIVE = "technicians_by_active"
+
+UNASSIGNED = "unassigned"
+UNSCHEDULED = "unscheduled"
+
+# jobs_by_day grows with the booking history, so it is always read for a
+# bounded range: this far either side of today, or of the one given end.
+DEFAULT_DAY_WINDOW = timedelta(days=30)
+MAX_DAY_RANGE = timedelta(days=366)
+
+
+def job_buckets(status, technician_id, scheduled_start_at) -> list:
+    """The (metric, key) counters a job with these values contributes to."""
+    tech = str(technician_id) if technician_id is not None else UNASSIGNED
+    day = as_utc(scheduled_start_at).date().isoformat() if scheduled_start_at is not None else UNSCHEDULED
+    return [
+        (JOBS_BY_STATUS, status),
+        (JOBS_BY_TECHNICIAN, f"{tech}|{status}"),
+        (JOBS_BY_DAY, f"{day}|{status}"),
+    ]
+
+
+def technician_buckets(is_active) -> list:
+    return [(TECHNICIANS_BY_ACTIVE, "inactive" if is_active is False else "active")]
+
+
+def rollup_deltas(before: Optional[list] = None, after: Optional[list] = None) -> Counter:
+    """Counter changes for one row moving from the `before` to the `after` buckets."""
+    deltas = Counter()
+    for bucket in before or []:
+        deltas[bucket] -= 1
+    for bucket in after or []:
+        deltas[bucket] += 1
+    return deltas
+
+
+def _insert_for(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def apply_rollup_deltas(db: Session, deltas: Counter) -> None:
+    """
+    Add `deltas` to the rollups inside the caller's transaction with one
+    INSERT ... ON CONFLICT DO UPDATE executemany; the caller commits.
+    Rows are written in (metric, key) order so concurrent writers lock the
+    shared rollup rows in the same order and cannot deadlock on them.
+    """
+    rows = [
+        {"metric": metric, "key": key, "value": delta}
+        for (metric, key), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+    insert = _insert_for(db)
+    stmt = insert(KpiRollup.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["metric", "key"],
+        set_={"value": KpiRollup.__table__.c.value + stmt.excluded.value},
+    )
+    db.execute(stmt, rows)
+
+
+def get_stats(db: Session, day_from: Optional[date] = None, day_to: Optional[date] = None) -> dict:
+    """
+    Read the maintained rollups; cost depends on bucket count, not on table
+    size. Per-day buckets are limited to `day_from`..`day_to` (inclusive),
+    which defaults to DEFAULT_DAY_WINDOW around today.
+    """
+    if day_from is None and day_to is None:
+        today = datetime.now(timezone.utc).date()
+        day_from, day_to = today - DEFAULT_DAY_WINDOW, today + DEFAULT_DAY_WINDOW
+    elif day_from is None:
+        day_from = day_to - DEFAULT_DAY_WINDOW
+    elif day_to is None:
+        day_to = day_from + DEFAULT_DAY_WINDOW
+    if day_to - day_from >= MAX_DAY_RANGE:
+        raise HTTPException(status_code=422, detail=f"Day range must be shorter than {MAX_DAY_RANGE.days} days")
+
+    # Day keys are "YYYY-MM-DD|STATUS", so a day range is a key range.
+    day_filter = (
+        (KpiRollup.metric == JOBS_BY_DAY)
+        & (KpiRollup.key >= day_from.isoformat())
+        & (KpiRollup.key < (day_to + timedelta(days=1)).isoformat())
+    )
+    stmt = (
+        select(KpiRollup.metric, KpiRollup.key, KpiRollup.value)
+        .where(KpiRollup.value != 0)
+        .where((KpiRollup.metric != JOBS_BY_DAY) | day_filter)
+    )
+
+    result = {
+        "jobs_by_status": {},
+        "jobs_by_technician": {},
+        "jobs_by_day": {},
+        "technicians": {"active": 0, "inactive": 0},
+    }
+    for metric, key, value in db.execute(stmt):
+        if metric == JOBS_BY_STATUS:
+            result["jobs_by_status"][key] = value
+        elif metric == JOBS_BY_TECHNICIAN:
+            tech, status = key.rsplit("|", 1)
+            result["jobs_by_technician"].setdefault(tech, {})[status] = value
+        elif metric == JOBS_BY_DAY:
+            day, status = key.rsplit("|", 1)
+            result["jobs_by_day"].setdefault(day, {})[status] = value
+        elif metric == TECHNICIANS_BY_ACTIVE:
+            result["technicians"][key] = value
+    return result
+
+
+def rebuild_rollups(db: Session) -> int:
+    """
+    Recompute every rollup from the base tables in one transaction, to
+    repair drift. Returns the number of counters written.
+    """
+    deltas = Counter()
+    job_rows = db.execute(
+        select(Job.status, Job.technician_id, Job.scheduled_start_at, func.count())
+        .group_by(Job.status, Job.technician_id, Job.scheduled_start_at)
+        .execution_options(yield_per=5000)
+    )
+    for status, tech_id, start, n in job_rows:
+        for bucket in job_buckets(status, tech_id, start):
+            deltas[bucket] += n
+    tech_rows = db.execute(
+        select(Technician.is_active, func.count()).group_by(Technician.is_active)
+    )
+    for is_active, n in tech_rows:
+        for bucket in technician_buckets(is_active):
+            deltas[bucket] += n
+
+    db.execute(delete(KpiRollup))
+    apply_rollup_deltas(db, deltas)
+    db.commit()
+    return sum(1 for d in deltas.values() if d)
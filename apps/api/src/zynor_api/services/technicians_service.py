@@ -1,13 +1,152 @@
+from collections import Counter
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_, asc, desc, String
+from sqlalchemy import String, asc, bindparam, case, cast, delete, func, insert, literal, or_, select, union_all, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+from ..models.kpi_rollup import KpiRollup
 from ..models.technician import Technician
-from ..routers.technicians.schemas import TechnicianCreate, TechnicianUpdate, TechnicianPatch
+from ..models.technician_skill import TechnicianSkill
+from ..routers.technicians.schemas import TechnicianCreate, TechnicianUpdate, TechnicianPatch, TechnicianOut, TechnicianBulkPatchItem
+from .cache import TTLCache
+from .etags import CONCURRENT_UPDATE, list_etag
+from .fieldsets import parse_fields, project
+from .pagination import (
+    cursor_key,
+    cursor_total,
+    decode_cursor_with_direction,
+    encode_cursor,
+    keyset_after,
+    keyset_order,
+    parse_cursor_key,
+)
+from .dispatch_service import roster_snapshot
+from .geo_service import technician_locator
+from .search_service import search_terms, technician_search
+from .stats_service import TECHNICIANS_BY_ACTIVE, apply_rollup_deltas, rollup_deltas, technician_buckets
+from .events_service import publish_change
+
+
+def normalize_skills(skills) -> List[str]:
+    """Trimmed, lower-cased, de-duplicated skills as stored in technician_skills."""
+    return list(dict.fromkeys(s.strip().lower() for s in skills or [] if s and s.strip()))
+
+
+def _sync_skills(db: Session, tech_id, skills) -> None:
+    """Replace the technician's technician_skills rows; runs in the caller's transaction."""
+    db.execute(delete(TechnicianSkill).where(TechnicianSkill.technician_id == tech_id))
+    rows = [{"skill": s, "technician_id": tech_id} for s in normalize_skills(skills)]
+    if rows:
+        db.execute(insert(TechnicianSkill), rows)
+
+
+# count=estimated totals for filtered lists, keyed by the normalized filters.
+technician_count_cache = TTLCache(ttl_seconds=30, max_entries=512)
+
+
+def _estimated_total(db: Session, qry, filters: dict) -> int:
+    """
+    Total for count=estimated. Unfiltered (or is_active-only) lists read
+    the technicians_by_active rollup, which is kept exact by every write;
+    other filter sets reuse a count taken in the last
+    `technician_count_cache.ttl_seconds`, so paging through a result or
+    re-running a search does not rescan.
+    """
+    if not any(v for k, v in filters.items() if k != "is_active"):
+        if filters["is_active"] is None:
+            wanted = None
+        else:
+            wanted = [key for _, key in technician_buckets(filters["is_active"])]
+        stmt = select(func.coalesce(func.sum(KpiRollup.value), 0)).where(KpiRollup.metric == TECHNICIANS_BY_ACTIVE)
+        if wanted is not None:
+            stmt = stmt.where(KpiRollup.key.in_(wanted))
+        return db.execute(stmt).scalar_one()
+
+    key = tuple(sorted(filters.items()))
+    total = technician_count_cache.get(key)
+    if total is None:
+        total = qry.order_by(None).count()
+        technician_count_cache.set(key, total)
+    return total
+
+
+FACETS = ("skills", "is_active", "hourly_rate")
+
+# Lower bounds of the hourly_rate facet buckets; the last is open-ended.
+RATE_BUCKETS = (0, 25, 50, 75, 100, 150)
+
+# Most frequent skills returned by the skills facet.
+SKILL_FACET_LIMIT = 50
+
+
+def _parse_facets(facets: Optional[str]) -> List[str]:
+    names = [f.strip() for f in (facets or "").split(",") if f.strip()]
+    unknown = sorted(set(names) - set(FACETS))
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown facet(s): {', '.join(unknown)}")
+    return list(dict.fromkeys(names))
+
+
+def _facet_counts(db: Session, qry, names: List[str]) -> dict:
+    """
+    Counts per skill, active flag and hourly_rate bucket over the rows
+    matching `qry`, as one UNION ALL of grouped queries over the filtered
+    set; skills are counted from the technician_skills index.
+    """
+    filtered = qry.order_by(None).with_entities(
+        Technician.id.label("id"),
+        Technician.is_active.label("is_active"),
+        Technician.hourly_rate.label("hourly_rate"),
+    ).cte("filtered")
+
+    branches = []
+    if "skills" in names:
+        branches.append(
+            select(literal("skills", String).label("facet"), TechnicianSkill.skill.label("value"), func.count())
+            .join(filtered, filtered.c.id == TechnicianSkill.technician_id)
+            .group_by(TechnicianSkill.skill)
+        )
+    if "is_active" in names:
+        active = case((filtered.c.is_active.is_(False), "false"), else_="true")
+        branches.append(
+            select(literal("is_active", String), active, func.count()).select_from(filtered).group_by(active)
+        )
+    if "hourly_rate" in names:
+        bucket = case(
+            (filtered.c.hourly_rate.is_(None), "unset"),
+            *((filtered.c.hourly_rate < upper, str(lower)) for lower, upper in zip(RATE_BUCKETS, RATE_BUCKETS[1:])),
+            else_=str(RATE_BUCKETS[-1]),
+        )
+        branches.append(
+            select(literal("hourly_rate", String), bucket, func.count()).select_from(filtered).group_by(bucket)
+        )
+
+    counts = {name: {} for name in names}
+    for facet, value, n in db.execute(union_all(*branches)):
+        counts[facet][value] = n
+
+    result = {}
+    if "skills" in counts:
+        top = sorted(counts["skills"].items(), key=lambda kv: (-kv[1], kv[0]))[:SKILL_FACET_LIMIT]
+        result["skills"] = [{"value": v, "count": n} for v, n in top]
+    if "is_active" in counts:
+        result["is_active"] = [{"value": v, "count": n} for v, n in sorted(counts["is_active"].items())]
+    if "hourly_rate" in counts:
+        buckets = []
+        for i, lower in enumerate(RATE_BUCKETS):
+            n = counts["hourly_rate"].get(str(lower))
+            if n:
+                upper = RATE_BUCKETS[i + 1] if i + 1 < len(RATE_BUCKETS) else None
+                label = f"{lower}-{upper}" if upper is not None else f"{lower}+"
+                buckets.append({"value": label, "count": n, "min": lower, "max": upper})
+        if counts["hourly_rate"].get("unset"):
+            buckets.append({"value": "unset", "count": counts["hourly_rate"]["unset"]})
+        result["hourly_rate"] = buckets
+    return result
 
 
 def create_technician(db: Session, data: TechnicianCreate, user_id: int) -> Technician:
@@ -23,15 +162,27 @@ def create_technician(db: Session, data: TechnicianCreate, user_id: int) -> Tech
         fields["phone"] = data.phone
     if data.skills is not None:
         fields["skills"] = data.skills
+    if data.hourly_rate is not None:
+        fields["hourly_rate"] = data.hourly_rate
+    if data.latitude is not None and data.longitude is not None:
+        fields["latitude"] = data.latitude
+        fields["longitude"] = data.longitude
 
     obj = Technician(**fields)
     db.add(obj)
+    apply_rollup_deltas(db, rollup_deltas(after=technician_buckets(obj.is_active)))
     try:
+        # The skill rows reference the new technician, so insert it first.
+        db.flush()
+        _sync_skills(db, obj.id, obj.skills)
         db.commit()
     except IntegrityError:
         db.rollback()
         raise
     db.refresh(obj)
+    roster_snapshot.invalidate()
+    technician_locator.record(obj)
+    publish_change("technician", "created", obj.id)
     return obj
 
 
@@ -39,29 +190,23 @@ def get_technician(db: Session, tech_id: UUID) -> Technician | None:
     return db.get(Technician, tech_id)
 
 
-def list_technicians_db(
+def _filter_technicians(
     db: Session,
-    page: int = 1,
-    page_size: int = 25,
     q: Optional[str] = None,
     first_name: Optional[str] = None,
     last_name: Optional[str] = None,
     email: Optional[str] = None,
     is_active: Optional[bool] = None,
-    skill: Optional[str] = None,
+    skill: Optional[List[str]] = None,
+    match: str = "all",
     min_rate: Optional[float] = None,
     max_rate: Optional[float] = None,
-    sort: Optional[List[str]] = None,
 ):
+    """The list filters as a Technician query, plus the `q=` relevance ordering."""
     qry = db.query(Technician)
+    relevance = []
     if q:
-        like = f"%{q.strip()}%"
-        qry = qry.filter(or_(
-            Technician.first_name.ilike(like),
-            Technician.last_name.ilike(like),
-            Technician.email.ilike(like),
-            Technician.phone.ilike(like),
-        ))
+        qry, relevance = technician_search(db).apply(qry, q)
     if first_name:
         qry = qry.filter(Technician.first_name.ilike(f"%{first_name.strip()}%"))
     if last_name:
@@ -70,38 +215,242 @@ def list_technicians_db(
         qry = qry.filter(Technician.email.ilike(f"%{email.strip()}%"))
     if is_active is not None:
         qry = qry.filter(Technician.is_active == is_active)
-    if skill:
-        try:
-            qry = qry.filter(Technician.skills.contains([skill]))
-        except Exception:
-            like = f"%{skill.strip()}%"
-            qry = qry.filter(Technician.skills.cast(String).ilike(like))
+    wanted = normalize_skills([skill] if isinstance(skill, str) else skill)
+    if wanted:
+        # Technicians with all (or any) of the skills, from the technician_skills index.
+        holders = select(TechnicianSkill.technician_id).where(TechnicianSkill.skill.in_(wanted))
+        if match == "all" and len(wanted) > 1:
+            holders = holders.group_by(TechnicianSkill.technician_id).having(func.count() == len(wanted))
+        qry = qry.filter(Technician.id.in_(holders))
     if min_rate is not None:
         qry = qry.filter(Technician.hourly_rate >= float(min_rate))
     if max_rate is not None:
         qry = qry.filter(Technician.hourly_rate <= float(max_rate))
-    if sort:
-        order_clauses = []
-        for field in sort:
-            direction = asc
-            name = field
-            if field.startswith("-"):
-                direction = desc
-                name = field[1:]
-            if hasattr(Technician, name):
-                order_clauses.append(direction(getattr(Technician, name)))
-        if order_clauses:
-            qry = qry.order_by(*order_clauses)
+    return qry, relevance
+
+
+# Sort keys for the technician list, each served by an index on the same
+# columns so a page is one index range scan wherever it starts.
+TECHNICIAN_SORT_KEYS = {
+    "first_name": (Technician.first_name, Technician.last_name, Technician.id),
+    "last_name": (Technician.last_name, Technician.first_name, Technician.id),
+    "email": (Technician.email, Technician.id),
+    "created_at": (Technician.created_at, Technician.id),
+    "updated_at": (Technician.updated_at, Technician.id),
+    "hourly_rate": (Technician.hourly_rate, Technician.id),
+}
+DEFAULT_TECHNICIAN_SORT = "first_name"
+
+
+def _sort_key(sort: Optional[str]):
+    sort = sort or DEFAULT_TECHNICIAN_SORT
+    descending = sort.startswith("-")
+    name = sort[1:] if descending else sort
+    if name not in TECHNICIAN_SORT_KEYS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unsupported sort: {sort}. Use one of: {', '.join(sorted(TECHNICIAN_SORT_KEYS))}",
+        )
+    return descending, name
+
+
+def _technician_page(
+    db: Session,
+    filters: dict,
+    page: int,
+    page_size: int,
+    sort: Optional[str],
+    cursor: Optional[str],
+):
+    """
+    The filtered query (`base`, for totals and facets) and the ordered,
+    keyset-bounded query for one page before OFFSET/LIMIT, plus what the
+    caller needs to build cursors: (base, qry, key, descending, values,
+    backwards, offset). `key` is None for relevance-ranked search.
+    """
+    base, relevance = _filter_technicians(db, **filters)
+    qry = base
+    if filters.get("q") and not sort:
+        # Relevance-ranked search has no stable key to resume from; those
+        # pages are numbered (`page`) and capped by the match set.
+        key, descending = None, False
+        qry = qry.order_by(*relevance, asc(Technician.first_name), asc(Technician.last_name), asc(Technician.id))
     else:
-        qry = qry.order_by(asc(Technician.first_name), asc(Technician.last_name))
-    total = qry.count()
-    offset = max(0, (page - 1) * page_size)
-    rows = qry.offset(offset).limit(page_size).all()
+        descending, key = _sort_key(sort)
+
+    values, backwards = None, False
+    if key is not None and cursor:
+        values, backwards = decode_cursor_with_direction(cursor, sort or DEFAULT_TECHNICIAN_SORT)
+        values = parse_cursor_key(TECHNICIAN_SORT_KEYS[key], values)
+
+    if key is not None:
+        # Backwards pages walk the reversed order from the cursor and are
+        # flipped afterwards.
+        reverse = descending != backwards
+        cols = TECHNICIAN_SORT_KEYS[key]
+        if values is not None:
+            qry = qry.filter(keyset_after(cols, values, reverse))
+        qry = qry.order_by(*keyset_order(cols, reverse))
+    offset = max(0, (page - 1) * page_size) if values is None else 0
+    return base, qry, key, descending, values, backwards, offset
+
+
+def technicians_list_etag(
+    db: Session,
+    *salt,
+    page: int = 1,
+    page_size: int = 25,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    facets: Optional[str] = None,
+    **filters,
+) -> str:
+    """
+    ETag of one technician page from an aggregate over just that page's
+    rows (and the look-ahead row), read before any row is loaded, as for
+    customers. A freshly counted total or facets also depend on rows off
+    the page; for those the rollup of all technicians and the newest
+    updated_at (an index end) are mixed in, so inserts, deletes and
+    updates anywhere change the tag rather than risk a stale total.
+    """
+    _, qry, *_, offset = _technician_page(db, filters, page, page_size, sort, cursor)
+    rows = (
+        qry.with_entities(Technician.id, Technician.version, Technician.updated_at)
+        .offset(offset)
+        .limit(page_size + 1)
+        .subquery()
+    )
+    # Ids are UUIDs, so the page's membership is folded in as their joined
+    # text rather than sum(id); sorted so the aggregation order can't matter.
+    count_, ids, versions, updated = db.execute(
+        select(
+            func.count(),
+            func.aggregate_strings(cast(rows.c.id, String), ","),
+            func.sum(rows.c.version),
+            func.max(rows.c.updated_at),
+        )
+    ).one()
+    aggregates = (count_, ",".join(sorted((ids or "").split(","))), versions, updated)
+    # Cursor pages under count=exact report the total carried in the cursor.
+    carried = count == "exact" and cursor is not None and cursor_total(cursor) is not None
+    if facets or (count != "none" and not carried):
+        fleet = db.execute(
+            select(
+                select(func.coalesce(func.sum(KpiRollup.value), 0))
+                .where(KpiRollup.metric == TECHNICIANS_BY_ACTIVE)
+                .scalar_subquery(),
+                select(func.max(Technician.updated_at)).scalar_subquery(),
+            )
+        ).one()
+        salt = (*salt, tuple(fleet))
+    return list_etag(aggregates, *salt)
+
+
+def list_technicians_db(
+    db: Session,
+    page: int = 1,
+    page_size: int = 25,
+    q: Optional[str] = None,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    email: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    skill: Optional[List[str]] = None,
+    match: str = "all",
+    min_rate: Optional[float] = None,
+    max_rate: Optional[float] = None,
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    count: str = "exact",
+    facets: Optional[str] = None,
+):
+    """
+    One page of technicians in `sort` order, resumed from `cursor` (a
+    next_cursor or prev_cursor of an earlier page) by keyset so deep pages
+    cost the same as the first; `page` still works as an offset. `count`
+    picks how `total` is produced: "exact" reads it from a COUNT(*) OVER ()
+    column of the page query itself and carries it in the cursors, so
+    later pages report the count as of the first page instead of
+    rescanning; "estimated" from rollups or a short-lived cache (see
+    `_estimated_total`); and "none" skips it. `has_more` is reported in
+    every mode. `facets` adds counts over the filtered rows (see
+    `_facet_counts`).
+    """
+    columns = parse_fields(fields, TechnicianOut.model_fields)
+    facet_names = _parse_facets(facets)
+    base, qry, key, descending, values, backwards, offset = _technician_page(
+        db,
+        dict(
+            q=q, first_name=first_name, last_name=last_name, email=email, is_active=is_active,
+            skill=skill, match=match, min_rate=min_rate, max_rate=max_rate,
+        ),
+        page, page_size, sort, cursor,
+    )
+    wanted = normalize_skills([skill] if isinstance(skill, str) else skill)
+    facet_counts = _facet_counts(db, base, facet_names) if facet_names else None
+
+    total = None
+    if count == "estimated":
+        total = _estimated_total(db, base, {
+            "q": tuple(search_terms(q)) if q else (),
+            "first_name": (first_name or "").strip().lower(),
+            "last_name": (last_name or "").strip().lower(),
+            "email": (email or "").strip().lower(),
+            "is_active": is_active,
+            "skill": (tuple(sorted(wanted)), match if len(wanted) > 1 else None) if wanted else (),
+            "min_rate": min_rate,
+            "max_rate": max_rate,
+        })
+    elif count == "exact" and values is not None:
+        # The window below would only see rows past the cursor; reuse the
+        # count the first page took rather than rescanning on every page.
+        total = cursor_total(cursor)
+        if total is None:
+            total = base.order_by(None).count()
+
+    if columns is not None:
+        # The cursors need the sort key and id even if not requested.
+        sort_names = [c.key for c in TECHNICIAN_SORT_KEYS[key]] if key is not None else []
+        qry = qry.with_entities(*(getattr(Technician, c) for c in dict.fromkeys([*columns, *sort_names])))
+
+    windowed = count == "exact" and total is None
+    if windowed:
+        # Total and page in one round-trip; the window runs before LIMIT.
+        qry = qry.add_columns(func.count().over())
+    # One extra row tells whether another page follows.
+    rows = qry.offset(offset).limit(page_size + 1).all()
+    if windowed:
+        total = rows[0][-1] if rows else (qry.order_by(None).count() if offset else 0)
+        if columns is None:
+            rows = [r[0] for r in rows]
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    # The extra row belongs to the side the query walked towards.
+    has_next = more if not backwards else True
+    has_prev = more if backwards else (values is not None or offset > 0)
+    next_cursor = prev_cursor = None
+    if key is not None and rows:
+        token = sort or DEFAULT_TECHNICIAN_SORT
+        cols = TECHNICIAN_SORT_KEYS[key]
+        carried = total if count == "exact" else None
+        if has_next:
+            next_cursor = encode_cursor(token, cursor_key(cols, rows[-1]), total=carried)
+        if has_prev:
+            prev_cursor = encode_cursor(token, cursor_key(cols, rows[0]), backwards=True, total=carried)
     return {
-        "items": rows,
+        "items": rows if columns is None else project(rows, columns),
         "page": page,
         "page_size": page_size,
         "total": total,
+        "has_more": has_next,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+        "facets": facet_counts,
     }
 
 
@@ -130,15 +479,28 @@ def update_technician(db: Session, tech_id: UUID, payload: TechnicianUpdate, use
             raise HTTPException(status_code=409, detail="Email already in use")
         obj.phone = payload.phone
 
+    previous_buckets = technician_buckets(obj.is_active)
     obj.first_name = payload.first_name
     obj.last_name = payload.last_name
     obj.skills = payload.skills or []
     obj.is_active = payload.is_active
+    obj.hourly_rate = payload.hourly_rate
+    obj.latitude = payload.latitude
+    obj.longitude = payload.longitude
     obj.updated_by_user_id = user_id
 
     db.add(obj)
-    db.commit()
+    apply_rollup_deltas(db, rollup_deltas(previous_buckets, technician_buckets(obj.is_active)))
+    _sync_skills(db, obj.id, obj.skills)
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
     db.refresh(obj)
+    roster_snapshot.invalidate()
+    technician_locator.record(obj)
+    publish_change("technician", "updated", obj.id)
     return obj
 
 
@@ -150,7 +512,11 @@ PATCHABLE_FIELDS = {
     "is_active",
     "skills",
     "hourly_rate",
+    "latitude",
+    "longitude",
 }
+# Patchable columns a patch may not set to null.
+REQUIRED_FIELDS = {name for name in PATCHABLE_FIELDS if not Technician.__table__.c[name].nullable}
 
 def patch_technician(db, tech_id: str, payload: TechnicianPatch, user_id: int):
     tech = db.query(Technician).filter(Technician.id == tech_id).first()
@@ -168,6 +534,7 @@ def patch_technician(db, tech_id: str, payload: TechnicianPatch, user_id: int):
             detail=f"Unsupported field(s): {', '.join(sorted(invalid))}"
         )
 
+    previous_buckets = technician_buckets(tech.is_active)
     for field, value in data.items():
         setattr(tech, field, value)
 
@@ -176,6 +543,9 @@ def patch_technician(db, tech_id: str, payload: TechnicianPatch, user_id: int):
 
     try:
         db.add(tech)
+        apply_rollup_deltas(db, rollup_deltas(previous_buckets, technician_buckets(tech.is_active)))
+        if "skills" in data:
+            _sync_skills(db, tech.id, tech.skills)
         db.commit()
         db.refresh(tech)
     except IntegrityError as e:
@@ -183,14 +553,172 @@ def patch_technician(db, tech_id: str, payload: TechnicianPatch, user_id: int):
         if "email" in str(e).lower():
             raise HTTPException(status_code=409, detail="Email already in use")
         raise HTTPException(status_code=400, detail="Email already in use")
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
 
+    roster_snapshot.invalidate()
+    technician_locator.record(tech)
+    publish_change("technician", "updated", tech.id)
     return tech
 
 
+def patch_technicians_batch(
+    db: Session,
+    items: List[TechnicianBulkPatchItem],
+    user_id: Optional[int],
+    atomic: bool = False,
+) -> dict:
+    """
+    Apply many partial updates in one transaction with a fixed number of
+    round-trips: one locking read of the targeted rows, one query for
+    email/phone collisions across the whole batch, one executemany UPDATE
+    per distinct set of patched fields, and one delete plus one insert for
+    the technician_skills rows. Invalid items are reported and skipped;
+    with `atomic` nothing is written unless every item is valid.
+    """
+    errors: dict[int, str] = {}
+    changes: dict[int, dict] = {}
+    seen: dict[UUID, int] = {}
+    for i, item in enumerate(items):
+        data = item.patch.model_dump(exclude_unset=True)
+        nulls = sorted(name for name, value in data.items() if value is None and name in REQUIRED_FIELDS)
+        if item.id in seen:
+            errors[i] = f"Technician also patched by item {seen[item.id]}"
+        elif not data:
+            errors[i] = "No valid fields to update"
+        elif set(data) - PATCHABLE_FIELDS:
+            errors[i] = f"Unsupported field(s): {', '.join(sorted(set(data) - PATCHABLE_FIELDS))}"
+        elif nulls:
+            errors[i] = f"Cannot be null: {', '.join(nulls)}"
+        else:
+            seen[item.id] = i
+            changes[i] = data
+
+    # Lock the targets so the values read here stay valid until commit.
+    current = {
+        row.id: row
+        for row in db.execute(
+            select(Technician.id, Technician.is_active, Technician.email, Technician.phone)
+            .where(Technician.id.in_([items[i].id for i in changes]))
+            .with_for_update()
+        )
+    } if changes else {}
+    for i in list(changes):
+        if items[i].id not in current:
+            errors[i] = "Technician not found"
+            del changes[i]
+
+    # Email and phone must stay unique: against other rows and inside the batch.
+    emails = {str(d["email"]) for d in changes.values() if d.get("email")}
+    phones = {d["phone"] for d in changes.values() if d.get("phone")}
+    taken_email, taken_phone = {}, {}
+    if emails or phones:
+        for tech_id, email, phone in db.execute(
+            select(Technician.id, Technician.email, Technician.phone).where(
+                or_(Technician.email.in_(emails), Technician.phone.in_(phones))
+            )
+        ):
+            taken_email.setdefault(email, tech_id)
+            taken_phone.setdefault(phone, tech_id)
+    for i, data in list(changes.items()):
+        tech_id = items[i].id
+        email = str(data["email"]) if data.get("email") else None
+        phone = data.get("phone") or None
+        if email is not None and taken_email.get(email, tech_id) != tech_id:
+            errors[i] = "Email already in use"
+        elif phone is not None and taken_phone.get(phone, tech_id) != tech_id:
+            errors[i] = "Phone already in use"
+        else:
+            if email is not None:
+                taken_email[email] = tech_id
+            if phone is not None:
+                taken_phone[phone] = tech_id
+            continue
+        del changes[i]
+
+    updated = []
+    if changes and not (atomic and errors):
+        now = datetime.now(timezone.utc)
+        table = Technician.__table__
+        groups: dict[tuple, list] = {}
+        deltas = Counter()
+        for i, data in changes.items():
+            tech_id = items[i].id
+            if "email" in data and data["email"] is not None:
+                data["email"] = str(data["email"])
+            groups.setdefault(tuple(sorted(data)), []).append(
+                {"b_id": tech_id, **{f"b_{k}": v for k, v in data.items()}}
+            )
+            if "is_active" in data:
+                before = current[tech_id].is_active
+                deltas.update(rollup_deltas(technician_buckets(before), technician_buckets(data["is_active"])))
+        try:
+            for names, params in groups.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("b_id"))
+                    .values(
+                        **{name: bindparam(f"b_{name}", type_=table.c[name].type) for name in names},
+                        version=table.c.version + 1,
+                        updated_at=now,
+                        updated_by_user_id=user_id,
+                    )
+                )
+                db.execute(stmt, params)
+
+            reskilled = [items[i].id for i, data in changes.items() if "skills" in data]
+            if reskilled:
+                db.execute(delete(TechnicianSkill).where(TechnicianSkill.technician_id.in_(reskilled)))
+                rows = [
+                    {"skill": skill, "technician_id": items[i].id}
+                    for i, data in changes.items() if "skills" in data
+                    for skill in normalize_skills(data["skills"])
+                ]
+                if rows:
+                    db.execute(insert(TechnicianSkill), rows)
+            apply_rollup_deltas(db, deltas)
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            # Checked above, so only a concurrent write can take an email here.
+            if "email" in str(e.orig).lower():
+                raise HTTPException(status_code=409, detail="Email already in use")
+            raise
+
+        updated = [items[i].id for i in changes]
+        roster_snapshot.invalidate()
+        for tech in db.execute(select(Technician).where(Technician.id.in_(updated))).scalars():
+            technician_locator.record(tech)
+        publish_change("technician", "updated", *updated)
+    else:
+        # Release the row locks.
+        db.rollback()
+
+    results = []
+    for i, item in enumerate(items):
+        if i in errors:
+            results.append({"index": i, "id": item.id, "ok": False, "error": errors[i]})
+        elif updated:
+            results.append({"index": i, "id": item.id, "ok": True})
+        else:
+            results.append({"index": i, "id": item.id, "ok": False, "error": "Not updated: batch has invalid items"})
+    return {"updated": len(updated), "failed": len(items) - len(updated), "results": results}
+
+
 def delete_technician(db: Session, tech_id: UUID) -> None:
     obj = db.get(Technician, tech_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Technician not found")
 
+    db.execute(delete(TechnicianSkill).where(TechnicianSkill.technician_id == tech_id))
     db.delete(obj)
-    db.commit()
+    apply_rollup_deltas(db, rollup_deltas(before=technician_buckets(obj.is_active)))
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=CONCURRENT_UPDATE)
+    roster_snapshot.forget(tech_id)
+    technician_locator.forget(tech_id)
+    publish_change("technician", "deleted", tech_id)
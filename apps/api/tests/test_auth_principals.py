@@ -0,0 +1,85 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.tests.conftest import TestingSessionLocal
+from apps.api.src.zynor_api.models.user import User
+from apps.api.src.zynor_api.security import auth
+from apps.api.src.zynor_api.security.auth import create_access_token, principal_cache, principal_changes
+
+
+def _user(role: str) -> User:
+    db = TestingSessionLocal()
+    try:
+        user = User(email=f"user-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", role=role)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+        return user
+    finally:
+        db.close()
+
+
+def _set(user_id: int, **values) -> None:
+    db = TestingSessionLocal()
+    try:
+        user = db.get(User, user_id)
+        for name, value in values.items():
+            setattr(user, name, value)
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.mark.unit
+def test_principal_cache_follows_role_and_activation_changes(client: TestClient):
+    """
+    - A verified user is cached by email and reused
+    - Changing the role or deactivating drops the entry at once
+    """
+    user = _user("dispatcher")
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user.email})}"}
+    bulk = {"items": [{"id": str(uuid.uuid4()), "patch": {"first_name": "X"}}]}
+
+    me = client.get("/auth/me", headers=headers)
+    assert me.status_code == 200 and me.json()["role"] == "dispatcher"
+    assert principal_cache.get(user.email) == (user.id, user.email, "dispatcher")
+    assert client.patch("/api/technicians", json=bulk, headers=headers).status_code == 403
+
+    _set(user.id, role="admin")
+    assert principal_cache.get(user.email) is None
+    assert client.patch("/api/technicians", json=bulk, headers=headers).status_code == 200
+
+    _set(user.id, is_active=False)
+    assert client.get("/auth/me", headers=headers).status_code == 401
+    assert client.get("/auth/me", headers={"Authorization": "Bearer nonsense"}).status_code == 401
+
+
+@pytest.mark.unit
+def test_trusted_role_claims(client: TestClient, monkeypatch):
+    """
+    With JWT_TRUST_ROLE_CLAIMS, signed uid/role claims authorize without a
+    principal lookup, except for tokens issued before the user's persisted
+    last change, which still holds after the cached timestamp is evicted.
+    """
+    monkeypatch.setattr(auth, "TRUST_ROLE_CLAIMS", True)
+    ghost = {"sub": f"ghost-{uuid.uuid4().hex[:8]}@example.com", "uid": 10**9, "role": "admin"}
+    headers = {"Authorization": f"Bearer {create_access_token(ghost)}"}
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+    user = _user("admin")
+    token = create_access_token({"sub": user.email, "uid": user.id, "role": "admin"})
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/auth/me", headers=headers).json()["id"] == user.id
+    assert principal_cache.get(user.email) is None
+    assert principal_changes.get(user.email) == 0.0
+
+    _set(user.id, role="dispatcher")
+    principal_changes.clear()
+    me = client.get("/auth/me", headers=headers)
+    assert me.status_code == 200 and me.json()["role"] == "dispatcher"
+    _set(user.id, is_active=False)
+    principal_changes.clear()
+    assert client.get("/auth/me", headers=headers).status_code == 401
@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.tests.conftest import TestingSessionLocal
+from apps.api.src.zynor_api.main import app
+from apps.api.src.zynor_api.models.user import User
+from apps.api.src.zynor_api.security.auth import get_current_user
+from apps.api.src.zynor_api.services.dedupe_service import (
+    address_tokens, candidate_pairs, customer_key, find_duplicates, normalize_phone,
+)
+
+
+@pytest.mark.unit
+def test_blocking_keys_normalize_formatting():
+    assert normalize_phone("+1 (555) 010-2030") == normalize_phone("555.010.2030") == "5550102030"
+    assert normalize_phone("n/a") is None
+    assert address_tokens("12 Harbour Road, Apt 3") == address_tokens("12 harbour rd apartment 3")
+
+    keys = [
+        customer_key(1, "Ann Lee", "555 010 2030", None, None),
+        customer_key(2, "Lee, Ann", "(555) 010-2030", "ANN@EXAMPLE.COM", None),
+        customer_key(3, "Bob Roy", None, "ann@example.com", "9 Elm Street"),
+        customer_key(4, "Cy Day", None, None, "9 Elm St."),
+        customer_key(5, "Di Fox", "1111111111", None, None),
+    ]
+    assert candidate_pairs(keys) == {(0, 1), (1, 2), (2, 3)}
+    # Oversized blocks are paired only within a name prefix, else reported.
+    skipped = []
+    assert candidate_pairs(keys, max_block_size=1, skipped=skipped) == set()
+    assert (("phone", "5550102030"), "ann", 2) in skipped
+
+    office = [customer_key(i, f"Staff {i}", "555 000 0000", None, None) for i in range(60)]
+    office += [customer_key(60, "Jon Smith", "555 000 0000", None, None),
+               customer_key(61, "Smith, Jonathan", "555 000 0000", None, None)]
+    skipped = []
+    assert candidate_pairs(office, skipped=skipped) == {(60, 61)}
+    assert skipped == [(("phone", "5550000000"), "sta", 60)]
+
+
+@pytest.mark.unit
+def test_find_and_merge_duplicate_customers(client: TestClient):
+    """
+    - find_duplicates pairs rows that differ only in formatting, not strangers
+    - POST /api/customers/{id}/merge moves jobs, fills gaps and deletes the duplicates
+    """
+    tag = uuid.uuid4().hex[:8]
+    phone = f"555{int(tag, 16) % 10**7:07d}"
+    keep = client.post("/api/customers", json={"name": "Ann Lee", "phone": phone}).json()
+    dup = client.post("/api/customers", json={
+        "name": "Lee, Ann", "phone": f"+1 ({phone[:3]}) {phone[3:6]}-{phone[6:]}",
+        "email": f"ann-{tag}@example.com", "address": f"{int(tag, 16) % 9000 + 1} Harbour Road",
+    }).json()
+    other = client.post("/api/customers", json={"name": "Zed Quinn", "phone": phone}).json()
+
+    db = TestingSessionLocal()
+    try:
+        pairs = {(p["customer_id"], p["duplicate_id"]): p for p in find_duplicates(db, min_score=0.8)}
+    finally:
+        db.close()
+    assert set(pairs[(keep["id"], dup["id"])]["reasons"]) == {"name", "phone"}
+    assert (keep["id"], other["id"]) not in pairs
+
+    job = client.post("/api/jobs", json={"title": "Leak", "customer_id": dup["id"]}).json()
+    job_etag = client.get(f"/api/jobs/{job['id']}").headers["ETag"]
+    body = {"duplicate_ids": [dup["id"]]}
+    assert client.post(f"/api/customers/{keep['id']}/merge", json=body).status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: User(email="ops@example.com", role="admin")
+    assert client.post(f"/api/customers/{keep['id']}/merge", json={"duplicate_ids": [keep["id"]]}).status_code == 422
+    resp = client.post(f"/api/customers/{keep['id']}/merge", json={"duplicate_ids": [dup["id"], 10**9]})
+    assert resp.status_code == 404
+
+    resp = client.post(f"/api/customers/{keep['id']}/merge", json=body)
+    assert resp.status_code == 200, resp.text
+    result = resp.json()
+    assert result["merged_ids"] == [dup["id"]] and result["jobs_moved"] == 1
+    assert result["customer"]["email"] == dup["email"] and result["customer"]["address"] == dup["address"]
+    assert result["customer"]["phone"] == phone
+
+    moved = client.get(f"/api/jobs/{job['id']}")
+    assert moved.json()["customer_id"] == keep["id"] and moved.headers["ETag"] != job_etag
+    assert client.get(f"/api/customers/{dup['id']}").status_code == 404
@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _walk(client: TestClient, params: dict):
+    pages, cursor = [], None
+    while True:
+        resp = client.get("/api/customers", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        pages.append([c["id"] for c in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.unit
+def test_list_customers_pages_and_search(client: TestClient):
+    """
+    GET /api/customers?q=...&limit=...&cursor=...:
+    - q matches word prefixes of name, email, phone and address (all terms)
+    - next_cursor walks every match once, in (name, id) order
+    - sort=-id reverses; unknown sorts and foreign cursors are rejected
+    """
+    tag = f"cust{uuid.uuid4().hex[:8]}"
+    names = ["Bravo", "Alpha", "Charlie", "Alpha", "Delta"]
+    customers = [
+        client.post("/api/customers", json={
+            "name": f"{name} {tag}",
+            "email": f"{tag}-{i}@example.com",
+            "phone": f"555{i:04d}",
+            "address": f"{i} Harbour Road",
+        }).json()
+        for i, name in enumerate(names)
+    ]
+
+    pages = _walk(client, {"q": tag, "limit": 2})
+    assert [len(p) for p in pages] == [2, 2, 1]
+    by_name = sorted(customers, key=lambda c: (c["name"], c["id"]))
+    assert sum(pages, []) == [c["id"] for c in by_name]
+
+    pages = _walk(client, {"q": tag, "limit": 3, "sort": "-id"})
+    assert sum(pages, []) == sorted((c["id"] for c in customers), reverse=True)
+
+    def search(q):
+        return {c["id"] for c in client.get("/api/customers", params={"q": q, "limit": 200}).json()["items"]}
+
+    assert search(f"alp {tag}") == {customers[1]["id"], customers[3]["id"]}
+    assert search(f"{tag}-2") == {customers[2]["id"]}
+    assert customers[4]["id"] in search(f"5550004 {tag}")
+    assert search(f"harb {tag}") == {c["id"] for c in customers}
+    assert search(f"{tag} nosuchword") == set()
+
+    sparse = client.get("/api/customers", params={"q": tag, "limit": 2, "fields": "id"}).json()
+    assert set(sparse["items"][0]) >= {"id"} and sparse["next_cursor"]
+    rest = client.get("/api/customers", params={"q": tag, "limit": 2, "cursor": sparse["next_cursor"]}).json()
+    assert [c["id"] for c in rest["items"]] == [c["id"] for c in by_name[2:4]]
+
+    assert client.get("/api/customers", params={"sort": "email"}).status_code == 422
+    assert client.get("/api/customers", params={"limit": 500}).status_code == 422
+    assert client.get("/api/customers", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/customers", params={"sort": "id", "cursor": sparse["next_cursor"]}).status_code == 400
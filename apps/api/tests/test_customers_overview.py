@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_customer_overview(client: TestClient):
+    """
+    GET /api/customers/{id}/overview:
+    - Counts jobs by status, finds the next open visit and the last technician
+    - Pages recent jobs newest first with next_cursor
+    - Reflects job writes for the customer straight away despite the cache
+    """
+    tag = uuid.uuid4().hex[:8]
+    customer = client.post("/api/customers", json={"name": f"Overview {tag}"}).json()
+    tech = client.post("/api/technicians", json={
+        "first_name": "Olga", "last_name": "Visit", "email": f"olga-{tag}@example.com",
+    }).json()
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def job(days, status="SCHEDULED", technician=None):
+        body = {"title": f"Visit {days}", "customer_id": customer["id"], "status": status}
+        if days is not None:
+            body["scheduled_start_at"] = (now + timedelta(days=days)).isoformat()
+        if technician:
+            body["technician_id"] = technician
+        resp = client.post("/api/jobs", json=body)
+        assert resp.status_code == 201, resp.text
+        return resp.json()
+
+    past = job(-10, "COMPLETED", tech["id"])
+    job(-3, "CANCELLED")
+    soon = job(2)
+    job(9)
+
+    url = f"/api/customers/{customer['id']}/overview"
+    body = client.get(url, params={"jobs_limit": 3}).json()
+    assert body["customer"]["name"] == customer["name"]
+    assert body["job_count"] == 4
+    assert body["status_counts"] == {"COMPLETED": 1, "CANCELLED": 1, "SCHEDULED": 2}
+    assert body["next_visit"]["id"] == soon["id"]
+    assert body["last_technician"]["technician_id"] == tech["id"]
+    assert body["last_technician"]["job_id"] == past["id"]
+    assert [j["title"] for j in body["recent_jobs"]] == ["Visit 9", "Visit 2", "Visit -3"]
+
+    rest = client.get(url, params={"jobs_limit": 3, "jobs_cursor": body["next_cursor"]}).json()
+    assert [j["id"] for j in rest["recent_jobs"]] == [past["id"]] and rest["next_cursor"] is None
+
+    # Cached, but the new job for this customer drops the entry.
+    unscheduled = job(None, "NEW")
+    body = client.get(url, params={"jobs_limit": 3}).json()
+    assert body["job_count"] == 5 and body["recent_jobs"][0]["id"] == unscheduled["id"]
+
+    client.patch(f"/api/jobs/{soon['id']}", json={"status": "CANCELLED"})
+    body = client.get(url, params={"jobs_limit": 3}).json()
+    assert body["next_visit"]["title"] == "Visit 9"
+    assert body["status_counts"]["CANCELLED"] == 2
+
+    assert client.get("/api/customers/999999999/overview").status_code == 404
+    assert client.get(url, params={"jobs_cursor": "bogus"}).status_code == 400
@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _revalidate(client: TestClient, url: str, params=None):
+    first = client.get(url, params=params)
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    again = client.get(url, params=params, headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["ETag"] == etag
+    return etag
+
+
+@pytest.mark.unit
+def test_entity_etags_change_on_every_write(client: TestClient):
+    """
+    GET /api/{technicians,customers,jobs}/{id}:
+    - Repeat requests with If-None-Match get 304 and no body
+    - Any write, including bulk transitions, yields a new ETag
+    """
+    tech = client.post("/api/technicians", json={
+        "first_name": "Etag", "last_name": "Tech", "email": f"etag-{uuid.uuid4().hex}@example.com",
+    }).json()
+    customer = client.post("/api/customers", json={"name": "Etag Customer"}).json()
+    job = client.post("/api/jobs/", json={"title": "Etag job", "customer_id": customer["id"]}).json()
+
+    tech_url, customer_url, job_url = (
+        f"/api/technicians/{tech['id']}", f"/api/customers/{customer['id']}", f"/api/jobs/{job['id']}",
+    )
+    tech_etag = _revalidate(client, tech_url)
+    customer_etag = _revalidate(client, customer_url)
+    job_etag = _revalidate(client, job_url)
+
+    client.put(tech_url, json={"first_name": "Etag", "last_name": "Tech", "phone": "+1 555 0100", "is_active": True})
+    client.put(customer_url, json={"name": "Etag Customer Renamed"})
+    resp = client.post("/api/jobs:transition", json={"ids": [job["id"]], "status": "SCHEDULED"})
+    assert resp.status_code == 200, resp.text
+
+    for url, old in ((tech_url, tech_etag), (customer_url, customer_etag), (job_url, job_etag)):
+        resp = client.get(url, headers={"If-None-Match": old})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != old
+
+    assert client.get("/api/customers/999999999", headers={"If-None-Match": '"v1"'}).status_code == 404
+
+
+@pytest.mark.unit
+def test_list_etags_track_the_filtered_rows(client: TestClient):
+    """
+    GET /api/technicians and /api/jobs/:
+    - The ETag holds while nothing in the filter changes
+    - Creating or updating a matching row yields a new one
+    - A page that reports a total also moves with writes off the page
+    """
+    tag = f"Lst{uuid.uuid4().hex[:8]}"
+    params = {"last_name": tag, "count": "none"}
+    first = client.post("/api/technicians", json={
+        "first_name": "List", "last_name": tag, "email": f"list-{uuid.uuid4().hex}@example.com",
+    }).json()
+    etag = _revalidate(client, "/api/technicians", params)
+
+    client.post("/api/technicians", json={"first_name": "Other", "last_name": "Unrelated", "email": f"o-{uuid.uuid4().hex}@example.com"})
+    assert client.get("/api/technicians", params=params, headers={"If-None-Match": etag}).status_code == 304
+    counted = _revalidate(client, "/api/technicians", {"last_name": tag})
+    client.post("/api/technicians", json={"first_name": "Third", "last_name": "Unrelated", "email": f"t-{uuid.uuid4().hex}@example.com"})
+    assert client.get("/api/technicians", params={"last_name": tag}, headers={"If-None-Match": counted}).status_code == 200
+    assert client.get("/api/technicians", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    client.put(f"/api/technicians/{first['id']}", json={"first_name": "Listed", "last_name": tag, "is_active": True})
+    resp = client.get("/api/technicians", params=params, headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and resp.json()["items"][0]["first_name"] == "Listed"
+
+    customer = client.post("/api/customers", json={"name": "Etag List Customer"}).json()
+    job_params = {"customer_id": customer["id"]}
+    etag = _revalidate(client, "/api/jobs/", job_params)
+    client.post("/api/jobs/", json={"title": "Listed job", "customer_id": customer["id"]})
+    assert client.get("/api/jobs/", params=job_params, headers={"If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.unit
+def test_concurrent_update_is_a_conflict(client: TestClient):
+    """An ORM write based on a row another request has since updated returns 409, not 500."""
+    from fastapi import HTTPException
+    from apps.api.tests.conftest import TestingSessionLocal
+    from apps.api.src.zynor_api.models.customer import Customer
+    from apps.api.src.zynor_api.routers.customers.schemas import CustomerUpdate
+    from apps.api.src.zynor_api.services.customers_service import update_customer
+
+    customer = client.post("/api/customers", json={"name": "Racing Customer"}).json()
+    db = TestingSessionLocal()
+    try:
+        stale = db.get(Customer, customer["id"])
+        assert stale.version == 1
+        client.put(f"/api/customers/{customer['id']}", json={"name": "Won the race"})
+        with pytest.raises(HTTPException) as exc:
+            update_customer(db, customer["id"], CustomerUpdate(name="Lost the race"))
+        assert exc.value.status_code == 409
+    finally:
+        db.close()
+    assert client.get(f"/api/customers/{customer['id']}").json()["name"] == "Won the race"
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from apps.api.src.zynor_api.services.events_service import EventHub
+
+
+@pytest.mark.unit
+def test_event_hub_resumes_from_last_event_id():
+    async def scenario():
+        hub = EventHub(history=3, queue_size=10)
+        loop = asyncio.get_running_loop()
+        hub.publish_many([("jobs", "job.created", {"id": 1}), ("customers", "customer.created", {"id": 2})])
+
+        sub, backlog, gap = hub.subscribe(loop, {"jobs"}, last_event_id=0)
+        assert [e.type for e in backlog] == ["job.created"] and not gap
+
+        hub.publish_many([("customers", "customer.updated", {"id": 2}), ("jobs", "job.updated", {"id": 1})])
+        event = await asyncio.wait_for(sub.queue.get(), 1)
+        assert (event.id, event.type) == (4, "job.updated")
+        hub.unsubscribe(sub)
+
+        # Events 1 and 2 fell out of the 3-entry history.
+        hub.publish_many([("jobs", "job.deleted", {"id": 1})])
+        _, backlog, gap = hub.subscribe(loop, None, last_event_id=0)
+        assert gap and [e.id for e in backlog] == [3, 4, 5]
+
+        # An id this hub never issued (restart, other worker) is a gap too.
+        _, backlog, gap = hub.subscribe(loop, None, last_event_id=5)
+        assert not gap and backlog == []
+        _, backlog, gap = hub.subscribe(loop, None, last_event_id=6)
+        assert gap and backlog == []
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_event_hub_flags_slow_clients():
+    async def scenario():
+        hub = EventHub(queue_size=2)
+        sub, _, _ = hub.subscribe(asyncio.get_running_loop())
+        hub.publish_many(("jobs", "job.updated", {"id": i}) for i in range(5))
+        await asyncio.sleep(0)
+        assert sub.overflowed and sub.queue.qsize() == 2
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_events_socket_receives_customer_writes(client):
+    with client.websocket_connect("/api/events/ws?topics=customers") as ws:
+        customer = client.post("/api/customers", json={"name": "Feed Customer"}).json()
+        message = ws.receive_json()
+    assert message["type"] == "customer.created"
+    assert message["data"] == {"id": customer["id"]}
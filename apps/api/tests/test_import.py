@@ -0,0 +1,113 @@
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.src.zynor_api.main import app
+from apps.api.src.zynor_api.models.user import User
+from apps.api.src.zynor_api.security.auth import get_current_user
+
+
+def _report(resp):
+    assert resp.status_code == 200, resp.text
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+@pytest.mark.unit
+def test_import_customers_csv_upserts_on_email(client: TestClient):
+    """
+    POST /api/customers/import?format=csv:
+    - Inserts new rows and updates rows whose email already exists
+    - Reports invalid rows by line and keeps going, across chunks
+    """
+    tag = uuid.uuid4().hex[:8]
+    existing = client.post("/api/customers", json={"name": "Old Name", "email": f"old-{tag}@example.com"}).json()
+    body = "\n".join([
+        "name,email,phone,address",
+        f"New Name,OLD-{tag}@example.com,555 0100,",
+        f"Fresh One,fresh-{tag}@example.com,,1 Quay St",
+        f"Bad Email,not-an-email,,",
+        f",blank-{tag}@example.com,,",
+        f"No Email {tag},,555 0101,",
+    ]) + "\n"
+    assert client.post("/api/customers/import", content=body).status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: User(email="ops@example.com", role="admin")
+    report = _report(client.post("/api/customers/import", content=body.encode()))
+    assert [r["line"] for r in report[:-1]] == [4, 5]
+    assert "email" in report[0]["error"]
+    assert report[-1] == {"created": 2, "updated": 1, "failed": 2}
+
+    updated = client.get(f"/api/customers/{existing['id']}").json()
+    assert updated["name"] == "New Name" and updated["phone"] == "555 0100"
+    found = client.get("/api/customers", params={"q": f"fresh-{tag}"}).json()["items"]
+    assert [c["address"] for c in found] == ["1 Quay St"]
+
+
+@pytest.mark.unit
+def test_import_technicians_ndjson(client: TestClient):
+    """
+    POST /api/technicians/import?format=ndjson:
+    - Upserts on email, syncs skills and the active-count rollup
+    - Rejects bad JSON, schema errors and phones held by other technicians
+    - A later row with the same email supersedes an earlier one
+    """
+    tag = uuid.uuid4().hex[:8]
+    phone = f"+1555{int(tag, 16) % 10**7:07d}"
+    skill = f"import-{tag}"
+    existing = client.post("/api/technicians", json={
+        "first_name": "Ida", "last_name": "Port", "email": f"ida-{tag}@example.com", "phone": phone,
+    }).json()
+    rows = [
+        {"first_name": "Ida", "last_name": "Ported", "email": f"ida-{tag}@example.com", "skills": [skill]},
+        {"first_name": "Max", "last_name": "New", "email": f"max-{tag}@example.com", "skills": [skill]},
+        {"first_name": "Max", "last_name": "Newer", "email": f"max-{tag}@example.com", "skills": [skill]},
+        {"first_name": "Pat", "last_name": "Clash", "email": f"pat-{tag}@example.com", "phone": phone},
+        {"first_name": "", "last_name": "Empty", "email": f"e-{tag}@example.com"},
+    ]
+    body = "\n".join(json.dumps(r) for r in rows) + "\n{not json\n"
+    active_before = client.get("/api/technicians", params={"count": "estimated", "page_size": 1}).json()["total"]
+
+    app.dependency_overrides[get_current_user] = lambda: User(email="hr@example.com", role="admin")
+    report = _report(client.post("/api/technicians/import", params={"format": "ndjson"}, content=body))
+    errors = {r["line"]: r["error"] for r in report[:-1]}
+    assert set(errors) == {2, 4, 5, 6}
+    assert errors[2].startswith("Superseded by line 3")
+    assert errors[4] == "Phone already in use"
+    assert errors[6] == "Invalid JSON"
+    assert report[-1] == {"created": 1, "updated": 1, "failed": 4}
+
+    tech = client.get(f"/api/technicians/{existing['id']}").json()
+    assert tech["last_name"] == "Ported" and tech["phone"] == phone
+    skilled = client.get("/api/technicians", params={"skill": skill}).json()["items"]
+    assert sorted(t["last_name"] for t in skilled) == ["Newer", "Ported"]
+    active_after = client.get("/api/technicians", params={"count": "estimated", "page_size": 1}).json()["total"]
+    assert active_after == active_before + 1
+
+
+@pytest.mark.unit
+def test_import_reports_undecodable_and_malformed_rows(client: TestClient):
+    """
+    Bytes that aren't UTF-8, NUL characters and CSV parse errors fail
+    their own row; the rest is imported and the summary still arrives.
+    """
+    tag = uuid.uuid4().hex[:8]
+    body = b"\n".join([
+        b"name,email",
+        f"Good One,good-{tag}@example.com".encode(),
+        f"Bad \xff Bytes,bytes-{tag}@example.com".encode("latin-1"),
+        f"Nul\x00Name,nul-{tag}@example.com".encode(),
+        b'"' + b"x" * 200_000 + f'",huge-{tag}@example.com'.encode(),
+        f"Good Two,two-{tag}@example.com".encode(),
+    ]) + b"\n"
+
+    app.dependency_overrides[get_current_user] = lambda: User(email="ops@example.com", role="admin")
+    report = _report(client.post("/api/customers/import", content=body))
+    errors = {r["line"]: r["error"] for r in report[:-1]}
+    assert errors == {
+        3: "Not valid UTF-8",
+        4: "Contains a NUL character",
+        5: "Invalid CSV: field larger than field limit (131072)",
+    }
+    assert report[-1] == {"created": 2, "updated": 0, "failed": 3}
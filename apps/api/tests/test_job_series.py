@@ -0,0 +1,96 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.src.zynor_api.services.recurrence import last_occurrence, occurrences, parse_rule
+
+
+@pytest.mark.unit
+def test_windowed_expansion_matches_walking_the_series():
+    dtstart = datetime(2030, 1, 2, 9, 0, tzinfo=timezone.utc)  # a Wednesday
+    rule = parse_rule("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=200", dtstart)
+
+    walked, day = [], dtstart
+    while len(walked) < 200:
+        week = (day - (dtstart - timedelta(days=dtstart.weekday()))).days // 7
+        if week % 2 == 0 and day.weekday() in (0, 3):
+            walked.append(day)
+        day += timedelta(days=1)
+
+    start, end = datetime(2032, 3, 1, tzinfo=timezone.utc), datetime(2032, 6, 1, tzinfo=timezone.utc)
+    assert list(occurrences(rule, dtstart, start, end)) == [d for d in walked if start <= d < end]
+    assert list(occurrences(rule, dtstart, dtstart, walked[2] + timedelta(seconds=1))) == walked[:3]
+    assert last_occurrence(rule, dtstart) == walked[-1]
+
+    monthly = parse_rule("FREQ=MONTHLY;INTERVAL=3;UNTIL=20310101", dtstart)
+    assert [d.month for d in occurrences(monthly, dtstart, dtstart, end)] == [1, 4, 7, 10]
+
+
+@pytest.mark.unit
+def test_series_occurrences_expand_lazily_and_materialize(client: TestClient):
+    """
+    /api/job-series:
+    - Occurrences show up on the schedule without being stored
+    - Materializing one stores a job that replaces the generated occurrence
+    - Only real occurrences can be materialized, and only once
+    """
+    customer = client.post("/api/customers", json={"name": "Contract Customer"}).json()
+    tech = client.post("/api/technicians", json={
+        "first_name": "Weekly", "last_name": "Visitor", "email": f"weekly-{uuid.uuid4().hex}@example.com",
+    }).json()
+
+    bad = client.post("/api/job-series", json={
+        "title": "x", "customer_id": customer["id"], "rule": "FREQ=HOURLY",
+        "dtstart": "2040-01-02T09:00:00Z", "duration_minutes": 60,
+    })
+    assert bad.status_code == 422
+
+    resp = client.post("/api/job-series", json={
+        "title": "Boiler check",
+        "customer_id": customer["id"],
+        "technician_id": tech["id"],
+        "rule": "FREQ=WEEKLY;BYDAY=MO;COUNT=104",
+        "dtstart": "2040-01-02T09:00:00Z",
+        "duration_minutes": 60,
+    })
+    assert resp.status_code == 201
+    series = resp.json()
+    assert series["ends_at"].startswith("2041-12-23T09:00:00")
+
+    window = {"from": "2041-03-04T00:00:00Z", "to": "2041-03-11T00:00:00Z"}
+    lanes = client.get("/api/schedule", params=window).json()["lanes"]
+    lane = next(l for l in lanes if l["technician_id"] == tech["id"])
+    assert [(j["id"], j["series_id"], j["title"]) for j in lane["jobs"]] == [(None, series["id"], "Boiler check")]
+    occurrence_start = lane["jobs"][0]["occurrence_start"]
+
+    not_an_occurrence = client.post(f"/api/job-series/{series['id']}/occurrences", json={
+        "occurrence_start": "2041-03-05T09:00:00Z",
+    })
+    assert not_an_occurrence.status_code == 422
+
+    resp = client.post(f"/api/job-series/{series['id']}/occurrences", json={
+        "occurrence_start": occurrence_start,
+        "scheduled_start_at": "2041-03-04T13:00:00Z",
+        "scheduled_end_at": "2041-03-04T14:00:00Z",
+    })
+    assert resp.status_code == 201
+    job = resp.json()
+    assert job["series_id"] == series["id"] and job["technician_id"] == tech["id"]
+
+    again = client.post(f"/api/job-series/{series['id']}/occurrences", json={"occurrence_start": occurrence_start})
+    assert again.status_code == 409
+
+    lanes = client.get("/api/schedule", params=window).json()["lanes"]
+    lane = next(l for l in lanes if l["technician_id"] == tech["id"])
+    assert [j["id"] for j in lane["jobs"]] == [job["id"]]
+
+    occurrences_resp = client.get(f"/api/job-series/{series['id']}/occurrences", params={
+        "from": "2041-02-25T00:00:00Z", "to": "2041-03-18T00:00:00Z",
+    })
+    assert occurrences_resp.status_code == 200
+    assert [o["job_id"] for o in occurrences_resp.json()] == [None, job["id"], None]
+
+    assert client.delete(f"/api/job-series/{series['id']}").status_code == 204
+    assert client.get(f"/api/jobs/{job['id']}").json()["series_id"] is None
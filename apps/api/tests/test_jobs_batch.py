@@ -0,0 +1,53 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_batch_create_reports_per_item_results(client: TestClient):
+    """
+    POST /api/jobs:batch:
+    - Inserts the valid items
+    - Rejects unknown customers and technician double bookings inside the batch
+    - Rejects items overlapping an already stored job
+    """
+    customer = client.post("/api/customers", json={"name": "Batch Customer"}).json()
+    tech = client.post(
+        "/api/technicians",
+        json={"first_name": "Bat", "last_name": "Ch", "email": f"batch-{uuid.uuid4().hex}@example.com"},
+    ).json()
+
+    def job(title, start, end, **extra):
+        return {
+            "title": title,
+            "customer_id": customer["id"],
+            "technician_id": tech["id"],
+            "scheduled_start_at": f"2031-03-01T{start}:00Z",
+            "scheduled_end_at": f"2031-03-01T{end}:00Z",
+            **extra,
+        }
+
+    resp = client.post("/api/jobs:batch", json={"items": [job("existing", "08:00", "09:00")]})
+    assert resp.status_code == 200
+    assert resp.json()["created"] == 1
+
+    items = [
+        job("ok", "09:00", "10:00"),
+        job("overlaps batch", "09:30", "10:30"),
+        job("overlaps existing", "07:30", "08:30"),
+        job("bad customer", "12:00", "13:00", customer_id=999999999),
+        job("ok too", "10:00", "11:00"),
+    ]
+    resp = client.post("/api/jobs:batch", json={"items": items})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [r["ok"] for r in data["results"]] == [True, False, False, False, True]
+    assert data["created"] == 2
+    assert data["failed"] == 3
+
+    resp = client.post("/api/jobs:batch", params={"atomic": True}, json={"items": [
+        job("would fit", "14:00", "15:00"),
+        job("clashes", "14:30", "15:30"),
+    ]})
+    assert resp.json()["created"] == 0
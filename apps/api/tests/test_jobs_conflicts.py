@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_create_and_update_reject_double_booking(client: TestClient):
+    customer = client.post("/api/customers", json={"name": "Booking Customer"}).json()
+    tech = client.post(
+        "/api/technicians",
+        json={"first_name": "Dou", "last_name": "Ble", "email": f"booking-{uuid.uuid4().hex}@example.com"},
+    ).json()
+    base = {"customer_id": customer["id"], "technician_id": tech["id"]}
+
+    first = client.post("/api/jobs/", json={
+        **base, "title": "first",
+        "scheduled_start_at": "2032-05-01T09:00:00Z", "scheduled_end_at": "2032-05-01T11:00:00Z",
+    })
+    assert first.status_code == 201
+    second = client.post("/api/jobs/", json={
+        **base, "title": "second",
+        "scheduled_start_at": "2032-05-01T11:00:00Z", "scheduled_end_at": "2032-05-01T12:00:00Z",
+    })
+    assert second.status_code == 201
+
+    clash = client.post("/api/jobs/", json={
+        **base, "title": "clash",
+        "scheduled_start_at": "2032-05-01T10:30:00Z", "scheduled_end_at": "2032-05-01T11:30:00Z",
+    })
+    assert clash.status_code == 409
+
+    moved = client.patch(f"/api/jobs/{second.json()['id']}", json={"scheduled_start_at": "2032-05-01T10:00:00Z"})
+    assert moved.status_code == 409
+
+    conflicts = client.get(
+        f"/api/technicians/{tech['id']}/conflicts",
+        params={"start": "2032-05-01T10:59:00Z", "end": "2032-05-01T11:01:00Z"},
+    )
+    assert conflicts.status_code == 200
+    assert sorted(j["title"] for j in conflicts.json()) == ["first", "second"]
+
+    # Cancelling frees the slot.
+    client.patch(f"/api/jobs/{first.json()['id']}", json={"status": "CANCELLED"})
+    retry = client.post("/api/jobs/", json={
+        **base, "title": "retry",
+        "scheduled_start_at": "2032-05-01T09:30:00Z", "scheduled_end_at": "2032-05-01T10:30:00Z",
+    })
+    assert retry.status_code == 201
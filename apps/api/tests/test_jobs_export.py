@@ -0,0 +1,25 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_export_jobs_streams_ndjson_and_csv(client: TestClient):
+    customer = client.post("/api/customers", json={"name": "Export Customer"}).json()
+    for i in range(3):
+        client.post("/api/jobs/", json={"title": f"Export {i}", "customer_id": customer["id"]})
+
+    resp = client.get("/api/jobs/export", params={"customer_id": customer["id"]})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [line for line in resp.text.splitlines() if line]
+    assert [json.loads(line)["title"] for line in lines] == ["Export 0", "Export 1", "Export 2"]
+
+    resp = client.get("/api/jobs/export", params={"customer_id": customer["id"], "format": "csv"})
+    assert resp.status_code == 200
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0][:2] == ["id", "title"]
+    assert len(rows) == 4
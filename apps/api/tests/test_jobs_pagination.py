@@ -0,0 +1,60 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_list_jobs_keyset_pages_cover_all_rows_once(client: TestClient):
+    """
+    Jobs list is cursor-paginated:
+    - Filters by customer_id
+    - Walks next_cursor until exhausted
+    - Every job shows up exactly once, in (scheduled_start_at, id) order
+    """
+    customer = client.post("/api/customers", json={"name": "Paging Customer"}).json()
+    created = []
+    for i in range(5):
+        resp = client.post(
+            "/api/jobs/",
+            json={
+                "title": f"Job {i}",
+                "customer_id": customer["id"],
+                "scheduled_start_at": f"2030-01-0{5 - i}T09:00:00",
+            },
+        )
+        assert resp.status_code == 201
+        created.append(resp.json()["id"])
+
+    seen, cursor = [], None
+    while True:
+        params = {"customer_id": customer["id"], "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/jobs/", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["items"]) <= 2
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == list(reversed(created))
+
+
+@pytest.mark.unit
+def test_list_jobs_rejects_unknown_sort_and_bad_cursor(client: TestClient):
+    assert client.get("/api/jobs/", params={"sort": "title"}).status_code == 422
+    assert client.get("/api/jobs/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+@pytest.mark.unit
+def test_list_jobs_sparse_fieldset_keeps_cursor(client: TestClient):
+    customer = client.post("/api/customers", json={"name": "Sparse Customer"}).json()
+    for i in range(3):
+        client.post("/api/jobs/", json={"title": f"Sparse {i}", "customer_id": customer["id"]})
+
+    resp = client.get("/api/jobs/", params={"customer_id": customer["id"], "limit": 2, "fields": "title"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [set(item) for item in data["items"]] == [{"id", "title"}] * 2
+    assert data["next_cursor"]
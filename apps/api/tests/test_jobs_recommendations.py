@@ -0,0 +1,56 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_recommendations_rank_skill_match_first(client: TestClient):
+    """
+    POST /api/jobs/{id}/recommendations:
+    - Returns at most k technicians, best score first
+    - A technician holding every requested skill outranks one holding none
+    - Inactive technicians are never recommended
+    - Job writes move the open-job counts straight away
+    """
+    tag = uuid.uuid4().hex[:8]
+    skill = f"boiler-{tag}"
+
+    def tech(name, skills, is_active=True):
+        return client.post("/api/technicians", json={
+            "first_name": name,
+            "last_name": tag,
+            "email": f"{name.lower()}-{tag}@example.com",
+            "skills": skills,
+            "is_active": is_active,
+        }).json()
+
+    expert = tech("Expert", [skill, "hvac"])
+    tech("Novice", ["painting"])
+    retired = tech("Retired", [skill], is_active=False)
+
+    customer = client.post("/api/customers", json={"name": "Reco Customer"}).json()
+    job = client.post("/api/jobs/", json={"title": "Fix boiler", "customer_id": customer["id"]}).json()
+
+    resp = client.post(f"/api/jobs/{job['id']}/recommendations", json={"skills": [skill], "k": 3})
+    assert resp.status_code == 200
+    ranked = resp.json()
+    assert len(ranked) <= 3
+    assert ranked[0]["technician_id"] == expert["id"]
+    assert ranked[0]["skill_match"] == 1.0
+    assert retired["id"] not in {r["technician_id"] for r in ranked}
+    assert [r["score"] for r in ranked] == sorted((r["score"] for r in ranked), reverse=True)
+
+    def open_jobs():
+        ranked = client.post(f"/api/jobs/{job['id']}/recommendations", json={"skills": [skill], "k": 1}).json()
+        return ranked[0]["open_jobs"]
+
+    before = open_jobs()
+    assigned = client.post("/api/jobs/", json={
+        "title": "Second boiler", "customer_id": customer["id"], "technician_id": expert["id"],
+    }).json()
+    assert open_jobs() == before + 1
+    client.delete(f"/api/jobs/{assigned['id']}")
+    assert open_jobs() == before
+
+    assert client.post("/api/jobs/999999999/recommendations").status_code == 404
@@ -0,0 +1,48 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_bulk_transition_enforces_state_machine(client: TestClient):
+    """
+    POST /api/jobs:transition:
+    - Applies allowed transitions in one call
+    - Reports skipped ids (terminal status, unknown id) individually
+    - Reassigns by filter
+    """
+    customer = client.post("/api/customers", json={"name": "Transition Customer"}).json()
+    techs = [
+        client.post("/api/technicians", json={
+            "first_name": "Tr", "last_name": str(i), "email": f"transition-{i}-{uuid.uuid4().hex}@example.com",
+        }).json()
+        for i in range(2)
+    ]
+
+    def job(status):
+        return client.post("/api/jobs/", json={
+            "title": status, "status": status, "customer_id": customer["id"], "technician_id": techs[0]["id"],
+        }).json()["id"]
+
+    in_progress, done, new = job("IN_PROGRESS"), job("COMPLETED"), job("NEW")
+
+    resp = client.post("/api/jobs:transition", json={
+        "ids": [in_progress, done, 999999999], "status": "COMPLETED",
+    })
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["updated"] == 1
+    assert [r["ok"] for r in data["results"]] == [True, False, False]
+    assert data["results"][1]["error"] == "Already COMPLETED"
+    assert data["results"][2]["error"] == "Job not found"
+
+    resp = client.post("/api/jobs:transition", json={
+        "filter": {"technician_id": techs[0]["id"]}, "technician_id": techs[1]["id"],
+    })
+    assert resp.status_code == 200
+    assert {r["id"] for r in resp.json()["results"]} == {new}
+    assert client.get(f"/api/jobs/{new}").json()["technician_id"] == techs[1]["id"]
+
+    assert client.post("/api/jobs:transition", json={"ids": [new], "status": "BOGUS"}).status_code == 422
+    assert client.post("/api/jobs:transition", json={"status": "COMPLETED"}).status_code == 422
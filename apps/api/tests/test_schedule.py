@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_schedule_groups_jobs_into_technician_lanes(client: TestClient):
+    """
+    GET /api/schedule:
+    - One lane per technician, jobs ordered by start time
+    - Unassigned jobs in their own lane
+    - A job write inside the window is visible immediately (cache invalidated)
+    """
+    customer = client.post("/api/customers", json={"name": "Schedule Customer"}).json()
+    tech = client.post("/api/technicians", json={
+        "first_name": "Lane", "last_name": "Owner", "email": f"lane-{uuid.uuid4().hex}@example.com",
+    }).json()
+
+    def job(title, start, end, technician_id=None):
+        return client.post("/api/jobs/", json={
+            "title": title,
+            "customer_id": customer["id"],
+            "technician_id": technician_id,
+            "scheduled_start_at": f"2033-07-04T{start}:00Z",
+            "scheduled_end_at": f"2033-07-04T{end}:00Z",
+        }).json()
+
+    job("late", "14:00", "15:00", tech["id"])
+    job("early", "08:00", "09:00", tech["id"])
+    job("open", "10:00", "11:00")
+
+    window = {"from": "2033-07-04T00:00:00Z", "to": "2033-07-05T00:00:00Z"}
+    resp = client.get("/api/schedule", params=window)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [lane["technician_id"] for lane in data["lanes"]] == [tech["id"]]
+    assert [j["title"] for j in data["lanes"][0]["jobs"]] == ["early", "late"]
+    assert [j["title"] for j in data["unassigned"]] == ["open"]
+
+    job("added", "16:00", "17:00", tech["id"])
+    data = client.get("/api/schedule", params=window).json()
+    assert [j["title"] for j in data["lanes"][0]["jobs"]] == ["early", "late", "added"]
+
+    bad = client.get("/api/schedule", params={"from": "2033-07-04T00:00:00Z", "to": "2033-08-04T00:00:00Z"})
+    assert bad.status_code == 422
@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.tests.conftest import TestingSessionLocal
+from apps.api.src.zynor_api.services.stats_service import rebuild_rollups
+
+
+@pytest.mark.unit
+def test_stats_rollups_follow_writes_and_match_rebuild(client: TestClient):
+    """
+    GET /api/stats:
+    - Counters move with job/technician creates, updates and deletes
+    - The per-day breakdown is limited to a bounded day range
+    - A full rebuild from the base tables yields the same numbers
+    """
+    tech = client.post("/api/technicians", json={
+        "first_name": "Kpi", "last_name": "Tech", "email": f"kpi-{uuid.uuid4().hex}@example.com",
+    }).json()
+    customer = client.post("/api/customers", json={"name": "Kpi Customer"}).json()
+    job = client.post("/api/jobs/", json={
+        "title": "kpi", "customer_id": customer["id"], "technician_id": tech["id"],
+        "scheduled_start_at": "2034-02-10T10:00:00Z", "scheduled_end_at": "2034-02-10T11:00:00Z",
+    }).json()
+
+    stats = client.get("/api/stats", params={"day_from": "2034-02-10", "day_to": "2034-02-10"}).json()
+    assert stats["jobs_by_technician"][tech["id"]] == {"NEW": 1}
+    assert stats["jobs_by_day"] == {"2034-02-10": {"NEW": 1}}
+    assert "2034-02-10" not in client.get("/api/stats").json()["jobs_by_day"]
+    assert "2034-02-10" in client.get("/api/stats", params={"day_to": "2034-02-20"}).json()["jobs_by_day"]
+    too_wide = {"day_from": "2033-01-01", "day_to": "2034-02-10"}
+    assert client.get("/api/stats", params=too_wide).status_code == 422
+
+    client.patch(f"/api/jobs/{job['id']}", json={"status": "IN_PROGRESS"})
+    client.post("/api/jobs:transition", json={"ids": [job["id"]], "status": "COMPLETED"})
+    stats = client.get("/api/stats").json()
+    assert stats["jobs_by_technician"][tech["id"]] == {"COMPLETED": 1}
+
+    client.delete(f"/api/jobs/{job['id']}")
+    stats = client.get("/api/stats").json()
+    assert tech["id"] not in stats["jobs_by_technician"]
+
+    db = TestingSessionLocal()
+    try:
+        rebuild_rollups(db)
+    finally:
+        db.close()
+    assert client.get("/api/stats").json() == stats
@@ -0,0 +1,72 @@
+import random
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.src.zynor_api.services.routing_service import _Problem, distance_matrix, solve
+
+
+@pytest.mark.unit
+def test_solver_shortens_path_and_respects_windows():
+    rng = random.Random(7)
+    points = [(52.5 + rng.uniform(-0.1, 0.1), 13.4 + rng.uniform(-0.2, 0.2)) for _ in range(30)]
+    km = distance_matrix(points)
+    travel = [[d * 90 for d in row] for row in km]
+
+    # Everything open all day: pure shortest open path.
+    problem = _Problem(travel, [0.0] * 30, [float("inf")] * 30, 600.0)
+    order = solve(problem)
+    assert sorted(order) == list(range(30))
+    _, drive, _ = problem.simulate(order)
+    _, scheduled_drive, _ = problem.simulate(list(range(30)))
+    assert drive < scheduled_drive / 2
+
+    # Stop 29 must be served first, wherever it is; stop 0 not before 10:00.
+    opens = [0.0] * 30
+    closes = [float("inf")] * 30
+    opens[0] = 10 * 3600.0
+    closes[29] = 0.0
+    problem = _Problem(travel, opens, closes, 600.0)
+    order = solve(problem)
+    timeline, _, late = problem.simulate(order)
+    assert order[0] == 29 and late == 0
+    arrival, wait, _ = timeline[order.index(0)]
+    assert arrival + wait >= opens[0]
+
+
+@pytest.mark.unit
+def test_route_orders_a_technicians_day_by_distance(client: TestClient):
+    """
+    POST /api/technicians/{id}/route:
+    - Stops ordered along the road instead of by booking order
+    - Jobs whose customer has no coordinates are reported as unrouted
+    """
+    tech = client.post("/api/technicians", json={
+        "first_name": "Route", "last_name": "Runner", "email": f"route-{uuid.uuid4().hex}@example.com",
+    }).json()
+
+    job_ids = {}
+    for lon in (13.0, 13.3, 13.1, 13.2, None):
+        body = {"name": f"Stop {lon}"}
+        if lon is not None:
+            body.update(latitude=52.5, longitude=lon)
+        customer = client.post("/api/customers", json=body).json()
+        job = client.post("/api/jobs/", json={
+            "title": f"visit {lon}",
+            "customer_id": customer["id"],
+            "technician_id": tech["id"],
+            "scheduled_start_at": "2035-05-14T08:00:00Z",
+        }).json()
+        job_ids[lon] = job["id"]
+
+    resp = client.post(f"/api/technicians/{tech['id']}/route", params={"date": "2035-05-14"})
+    assert resp.status_code == 200
+    plan = resp.json()
+    assert [s["job_id"] for s in plan["stops"]] == [job_ids[13.0], job_ids[13.1], job_ids[13.2], job_ids[13.3]]
+    assert plan["unrouted_job_ids"] == [job_ids[None]]
+    assert plan["total_km"] < plan["scheduled_order_km"]
+    assert plan["late_stops"] == 0
+
+    missing = client.post(f"/api/technicians/{uuid.uuid4()}/route", params={"date": "2035-05-14"})
+    assert missing.status_code == 404
@@ -24,3 +24,17 @@ def test_list_technicians_returns_200_and_items_list(client: TestClient):
 
     # items should be a list (empty or not)
     assert isinstance(data["items"], list)
+
+
+@pytest.mark.unit
+def test_list_technicians_sparse_fieldset(client: TestClient):
+    """
+    fields= limits each item to the requested columns (plus id).
+    """
+    response = client.get("/api/technicians", params={"fields": "first_name,last_name"})
+    assert response.status_code == 200
+    for item in response.json()["items"]:
+        assert set(item) == {"id", "first_name", "last_name"}
+
+    response = client.get("/api/technicians", params={"fields": "first_name,created_by"})
+    assert response.status_code == 422
@@ -0,0 +1,87 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.src.zynor_api.main import app
+from apps.api.src.zynor_api.models.user import User
+from apps.api.src.zynor_api.security.auth import get_current_user
+
+
+@pytest.mark.unit
+def test_bulk_patch_reports_per_item_results(client: TestClient):
+    """
+    PATCH /api/technicians:
+    - Applies the valid items and keeps skills, ETags and rollups in step
+    - Reports unknown ids, repeated ids and email/phone collisions per item
+    - With atomic=true applies nothing unless every item is valid
+    """
+    tag = uuid.uuid4().hex[:8]
+
+    def tech(name):
+        return client.post("/api/technicians", json={
+            "first_name": name, "last_name": "Bulk", "email": f"{name.lower()}-{tag}@example.com",
+        }).json()
+
+    a, b, c, d = tech("Ann"), tech("Bob"), tech("Cal"), tech("Dee")
+    assert client.patch("/api/technicians", json={"items": [{"id": a["id"], "patch": {"first_name": "X"}}]}).status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: User(email="hr@example.com", role="admin")
+    phone = f"+1 555 {int(tag, 16) % 10000:04d}"
+    skill = f"solar-{tag}"
+    before = client.get(f"/api/technicians/{a['id']}").headers["ETag"]
+    resp = client.patch("/api/technicians", json={"items": [
+        {"id": a["id"], "patch": {"phone": phone, "is_active": False, "skills": [skill]}},
+        {"id": b["id"], "patch": {"email": c["email"]}},
+        {"id": str(uuid.uuid4()), "patch": {"first_name": "Ghost"}},
+        {"id": c["id"], "patch": {"first_name": "Cally"}},
+        {"id": a["id"], "patch": {"first_name": "Again"}},
+        {"id": d["id"], "patch": {"phone": phone}},
+    ]})
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["updated"] == 2 and body["failed"] == 4
+    assert [r["ok"] for r in body["results"]] == [True, False, False, True, False, False]
+    errors = [r["error"] for r in body["results"]]
+    assert errors[1] == "Email already in use"
+    assert errors[2] == "Technician not found"
+    assert errors[4].startswith("Technician also patched")
+    assert errors[5] == "Phone already in use"
+
+    after = client.get(f"/api/technicians/{a['id']}")
+    assert after.headers["ETag"] != before
+    assert after.json()["phone"] == phone and after.json()["is_active"] is False
+    assert client.get(f"/api/technicians/{c['id']}").json()["first_name"] == "Cally"
+    listed = client.get("/api/technicians", params={"skill": skill}).json()["items"]
+    assert [t["id"] for t in listed] == [a["id"]]
+
+    resp = client.patch("/api/technicians", params={"atomic": True}, json={"items": [
+        {"id": b["id"], "patch": {"first_name": "Bobby"}},
+        {"id": c["id"], "patch": {"email": a["email"]}},
+    ]})
+    assert resp.json()["updated"] == 0
+    assert client.get(f"/api/technicians/{b['id']}").json()["first_name"] == "Bob"
+
+
+@pytest.mark.unit
+def test_bulk_patch_rejects_nulls_for_required_fields(client: TestClient):
+    """Explicit nulls for first_name, last_name or email fail their item; the rest still applies."""
+    tag = uuid.uuid4().hex[:8]
+    a, b = (
+        client.post("/api/technicians", json={
+            "first_name": name, "last_name": "Null", "email": f"{name.lower()}-{tag}@example.com",
+            "phone": f"+1 555 {int(tag, 16) % 10000:04d}{n}",
+        }).json()
+        for n, name in enumerate(("Nia", "Ned"))
+    )
+    app.dependency_overrides[get_current_user] = lambda: User(email="hr@example.com", role="admin")
+    resp = client.patch("/api/technicians", json={"items": [
+        {"id": a["id"], "patch": {"first_name": None, "email": None}},
+        {"id": b["id"], "patch": {"last_name": "Nulled", "phone": None}},
+    ]})
+    assert resp.status_code == 200, resp.text
+    results = resp.json()["results"]
+    assert results[0] == {"index": 0, "id": a["id"], "ok": False, "error": "Cannot be null: email, first_name"}
+    assert results[1]["ok"]
+    updated = client.get(f"/api/technicians/{b['id']}").json()
+    assert updated["last_name"] == "Nulled" and updated["phone"] is None
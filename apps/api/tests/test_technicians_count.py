@@ -0,0 +1,51 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _create(client: TestClient, last_name: str, **extra):
+    resp = client.post("/api/technicians", json={
+        "first_name": "Count", "last_name": last_name,
+        "email": f"count-{uuid.uuid4().hex}@example.com", **extra,
+    })
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+@pytest.mark.unit
+def test_list_technicians_count_modes(client: TestClient):
+    """
+    GET /api/technicians?count=exact|estimated|none:
+    - exact totals come with the page, including past the last page
+    - none skips the total but still reports has_more
+    - estimated totals for a filter set are reused until they expire
+    """
+    tag = f"Cnt{uuid.uuid4().hex[:8]}"
+    for _ in range(3):
+        _create(client, tag)
+
+    def page(**params):
+        resp = client.get("/api/technicians", params={"last_name": tag, "page_size": 2, **params})
+        assert resp.status_code == 200, resp.text
+        return resp.json()
+
+    first = page()
+    assert first["total"] == 3 and len(first["items"]) == 2 and first["has_more"] is True
+    assert page(page=2)["has_more"] is False
+    beyond = page(page=5)
+    assert beyond["items"] == [] and beyond["total"] == 3
+    sparse = page(fields="id,last_name")
+    assert sparse["total"] == 3 and set(sparse["items"][0]) == {"id", "last_name"}
+
+    none = page(count="none")
+    assert none["total"] is None and none["has_more"] is True and len(none["items"]) == 2
+
+    assert page(count="estimated")["total"] == 3
+    _create(client, tag)
+    assert page(count="estimated")["total"] == 3
+    assert page()["total"] == 4
+
+    everyone = client.get("/api/technicians", params={"page_size": 1}).json()["total"]
+    assert client.get("/api/technicians", params={"count": "estimated"}).json()["total"] == everyone
+    assert client.get("/api/technicians", params={"count": "approx"}).status_code == 422
@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_list_technicians_facets_follow_filters(client: TestClient):
+    """
+    GET /api/technicians?facets=skills,is_active,hourly_rate:
+    - Counts cover the filtered rows, not just the page
+    - hourly_rate is stored and backs min_rate / max_rate
+    - Unknown facets are rejected
+    """
+    tag = f"Fct{uuid.uuid4().hex[:8]}"
+    rows = [
+        (["Plumbing", "Gas"], True, 30),
+        (["plumbing"], True, 80),
+        (["Gas"], False, 30),
+        ([], True, None),
+    ]
+    for skills, active, rate in rows:
+        resp = client.post("/api/technicians", json={
+            "first_name": "Facet", "last_name": tag, "email": f"facet-{uuid.uuid4().hex}@example.com",
+            "skills": skills, "is_active": active, "hourly_rate": rate,
+        })
+        assert resp.status_code == 201, resp.text
+        assert resp.json()["hourly_rate"] == rate
+
+    resp = client.get("/api/technicians", params={
+        "last_name": tag, "page_size": 1, "facets": "skills,is_active,hourly_rate",
+    })
+    assert resp.status_code == 200, resp.text
+    facets = resp.json()["facets"]
+    assert facets["skills"] == [{"value": "gas", "count": 2, "min": None, "max": None},
+                                {"value": "plumbing", "count": 2, "min": None, "max": None}]
+    assert {f["value"]: f["count"] for f in facets["is_active"]} == {"true": 3, "false": 1}
+    assert [(f["value"], f["count"], f["min"], f["max"]) for f in facets["hourly_rate"]] == [
+        ("25-50", 2, 25, 50), ("75-100", 1, 75, 100), ("unset", 1, None, None),
+    ]
+
+    narrowed = client.get("/api/technicians", params={
+        "last_name": tag, "min_rate": 25, "max_rate": 49.99, "facets": "is_active",
+    }).json()
+    assert narrowed["total"] == 2
+    assert narrowed["facets"]["skills"] is None
+    assert {f["value"]: f["count"] for f in narrowed["facets"]["is_active"]} == {"true": 1, "false": 1}
+
+    assert client.get("/api/technicians", params={"facets": "color"}).status_code == 422
@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_nearest_technicians_by_location_and_skill(client: TestClient):
+    """
+    GET /api/technicians/nearest:
+    - Closest active technicians first, with distances
+    - Inactive and unlocated technicians are skipped; `skill` filters
+    - Moving a technician is picked up on the next query
+    """
+    def tech(name, lat, lon, skills=None, is_active=True):
+        body = {
+            "first_name": name, "last_name": "Nearby", "email": f"near-{uuid.uuid4().hex}@example.com",
+            "skills": skills, "is_active": is_active,
+        }
+        if lat is not None:
+            body.update(latitude=lat, longitude=lon)
+        resp = client.post("/api/technicians", json=body)
+        assert resp.status_code == 201
+        return resp.json()
+
+    origin = {"lat": -45.0, "lon": 170.0}
+    far = tech("Far", -45.2, 170.0, ["gas"])
+    near = tech("Near", -45.01, 170.0)
+    tech("Idle", -45.001, 170.0, is_active=False)
+    tech("Nowhere", None, None)
+    mid = tech("Mid", -45.0, 170.1, ["Gas"])
+
+    resp = client.get("/api/technicians/nearest", params={**origin, "k": 2})
+    assert resp.status_code == 200
+    hits = resp.json()
+    assert [h["technician_id"] for h in hits] == [near["id"], mid["id"]]
+    assert 1.0 < hits[0]["distance_km"] < 1.2
+
+    hits = client.get("/api/technicians/nearest", params={**origin, "k": 5, "skill": "gas"}).json()
+    assert [h["technician_id"] for h in hits] == [mid["id"], far["id"]]
+
+    moved = client.put(f"/api/technicians/{far['id']}", json={
+        "first_name": "Far", "last_name": "Nearby", "skills": ["gas"], "is_active": True,
+        "latitude": -45.0, "longitude": 170.001,
+    })
+    assert moved.status_code == 200
+    hits = client.get("/api/technicians/nearest", params={**origin, "k": 1}).json()
+    assert hits[0]["technician_id"] == far["id"]
+
+    assert client.get("/api/technicians/nearest", params={"lat": 91, "lon": 0}).status_code == 422
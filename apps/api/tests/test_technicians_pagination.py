@@ -0,0 +1,73 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _walk(client: TestClient, params: dict):
+    """Follow next_cursor to the end, then prev_cursor back to the start."""
+    pages, cursor = [], None
+    while True:
+        resp = client.get("/api/technicians", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        pages.append([t["id"] for t in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            assert body["has_more"] is False
+            break
+    back, cursor = [pages[-1]], body["prev_cursor"]
+    while cursor:
+        body = client.get("/api/technicians", params={**params, "cursor": cursor}).json()
+        back.append([t["id"] for t in body["items"]])
+        cursor = body["prev_cursor"]
+    return pages, back[::-1]
+
+
+@pytest.mark.unit
+def test_list_technicians_keyset_pages(client: TestClient):
+    """
+    GET /api/technicians?sort=...&cursor=...:
+    - next_cursor walks every row once, in order, ties broken by id
+    - prev_cursor walks back through the same pages
+    - NULL sort values come last ascending, first descending
+    - Unknown sorts and foreign cursors are rejected
+    """
+    tag = f"Key{uuid.uuid4().hex[:8]}"
+    rates = [40, None, 25, 40, None, 90, 25]
+    techs = []
+    for i, rate in enumerate(rates):
+        techs.append(client.post("/api/technicians", json={
+            "first_name": f"Tech{i // 2}", "last_name": tag, "hourly_rate": rate,
+            "email": f"key-{uuid.uuid4().hex}@example.com",
+        }).json())
+
+    pages, back = _walk(client, {"last_name": tag, "page_size": 3})
+    assert [len(p) for p in pages] == [3, 3, 1]
+    assert back == pages
+    by_name = sorted(techs, key=lambda t: (t["first_name"], t["last_name"], t["id"]))
+    assert sum(pages, []) == [t["id"] for t in by_name]
+
+    pages, back = _walk(client, {"last_name": tag, "page_size": 2, "sort": "-hourly_rate", "count": "none"})
+    assert back == pages
+    rows = {t["id"]: t["hourly_rate"] for t in techs}
+    seen = [rows[i] for i in sum(pages, [])]
+    assert seen == [None, None, 90, 40, 40, 25, 25]
+    pages, _ = _walk(client, {"last_name": tag, "page_size": 4, "sort": "hourly_rate"})
+    assert [rows[i] for i in sum(pages, [])] == [25, 25, 40, 40, 90, None, None]
+
+    first = client.get("/api/technicians", params={"last_name": tag, "page_size": 3}).json()
+    assert first["total"] == 7 and first["prev_cursor"] is None
+    resumed = client.get("/api/technicians", params={"last_name": tag, "page_size": 3, "cursor": first["next_cursor"]}).json()
+    assert resumed["total"] == 7
+    # Cursor pages reuse the first page's count instead of rescanning.
+    client.post("/api/technicians", json={
+        "first_name": "Late", "last_name": tag, "email": f"key-{uuid.uuid4().hex}@example.com",
+    })
+    resumed = client.get("/api/technicians", params={"last_name": tag, "page_size": 3, "cursor": first["next_cursor"]}).json()
+    assert resumed["total"] == 7
+    assert client.get("/api/technicians", params={"last_name": tag, "page_size": 3}).json()["total"] == 8
+
+    assert client.get("/api/technicians", params={"sort": "skills"}).status_code == 422
+    assert client.get("/api/technicians", params={"sort": "email", "cursor": first["next_cursor"]}).status_code == 400
+    assert client.get("/api/technicians", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.src.zynor_api.services.search_service import search_terms
+
+
+@pytest.mark.unit
+def test_search_terms_keep_emails_and_drop_punctuation():
+    assert search_terms('  Jo "Smi* a.b@x.io ') == ["jo", "smi", "a.b@x.io"]
+    assert search_terms('"*()') == []
+
+
+@pytest.mark.unit
+def test_list_technicians_q_matches_word_prefixes(client: TestClient):
+    """
+    GET /api/technicians?q=:
+    - Every term must match the start of a word in name, email or phone
+    - Renames are re-indexed; deleted technicians drop out
+    """
+    tag = uuid.uuid4().hex[:8]
+
+    def tech(first, last):
+        return client.post("/api/technicians", json={
+            "first_name": first, "last_name": last, "email": f"{first.lower()}.{tag}@example.com",
+        }).json()
+
+    zelda = tech("Zelda", f"Quarry{tag}")
+    tech("Zed", f"Quarry{tag}")
+    tech("Amos", f"Other{tag}")
+
+    def search(q):
+        resp = client.get("/api/technicians", params={"q": q, "page_size": 50})
+        assert resp.status_code == 200
+        return {t["first_name"] for t in resp.json()["items"]}
+
+    assert search(f"quarry{tag}") == {"Zelda", "Zed"}
+    assert search(f"zel quarry{tag[:4]}") == {"Zelda"}
+    assert search(tag) == {"Zelda", "Zed", "Amos"}  # via the email
+    assert search(f"nobody{tag}") == set()
+
+    client.put(f"/api/technicians/{zelda['id']}", json={
+        "first_name": "Yara", "last_name": f"Quarry{tag}", "email": zelda["email"], "is_active": True,
+    })
+    assert search(f"quarry{tag}") == {"Yara", "Zed"}
+    assert search(f"yar quarry{tag}") == {"Yara"}
+
+    client.delete(f"/api/technicians/{zelda['id']}")
+    assert search(f"quarry{tag}") == {"Zed"}
@@ -0,0 +1,48 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.unit
+def test_list_technicians_filters_on_normalized_skills(client: TestClient):
+    """
+    GET /api/technicians?skill=...&match=all|any:
+    - Exact, case-insensitive skill matches (no substrings)
+    - match=all needs every skill, match=any at least one
+    - Updates keep the skill index in sync
+    """
+    tag = uuid.uuid4().hex[:8]
+    hvac, elec = f"HVAC-{tag}", f"electrical-{tag}"
+
+    def tech(name, skills):
+        return client.post("/api/technicians", json={
+            "first_name": name, "last_name": "Skilled", "email": f"skill-{uuid.uuid4().hex}@example.com",
+            "skills": skills,
+        }).json()
+
+    both = tech("Both", [hvac, f" {elec} "])
+    air = tech("Air", [hvac])
+    tech("Spark", [elec.upper()])
+
+    def names(*skills, match=None):
+        params = [("skill", s) for s in skills] + [("page_size", 50)]
+        if match:
+            params.append(("match", match))
+        resp = client.get("/api/technicians", params=params)
+        assert resp.status_code == 200
+        return {t["first_name"] for t in resp.json()["items"]}
+
+    assert names(hvac.lower()) == {"Both", "Air"}
+    assert names(f"hvac-{tag[:4]}") == set()
+    assert names(hvac, elec) == {"Both"}
+    assert names(hvac, elec, match="any") == {"Both", "Air", "Spark"}
+
+    client.put(f"/api/technicians/{air['id']}", json={
+        "first_name": "Air", "last_name": "Skilled", "skills": [elec, hvac], "is_active": True,
+    })
+    assert names(hvac, elec) == {"Both", "Air"}
+
+    client.delete(f"/api/technicians/{both['id']}")
+    assert names(hvac, elec) == {"Air"}
+    assert client.get("/api/technicians", params={"skill": hvac, "match": "most"}).status_code == 422